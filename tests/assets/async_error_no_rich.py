@@ -0,0 +1,22 @@
+import asyncio
+
+import typer
+import typer.main
+
+typer.main.HAS_RICH = False
+
+
+app = typer.Typer()
+
+
+async def fail(name: str):
+    print(name + 3)
+
+
+@app.command()
+async def main(name: str = "morty"):
+    await asyncio.wait_for(fail(name), timeout=10)
+
+
+if __name__ == "__main__":
+    app()
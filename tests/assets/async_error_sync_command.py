@@ -0,0 +1,27 @@
+import asyncio
+
+import typer
+import typer.main
+
+typer.main.HAS_RICH = False
+
+
+app = typer.Typer()
+
+
+async def fail(name: str):
+    print(name + 3)
+
+
+@app.command()
+async def hello():
+    pass  # pragma: no cover
+
+
+@app.command()
+def main(name: str = "morty"):
+    asyncio.run(fail(name))
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,13 @@
+import typer
+
+app = typer.Typer(output_buffering=True)
+
+
+@app.command()
+def main(count: int):
+    for index in range(count):
+        typer.echo(f"line {index}")
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,49 @@
+import os
+import sys
+import time
+from pathlib import Path
+
+import typer
+
+app = typer.Typer(pretty_exceptions_enable=False)
+
+
+@app.command()
+def hello(name: str, code: int = 0):
+    print(f"Hello {name} from {Path.cwd().name}{os.getenv('GREETING_END', '')}")
+    if code:
+        raise typer.Exit(code)
+
+
+@app.command()
+def fail():
+    raise ValueError("Something went wrong")
+
+
+@app.command()
+def slow(log_path: Path):
+    with log_path.open("a") as f:
+        f.write(f"start {time.monotonic()}\n")
+    time.sleep(0.5)
+    with log_path.open("a") as f:
+        f.write(f"end {time.monotonic()}\n")
+
+
+@app.command()
+def crash(log_path: Path):
+    with log_path.open("a") as f:
+        f.write("run\n")
+    # Die without sending an exit code to the client
+    os._exit(9)
+
+
+if __name__ == "__main__":
+    socket_path = os.getenv("TEST_SERVER_SOCKET")
+    if socket_path:
+        served = app.serve(
+            socket_path,
+            max_concurrency=int(os.getenv("TEST_SERVER_MAX_CONCURRENCY", "16")),
+            idle_timeout=float(os.getenv("TEST_SERVER_IDLE_TIMEOUT", "10")),
+        )
+        sys.exit(0 if served else 3)
+    app()
@@ -0,0 +1,21 @@
+import typer
+
+app = typer.Typer()
+
+
+def complete_name():
+    return ["Camila", "Carlos"]
+
+
+@app.command()
+def create(name: str = typer.Option(autocompletion=complete_name)):
+    """Create a user."""
+
+
+@app.command()
+def delete():
+    """Delete a user."""
+
+
+if __name__ == "__main__":
+    app()
@@ -0,0 +1,50 @@
+from enum import Enum
+from pathlib import Path
+from typing import Literal
+
+import typer
+
+app = typer.Typer()
+users_app = typer.Typer()
+app.add_typer(users_app, name="users")
+
+
+class Role(str, Enum):
+    admin = "admin"
+    guest = "guest"
+
+
+def complete_name():
+    return ["Camila", "Carlos"]
+
+
+@users_app.command()
+def create(
+    name: str = typer.Option(autocompletion=complete_name),
+    role: Role = Role.guest,
+    force: bool = False,
+):
+    """Create a user."""
+
+
+@users_app.command()
+def delete(username: str, config: Path = typer.Option(None, dir_okay=False)):
+    """Delete a user."""
+
+
+@app.command()
+def backup(
+    target: Path = typer.Argument(file_okay=False),
+    level: Literal["low", "high"] = typer.Argument("low"),
+    files: list[Path] = typer.Argument(None),
+):
+    """Back up the data."""
+
+
+@app.command(hidden=True)
+def secret(verbose: bool = False):
+    """Not listed."""
+
+
+if __name__ == "__main__":
+    app()
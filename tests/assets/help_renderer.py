@@ -0,0 +1,16 @@
+import sys
+
+import typer
+
+app = typer.Typer()
+
+
+@app.command()
+def main(name: str = typer.Option("World", help="The [bold]name[/bold] to greet")):
+    pass  # pragma: no cover
+
+
+if __name__ == "__main__":
+    app(sys.argv[1:], standalone_mode=False)
+    for module in sys.modules:
+        print(module)
@@ -0,0 +1,10 @@
+import typer
+
+app = typer.Typer()
+app.add_typer("tests.assets.lazy.users:app", name="users", help="Manage users.")
+app.command(short_help="Train the model.")("tests.assets.lazy.train:train_model")
+
+
+@app.command()
+def version():
+    print("1.0.0")
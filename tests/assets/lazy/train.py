@@ -0,0 +1,3 @@
+def train_model(epochs: int = 1):
+    """Train the model."""
+    print(f"Training for {epochs} epochs")
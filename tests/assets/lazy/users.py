@@ -0,0 +1,15 @@
+import typer
+
+app = typer.Typer()
+
+
+@app.command()
+def create(name: str):
+    """Create a user."""
+    print(f"Creating user: {name}")
+
+
+@app.command()
+def delete(name: str):
+    """Delete a user."""
+    print(f"Deleting user: {name}")
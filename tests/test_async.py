@@ -0,0 +1,221 @@
+import asyncio
+import io
+import os
+import subprocess
+import sys
+from contextlib import redirect_stderr
+from pathlib import Path
+
+import pytest
+import typer
+import typer.main
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+class Pool:
+    # Bound to the event loop it was created in, like a real connection pool
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+
+    async def fetch(self, value: str) -> str:
+        assert asyncio.get_running_loop() is self.loop
+        await asyncio.sleep(0)
+        return value.upper()
+
+
+def create_app(**kwargs) -> tuple[typer.Typer, list[asyncio.AbstractEventLoop]]:
+    app = typer.Typer(**kwargs)
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def check_value(ctx: typer.Context, value: str) -> str:
+        loops.append(asyncio.get_running_loop())
+        return value.strip()
+
+    async def complete_name(incomplete: str) -> list[str]:
+        await asyncio.sleep(0)
+        return [name for name in ["Camila", "Carlos"] if name.startswith(incomplete)]
+
+    async def process_result(result: str, verbose: bool) -> None:
+        loops.append(asyncio.get_running_loop())
+        print(f"Result: {result}")
+
+    @app.callback(result_callback=process_result)
+    async def main(ctx: typer.Context, verbose: bool = False):
+        ctx.obj = Pool()
+        loops.append(asyncio.get_running_loop())
+
+    @app.command()
+    async def hello(
+        ctx: typer.Context,
+        name: str = typer.Option(callback=check_value, autocompletion=complete_name),
+    ) -> str:
+        loops.append(asyncio.get_running_loop())
+        greeting = await ctx.obj.fetch(f"Hello {name}")
+        print(greeting)
+        return greeting
+
+    @app.command()
+    def sync():
+        print("Sync")
+
+    return app, loops
+
+
+def test_single_event_loop():
+    app, loops = create_app()
+    result = runner.invoke(app, ["hello", "--name", " Camila "])
+    assert result.exit_code == 0, result.output
+    assert result.output == "HELLO CAMILA\nResult: HELLO CAMILA\n"
+    # Group callback, parameter callback, command and result callback
+    assert len(loops) == 4
+    assert all(loop is loops[0] for loop in loops)
+    assert loops[0].is_closed()
+
+
+def test_new_event_loop_per_invocation():
+    app, loops = create_app()
+    assert app.run_batch(["hello --name Camila", "hello --name Rick"]) == [0, 0]
+    assert len(loops) == 8
+    assert loops[0] is not loops[4]
+
+
+def test_sync_command_in_async_group():
+    app, loops = create_app()
+    result = runner.invoke(app, ["sync"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Sync\nResult: None\n"
+
+
+def test_loop_factory():
+    created: list[asyncio.AbstractEventLoop] = []
+
+    def loop_factory() -> asyncio.AbstractEventLoop:
+        loop = asyncio.new_event_loop()
+        created.append(loop)
+        return loop
+
+    app, loops = create_app(loop_factory=loop_factory)
+    result = runner.invoke(app, ["hello", "--name", "Camila"])
+    assert result.exit_code == 0, result.output
+    assert len(created) == 1
+    assert all(loop is created[0] for loop in loops)
+
+
+def test_single_async_command():
+    app = typer.Typer()
+
+    @app.command()
+    async def main(name: str):
+        await asyncio.sleep(0)
+        print(f"Hello {name}")
+
+    result = runner.invoke(app, ["Camila"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Hello Camila\n"
+
+
+def test_pending_tasks_are_cancelled():
+    app = typer.Typer()
+    cancelled = []
+
+    async def wait_forever():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    @app.command()
+    async def main():
+        asyncio.get_running_loop().create_task(wait_forever())
+        await asyncio.sleep(0)
+
+    result = runner.invoke(app)
+    assert result.exit_code == 0, result.output
+    assert cancelled == [True]
+
+
+def test_async_exception():
+    app = typer.Typer()
+
+    @app.command()
+    async def main():
+        raise ValueError("Something went wrong")
+
+    result = runner.invoke(app)
+    assert result.exit_code == 1
+    assert isinstance(result.exception, ValueError)
+
+
+def test_async_completion():
+    app, _ = create_app()
+    result = runner.invoke(
+        app,
+        prog_name="prog",
+        env={
+            "_PROG_COMPLETE": "complete_zsh",
+            "_TYPER_COMPLETE_ARGS": "prog hello --name Ca",
+        },
+    )
+    assert result.output == '_arguments \'*: :(("Camila"\n"Carlos"))\'\n'
+
+
+def test_async_traceback():
+    file_path = Path(__file__).parent / "assets/async_error_no_rich.py"
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", str(file_path)],
+        capture_output=True,
+        encoding="utf-8",
+        env={
+            **os.environ,
+            "TYPER_STANDARD_TRACEBACK": "",
+            "_TYPER_STANDARD_TRACEBACK": "",
+        },
+    )
+    assert "run_until_complete" not in result.stderr
+    # The asyncio frames called from the user code are kept
+    assert "in wait_for" in result.stderr
+    assert "await asyncio.wait_for(fail(name), timeout=10)" in result.stderr
+    assert "print(name + 3)" in result.stderr
+    assert 'TypeError: can only concatenate str (not "int") to str' in result.stderr
+
+
+def test_async_traceback_event_loop_of_user():
+    # An event loop run by the user code keeps all its frames
+    file_path = Path(__file__).parent / "assets/async_error_sync_command.py"
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", str(file_path), "main"],
+        capture_output=True,
+        encoding="utf-8",
+        env={
+            **os.environ,
+            "TYPER_STANDARD_TRACEBACK": "",
+            "_TYPER_STANDARD_TRACEBACK": "",
+        },
+    )
+    assert "asyncio.run(fail(name))" in result.stderr
+    assert "run_until_complete" in result.stderr
+    assert "print(name + 3)" in result.stderr
+    assert 'TypeError: can only concatenate str (not "int") to str' in result.stderr
+
+
+def test_async_traceback_restored(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("TYPER_STANDARD_TRACEBACK", raising=False)
+    monkeypatch.delenv("_TYPER_STANDARD_TRACEBACK", raising=False)
+    app = typer.Typer()
+
+    @app.command()
+    async def main():
+        raise ValueError("Something went wrong")
+
+    with pytest.raises(ValueError) as exc_info:
+        app([], standalone_mode=False)
+    exc = exc_info.value
+    tb = exc.__traceback__
+    stderr = io.StringIO()
+    with redirect_stderr(stderr):
+        typer.main.except_hook(type(exc), exc, tb)
+    assert "run_until_complete" not in stderr.getvalue()
+    assert exc.__traceback__ is tb
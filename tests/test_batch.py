@@ -0,0 +1,187 @@
+from pathlib import Path
+
+import pytest
+import typer
+import typer.main
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def create_app(**kwargs) -> typer.Typer:
+    app = typer.Typer(**kwargs)
+
+    @app.callback()
+    def main(ctx: typer.Context, verbose: bool = False):
+        # Each command line gets a new context
+        assert ctx.obj is None
+        ctx.obj = {"verbose": verbose}
+
+    @app.command()
+    def hello(ctx: typer.Context, name: str, code: int = 0):
+        prefix = "Verbose: " if ctx.obj["verbose"] else ""
+        print(f"{prefix}Hello {name}")
+        if code:
+            raise typer.Exit(code)
+
+    @app.command()
+    def fail():
+        raise ValueError("Something went wrong")
+
+    @app.command()
+    def interrupt():
+        raise KeyboardInterrupt()
+
+    return app
+
+
+def test_run_batch(capsys: pytest.CaptureFixture[str]):
+    app = create_app()
+    exit_codes = app.run_batch(
+        [
+            "hello Camila",
+            "# A comment",
+            "",
+            "--verbose hello 'Rick Sanchez'",
+            ["hello", "Morty Smith"],
+            "hello Summer --code 3",
+            "hello",
+            "hello Beth",
+        ],
+        prog_name="prog",
+    )
+    assert exit_codes == [0, 0, 0, 3, 2, 0]
+    captured = capsys.readouterr()
+    assert captured.out.splitlines() == [
+        "Hello Camila",
+        "Verbose: Hello Rick Sanchez",
+        "Hello Morty Smith",
+        "Hello Summer",
+        "Hello Beth",
+    ]
+    assert "Usage: prog hello [OPTIONS]" in captured.err
+    assert "Missing argument" in captured.err
+
+
+def test_run_batch_stop_on_error(capsys: pytest.CaptureFixture[str]):
+    app = create_app()
+    exit_codes = app.run_batch(
+        ["hello Camila", "hello Rick --code 4", "hello Morty"], stop_on_error=True
+    )
+    assert exit_codes == [0, 4]
+    assert capsys.readouterr().out.splitlines() == ["Hello Camila", "Hello Rick"]
+
+
+def test_run_batch_interrupted(capsys: pytest.CaptureFixture[str]):
+    app = create_app()
+    exit_codes = app.run_batch(["hello Camila", "interrupt", "hello Rick"])
+    assert exit_codes == [0, 130]
+    assert capsys.readouterr().out.splitlines() == ["Hello Camila"]
+
+
+def test_run_batch_exception(capsys: pytest.CaptureFixture[str]):
+    app = create_app(pretty_exceptions_enable=False)
+    exit_codes = app.run_batch(["fail", "hello Camila"])
+    assert exit_codes == [1, 0]
+    captured = capsys.readouterr()
+    assert "ValueError: Something went wrong" in captured.err
+    assert captured.out == "Hello Camila\n"
+
+
+def test_run_batch_invalid_line(capsys: pytest.CaptureFixture[str]):
+    app = create_app()
+    exit_codes = app.run_batch(["hello 'Camila", "hello Rick"])
+    assert exit_codes == [2, 0]
+    assert "Error: Invalid command line: No closing quotation" in (
+        capsys.readouterr().err
+    )
+
+
+def test_run_batch_exit_message(capsys: pytest.CaptureFixture[str]):
+    app = typer.Typer()
+
+    @app.command()
+    def main(name: str):
+        if name == "exit":
+            raise SystemExit("Exiting")
+        raise SystemExit()
+
+    assert app.run_batch(["exit", "other"]) == [1, 0]
+    assert capsys.readouterr().err == "Exiting\n"
+
+
+def test_run_batch_builds_command_once(monkeypatch: pytest.MonkeyPatch):
+    app = create_app()
+    get_command = typer.main.get_command
+    calls = []
+
+    def counting_get_command(typer_instance: typer.Typer):
+        calls.append(typer_instance)
+        return get_command(typer_instance)
+
+    monkeypatch.setattr(typer.main, "get_command", counting_get_command)
+    assert app.run_batch(["hello Camila"] * 50) == [0] * 50
+    assert len(calls) == 1
+
+
+def test_batch_option_not_added_by_default():
+    result = runner.invoke(create_app(), ["--help"])
+    assert "--batch" not in result.output
+
+
+def test_batch_option_stdin():
+    app = create_app(add_batch_option=True)
+    result = runner.invoke(
+        app, ["--batch", "-"], input="hello Camila\nhello Rick --code 3\nhello Morty\n"
+    )
+    assert result.exit_code == 3
+    assert result.stdout.splitlines() == ["Hello Camila", "Hello Rick", "Hello Morty"]
+    assert "Line 2 failed with exit code 3" in result.stderr
+
+
+def test_batch_option_file(tmp_path: Path):
+    app = create_app(add_batch_option=True)
+    batch_path = tmp_path / "batch.txt"
+    batch_path.write_text("hello Camila\n\nhello Rick --code 3\nhello Morty\n")
+    result = runner.invoke(app, ["--batch", str(batch_path), "--batch-stop-on-error"])
+    assert result.exit_code == 3
+    assert result.stdout.splitlines() == ["Hello Camila", "Hello Rick"]
+    assert "Line 3 failed with exit code 3" in result.stderr
+
+
+def test_batch_option_interrupted():
+    app = create_app(add_batch_option=True)
+    result = runner.invoke(
+        app, ["--batch", "-"], input="hello Camila --code 3\ninterrupt\nhello Rick\n"
+    )
+    assert result.exit_code == 130
+    assert result.stdout.splitlines() == ["Hello Camila"]
+    assert "Line 2 failed with exit code 130" in result.stderr
+
+
+def test_batch_option_success(tmp_path: Path):
+    app = create_app(add_batch_option=True)
+    batch_path = tmp_path / "batch.txt"
+    batch_path.write_text("hello Camila\nhello Rick\n")
+    result = runner.invoke(app, ["--batch", str(batch_path)])
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["Hello Camila", "Hello Rick"]
+
+
+def test_batch_option_single_command():
+    app = typer.Typer(add_batch_option=True)
+
+    @app.command()
+    def main(name: str):
+        print(f"Hello {name}")
+
+    result = runner.invoke(app, ["--batch", "-"], input="Camila\nRick\n")
+    assert result.exit_code == 0
+    assert result.stdout.splitlines() == ["Hello Camila", "Hello Rick"]
+
+
+def test_batch_option_help():
+    result = runner.invoke(create_app(add_batch_option=True), ["--help"])
+    assert "--batch" in result.output
+    assert "FILE|-" in result.output
+    assert "--batch-stop-on-error" in result.output
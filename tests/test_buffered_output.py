@@ -0,0 +1,172 @@
+import io
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from tests.assets import buffered_output as mod
+
+runner = CliRunner()
+
+
+class CountingStream(io.StringIO):
+    def __init__(self) -> None:
+        super().__init__()
+        self.writes = 0
+        self.flushes = 0
+
+    def write(self, s: str) -> int:
+        self.writes += 1
+        return super().write(s)
+
+    def flush(self) -> None:
+        self.flushes += 1
+        super().flush()
+
+
+def test_batches_writes():
+    stream = CountingStream()
+    with typer.buffered_output():
+        for index in range(100):
+            typer.echo(f"line {index}", file=stream)
+        assert stream.getvalue() == ""
+    assert stream.getvalue() == "".join(f"line {index}\n" for index in range(100))
+    assert stream.writes == 1
+    assert stream.flushes == 1
+
+
+def test_max_size():
+    stream = CountingStream()
+    with typer.buffered_output(max_size=10):
+        for _ in range(4):
+            typer.echo("12345", file=stream)
+    assert stream.getvalue() == "12345\n" * 4
+    assert stream.writes == 2
+
+
+def test_max_delay():
+    stream = CountingStream()
+    with typer.buffered_output(max_delay=0):
+        typer.echo("first", file=stream)
+        assert stream.getvalue() == "first\n"
+
+
+def test_max_delay_without_more_writes():
+    stream = CountingStream()
+    with typer.buffered_output(max_delay=0.05):
+        typer.echo("first", file=stream)
+        # Written by the timer, while the block is still waiting
+        for _ in range(100):
+            if stream.getvalue():
+                break
+            time.sleep(0.05)
+        assert stream.getvalue() == "first\n"
+        assert stream.writes == 1
+    assert stream.writes == 1
+
+
+def test_single_thread_for_the_delay():
+    out = CountingStream()
+    err = CountingStream()
+    threads = threading.active_count()
+    with typer.buffered_output(max_delay=10):
+        for index in range(100):
+            typer.echo(f"out {index}", file=out)
+            typer.echo(f"err {index}", file=err)
+            typer.flush_buffered_output()
+        assert threading.active_count() == threads + 1
+    assert threading.active_count() == threads
+    assert out.writes == 100
+    assert err.writes == 100
+
+
+def test_error_in_delayed_write():
+    class BrokenStream(io.StringIO):
+        def write(self, s: str) -> int:
+            raise BrokenPipeError()
+
+    stream = BrokenStream()
+    with pytest.raises(BrokenPipeError):
+        with typer.buffered_output(max_delay=0.01):
+            typer.echo("first", file=stream)
+            time.sleep(0.1)
+            # Raised here, not in the thread that writes after the delay
+            typer.echo("second", file=stream)
+
+
+def test_flush_buffered_output():
+    stream = CountingStream()
+    with typer.buffered_output():
+        typer.echo("first", file=stream)
+        typer.flush_buffered_output()
+        assert stream.getvalue() == "first\n"
+        with typer.buffered_output():
+            typer.echo("second", file=stream)
+        # Flushed only by the outer block
+        assert stream.getvalue() == "first\n"
+        # An empty echo without a new line flushes
+        typer.echo("", nl=False, file=stream)
+        assert stream.getvalue() == "first\nsecond\n"
+    typer.flush_buffered_output()
+
+
+def test_strips_ansi():
+    stream = CountingStream()
+    with typer.buffered_output():
+        typer.secho("red", fg="red", file=stream)
+        typer.secho("kept", fg="red", file=stream, color=True)
+    assert stream.getvalue() == "red\n\x1b[31mkept\x1b[0m\n"
+
+
+def test_app_order_and_prompt():
+    app = typer.Typer(output_buffering=True)
+
+    @app.command()
+    def main():
+        typer.echo("out 1")
+        typer.echo("err 1", err=True)
+        typer.echo("out 2")
+        name = typer.prompt("Name")
+        typer.echo(f"Hello {name}")
+
+    result = runner.invoke(app, input="Camila\n")
+    assert result.exit_code == 0, result.output
+    assert result.output == "out 1\nerr 1\nout 2\nName: Camila\nHello Camila\n"
+
+
+def test_app_abort():
+    app = typer.Typer(output_buffering=True)
+
+    @app.command()
+    def main():
+        typer.echo("Started")
+        raise typer.Abort()
+
+    result = runner.invoke(app)
+    assert result.exit_code == 1
+    assert result.output.startswith("Started\n")
+    assert "Aborted" in result.output
+
+
+def test_app_output():
+    result = runner.invoke(mod.app, ["1000"])
+    assert result.exit_code == 0
+    assert result.output == "".join(f"line {index}\n" for index in range(1000))
+
+
+def test_broken_pipe():
+    process = subprocess.Popen(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "1000000"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+    )
+    assert process.stdout is not None
+    assert process.stdout.readline() == b"line 0\n"
+    process.stdout.close()
+    _, stderr = process.communicate()
+    assert process.returncode == 1
+    assert b"Traceback" not in stderr
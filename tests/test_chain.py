@@ -0,0 +1,242 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+import typer
+import typer.main
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def create_app(events: list[str], **kwargs) -> typer.Typer:
+    app = typer.Typer(chain=True, **kwargs)
+
+    @app.command()
+    def read(path: typer.FileText):
+        def read_lines():
+            for line in path:
+                events.append(f"read {line.strip()}")
+                yield line.strip()
+
+        return read_lines()
+
+    @app.command()
+    def upper():
+        def processor(stream: Iterator[str]):
+            for item in stream:
+                yield item.upper()
+
+        return processor
+
+    @app.command()
+    def write(path: Path):
+        def processor(stream: Iterator[str]):
+            with path.open("w") as f:
+                for item in stream:
+                    events.append(f"write {item}")
+                    f.write(f"{item}\n")
+                    yield item
+
+        return processor
+
+    @app.command()
+    def log():
+        events.append("log")
+
+    return app
+
+
+def test_pipeline_streams_items(tmp_path: Path):
+    events: list[str] = []
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("a\nb\nc\n")
+    output_path = tmp_path / "output.txt"
+    result = runner.invoke(
+        create_app(events),
+        ["read", str(input_path), "upper", "log", "write", str(output_path)],
+    )
+    assert result.exit_code == 0, result.output
+    # Each item goes through the whole pipeline before the next one is read
+    assert events == [
+        "log",
+        "read a",
+        "write A",
+        "read b",
+        "write B",
+        "read c",
+        "write C",
+    ]
+    assert output_path.read_text() == "A\nB\nC\n"
+
+
+def test_result_callback_receives_stream(tmp_path: Path):
+    events: list[str] = []
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("a\nb\n")
+    received = []
+
+    def process_result(stream: Iterator[str], verbose: bool):
+        received.append(stream)
+        for item in stream:
+            print(f"Item: {item}{'!' if verbose else ''}")
+
+    app = create_app(events, result_callback=process_result)
+
+    @app.callback()
+    def main(verbose: bool = False):
+        pass
+
+    result = runner.invoke(
+        app, ["--verbose", "read", str(input_path), "read", str(input_path), "upper"]
+    )
+    assert result.exit_code == 0, result.output
+    assert result.output == "Item: A!\nItem: B!\nItem: A!\nItem: B!\n"
+    assert isinstance(received[0], Iterator)
+
+
+def test_sink_stage(tmp_path: Path):
+    events: list[str] = []
+    input_path = tmp_path / "input.txt"
+    input_path.write_text("a\nb\n")
+    app = create_app(events, result_callback=show_results)
+
+    @app.command()
+    def show():
+        def processor(stream: Iterator[str]):
+            for item in stream:
+                print(f"Item: {item}")
+
+        return processor
+
+    result = runner.invoke(app, ["read", str(input_path), "show"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Item: a\nItem: b\n[]\n"
+
+
+def show_results(results: Iterator):
+    print(list(results))
+
+
+def test_plain_return_values():
+    app = typer.Typer(chain=True, result_callback=show_results)
+
+    @app.command()
+    def one():
+        return 1
+
+    @app.command()
+    def many():
+        return [2, 3]
+
+    @app.command()
+    def nothing():
+        pass
+
+    @app.command()
+    def text():
+        return "four"
+
+    result = runner.invoke(app, ["one", "nothing", "many", "text", "one"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "[1, 2, 3, 'four', 1]\n"
+
+
+def test_usage_error_before_running(tmp_path: Path):
+    events: list[str] = []
+    result = runner.invoke(create_app(events), ["log", "write"])
+    assert result.exit_code == 2
+    assert "Missing argument" in result.output
+    assert events == []
+
+
+def test_invoke_without_command():
+    app = typer.Typer(chain=True, result_callback=show_results)
+
+    @app.callback(invoke_without_command=True)
+    def main():
+        print("Main")
+
+    @app.command()
+    def one():
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Main\n[]\n"
+
+
+def test_help_usage():
+    result = runner.invoke(create_app([]), ["--help"])
+    assert "COMMAND1 [ARGS]... [COMMAND2 [ARGS]...]..." in result.output
+
+
+def test_nested_group_not_allowed():
+    app = typer.Typer(chain=True)
+    sub_app = typer.Typer()
+
+    @app.command()
+    def one():
+        pass  # pragma: no cover
+
+    @sub_app.command()
+    def two():
+        pass  # pragma: no cover
+
+    @sub_app.command()
+    def three():
+        pass  # pragma: no cover
+
+    app.add_typer(sub_app, name="sub")
+    with pytest.raises(RuntimeError, match="chain mode"):
+        typer.main.get_command(app)
+
+
+def test_lazy_group_not_allowed():
+    app = typer.Typer(chain=True)
+
+    @app.command()
+    def one():
+        pass  # pragma: no cover
+
+    app.add_typer("tests.assets.lazy.users:app", name="users")
+    with pytest.raises(RuntimeError, match="chain mode"):
+        typer.main.get_command(app)
+
+
+def test_optional_argument_not_allowed():
+    app = typer.Typer(chain=True)
+
+    @app.callback()
+    def main(name: str = typer.Argument("World")):
+        pass  # pragma: no cover
+
+    @app.command()
+    def one():
+        pass  # pragma: no cover
+
+    with pytest.raises(RuntimeError, match="optional arguments"):
+        typer.main.get_command(app)
+
+
+def test_completion_of_next_command():
+    result = runner.invoke(
+        create_app([]),
+        prog_name="prog",
+        env={
+            "_PROG_COMPLETE": "complete_bash",
+            "COMP_WORDS": "prog upper lo",
+            "COMP_CWORD": "2",
+        },
+    )
+    assert result.output == "log\n"
+    result = runner.invoke(
+        create_app([]),
+        prog_name="prog",
+        env={
+            "_PROG_COMPLETE": "complete_bash",
+            "COMP_WORDS": "prog read file.txt ",
+            "COMP_CWORD": "3",
+        },
+    )
+    assert result.output.split() == ["upper", "write", "log"]
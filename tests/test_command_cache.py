@@ -0,0 +1,71 @@
+import pytest
+import typer
+import typer.main
+
+
+def test_command_tree_reused_between_calls(monkeypatch: pytest.MonkeyPatch):
+    app = typer.Typer()
+    calls = []
+
+    @app.command()
+    def hello(name: str):
+        calls.append(name)
+
+    @app.command()
+    def bye():
+        pass  # pragma: no cover
+
+    built = []
+    original_get_command = typer.main.get_command
+
+    def counting_get_command(typer_instance: typer.Typer):
+        built.append(typer_instance)
+        return original_get_command(typer_instance)
+
+    monkeypatch.setattr(typer.main, "get_command", counting_get_command)
+
+    app(["hello", "Camila"], standalone_mode=False)
+    app(["hello", "Rick"], standalone_mode=False)
+    assert calls == ["Camila", "Rick"]
+    assert len(built) == 1
+
+
+def test_command_tree_invalidated_on_registration():
+    app = typer.Typer()
+    sub_app = typer.Typer()
+    app.add_typer(sub_app, name="sub")
+
+    @app.command()
+    def first():
+        pass  # pragma: no cover
+
+    command = app._get_command()
+    assert app._get_command() is command
+
+    @sub_app.command()
+    def second():
+        return "second"
+
+    new_command = app._get_command()
+    assert new_command is not command
+    assert app(["sub", "second"], standalone_mode=False) == "second"
+
+    @app.callback()
+    def main():
+        pass  # pragma: no cover
+
+    assert app._get_command() is not new_command
+
+
+def test_repeated_invocations_do_not_share_values():
+    app = typer.Typer()
+
+    @app.command()
+    def main(name: str = "World", formal: bool = False):
+        return name, formal
+
+    assert app(["--name", "Camila", "--formal"], standalone_mode=False) == (
+        "Camila",
+        True,
+    )
+    assert app([], standalone_mode=False) == ("World", False)
@@ -0,0 +1,230 @@
+import time
+from pathlib import Path
+
+import pytest
+import typer
+from typer import _completion_cache
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def app_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    return tmp_path
+
+
+def create_app(calls: list[str], ttl: float | None = 60) -> typer.Typer:
+    app = typer.Typer()
+
+    def complete_job(incomplete: str):
+        calls.append(incomplete)
+        for job, help in [("job-1", "First"), ("job-12", "Second"), ("task", None)]:
+            if job.startswith(incomplete):
+                yield (job, help) if help else job
+
+    @app.command()
+    def stop(
+        job: str = typer.Option(
+            autocompletion=complete_job, autocompletion_cache_ttl=ttl
+        ),
+        other: str = typer.Option(
+            "", autocompletion=complete_job, autocompletion_cache_ttl=ttl
+        ),
+    ):
+        pass  # pragma: no cover
+
+    def complete_all_jobs():
+        calls.append("all")
+        return ["job-1", "job-12", "task"]
+
+    @app.command()
+    def start(
+        job: str = typer.Option(
+            autocompletion=complete_all_jobs, autocompletion_cache_ttl=ttl
+        ),
+    ):
+        pass  # pragma: no cover
+
+    return app
+
+
+def complete(app: typer.Typer, args: str, prog_name: str = "prog") -> str:
+    result = runner.invoke(
+        app,
+        env={
+            f"_{prog_name.upper()}_COMPLETE": "complete_zsh",
+            "_TYPER_COMPLETE_ARGS": f"{prog_name} {args}",
+        },
+        prog_name=prog_name,
+    )
+    return result.output
+
+
+def test_cached_completions():
+    calls: list[str] = []
+    app = create_app(calls)
+    output = complete(app, "stop --job job")
+    assert '"job-1":"First"' in output
+    assert '"job-12":"Second"' in output
+    assert calls == ["job"]
+    output = complete(app, "stop --job job")
+    assert '"job-12":"Second"' in output
+    assert calls == ["job"]
+    # The function receives the incomplete value, it could return other values
+    # for a longer one, e.g. matched in a different way
+    output = complete(app, "stop --job job-12")
+    assert '"job-1":"First"' not in output
+    assert '"job-12":"Second"' in output
+    assert calls == ["job", "job-12"]
+    # Other parameters have their own cache
+    complete(app, "stop --other job")
+    assert calls == ["job", "job-12", "job"]
+
+
+def test_cached_for_any_prefix():
+    calls: list[str] = []
+    app = create_app(calls)
+    output = complete(app, "start --job ")
+    assert '"task"' in output
+    assert calls == ["all"]
+    # The function doesn't receive the incomplete value, the same values are
+    # filtered by it
+    output = complete(app, "start --job job-1")
+    assert '"job-1"' in output
+    assert '"job-12"' in output
+    assert '"task"' not in output
+    assert calls == ["all"]
+
+
+def test_cache_by_program(app_dir: Path):
+    calls: list[str] = []
+    app = create_app(calls)
+    complete(app, "stop --job job", prog_name="prog")
+    complete(app, "stop --job job", prog_name="other")
+    assert calls == ["job", "job"]
+    assert _completion_cache.get_cache_path("prog").exists()
+    assert _completion_cache.get_cache_path("other").exists()
+
+
+def test_expired(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+    app = create_app(calls, ttl=10)
+    complete(app, "stop --job job")
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + 20)
+    output = complete(app, "stop --job job")
+    assert '"job-12":"Second"' in output
+    assert calls == ["job", "job"]
+
+
+def test_not_enabled():
+    calls: list[str] = []
+    app = create_app(calls, ttl=None)
+    complete(app, "stop --job job")
+    complete(app, "stop --job job")
+    assert calls == ["job", "job"]
+    assert not _completion_cache.get_cache_path("prog").exists()
+
+
+def test_max_entries(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_completion_cache, "MAX_ENTRIES", 2)
+    calls: list[str] = []
+    app = create_app(calls)
+    complete(app, "stop --job a")
+    complete(app, "stop --job b")
+    complete(app, "stop --job c")
+    complete(app, "stop --job c")
+    complete(app, "stop --job b")
+    complete(app, "stop --job a")
+    assert calls == ["a", "b", "c", "a"]
+
+
+def test_invalid_cache_file(app_dir: Path):
+    path = _completion_cache.get_cache_path("prog")
+    path.parent.mkdir(parents=True)
+    path.write_text("[]")
+    calls: list[str] = []
+    app = create_app(calls)
+    complete(app, "stop --job job")
+    complete(app, "stop --job job")
+    assert calls == ["job"]
+
+
+def test_unwritable_cache():
+    # A file where the app directory should be
+    _completion_cache.get_cache_path("prog").parent.parent.mkdir(parents=True)
+    _completion_cache.get_cache_path("prog").parent.write_text("")
+    calls: list[str] = []
+    app = create_app(calls)
+    output = complete(app, "stop --job job")
+    complete(app, "stop --job job")
+    assert '"job-12":"Second"' in output
+    assert calls == ["job", "job"]
+
+
+def create_regions_app(calls: list[str]) -> typer.Typer:
+    app = typer.Typer()
+
+    def complete_zone(ctx: typer.Context, incomplete: str):
+        region = ctx.params.get("region") or "eu"
+        calls.append(f"{region}:{incomplete}")
+        return [
+            zone
+            for zone in [f"{region}-North", f"{region}-South"]
+            if zone.startswith(incomplete)
+        ]
+
+    @app.command()
+    def deploy(
+        region: str = typer.Option("eu"),
+        zone: str = typer.Option(
+            autocompletion=complete_zone, autocompletion_cache_ttl=60
+        ),
+    ):
+        pass  # pragma: no cover
+
+    return app
+
+
+def test_cached_completions_unfiltered():
+    settings = {
+        "prog_name": "prog",
+        "command_path": "prog deploy",
+        "param_name": "zone",
+        "inputs": {},
+    }
+    _completion_cache.save_completions(
+        **settings,
+        incomplete="EU",
+        ttl=60,
+        completions=[("eu-North", None), ("eu-South", "South")],
+    )
+    # The same as the function returned, e.g. matched ignoring case
+    assert _completion_cache.get_cached_completions(
+        **settings, incomplete="EU", ttl=60
+    ) == [("eu-North", None), ("eu-South", "South")]
+    # Not reused for a longer one
+    assert (
+        _completion_cache.get_cached_completions(**settings, incomplete="EUx", ttl=60)
+        is None
+    )
+    assert (
+        _completion_cache.get_cached_completions(
+            **settings | {"inputs": {"region": "us"}}, incomplete="EU", ttl=60
+        )
+        is None
+    )
+
+
+def test_cache_depends_on_other_params():
+    calls: list[str] = []
+    app = create_regions_app(calls)
+    output = complete(app, "deploy --region eu --zone ")
+    assert "eu-North" in output
+    output = complete(app, "deploy --region us --zone ")
+    assert "us-North" in output
+    assert "eu-North" not in output
+    complete(app, "deploy --region us --zone ")
+    assert calls == ["eu:", "us:"]
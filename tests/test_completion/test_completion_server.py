@@ -0,0 +1,163 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import typer._server_client
+from typer._completion_shared import get_completion_script
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="The completion server uses Unix sockets"
+)
+
+repo_root = Path(__file__).parent.parent.parent
+client_path = typer._server_client.__file__
+
+
+@pytest.fixture
+def prog(tmp_path: Path) -> Path:
+    # A module of the app, to modify it in tests
+    (tmp_path / "prog_settings.py").write_text("")
+    prog_path = tmp_path / "prog"
+    prog_path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.path[:0] = [{str(repo_root)!r}, {str(tmp_path)!r}]\n"
+        "import prog_settings\n"
+        "from tests.assets.completion_server import app\n"
+        "app()\n"
+    )
+    prog_path.chmod(0o755)
+    return prog_path
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    socket_dir = tmp_path / "run"
+    socket_dir.mkdir(mode=0o700)
+    return socket_dir / "prog.sock"
+
+
+@pytest.fixture
+def env(socket_path: Path) -> dict[str, str]:
+    return {
+        **os.environ,
+        "PYTHONPATH": str(repo_root),
+        "_TYPER_COMPLETE_SOCKET": str(socket_path),
+        "TYPER_COMPLETION_SERVER_IDLE_TIMEOUT": "10",
+    }
+
+
+def wait_for(condition, timeout: float = 30):
+    start = time.monotonic()
+    while not condition():
+        if time.monotonic() - start > timeout:  # pragma: no cover
+            raise TimeoutError()
+        time.sleep(0.05)
+
+
+@pytest.fixture
+def server(prog: Path, socket_path: Path, env: dict[str, str]):
+    process = subprocess.Popen(
+        [sys.executable, "-m", "coverage", "run", str(prog)],
+        env={**env, "_PROG_COMPLETE": "serve"},
+    )
+    wait_for(socket_path.exists)
+    yield process
+    process.terminate()
+    process.wait()
+
+
+def complete(prog: Path, env: dict[str, str], words: str, cword: int):
+    return subprocess.run(
+        [sys.executable, "-S", "-E", client_path, "_PROG_COMPLETE", str(prog)],
+        capture_output=True,
+        encoding="utf-8",
+        env={
+            **env,
+            "_PROG_COMPLETE": "complete_bash",
+            "COMP_WORDS": words,
+            "COMP_CWORD": str(cword),
+        },
+    )
+
+
+def test_complete_with_server(server, prog: Path, env: dict[str, str]):
+    result = complete(prog, env, "prog ", 1)
+    assert result.returncode == 0
+    assert result.stdout == "create\ndelete\n"
+    result = complete(prog, env, "prog create --name C", 3)
+    assert result.returncode == 0
+    assert result.stdout == "Camila\nCarlos\n"
+    assert server.poll() is None
+
+
+def test_complete_fish_exit_code(server, prog: Path, env: dict[str, str]):
+    command = [sys.executable, "-S", "-E", client_path, "_PROG_COMPLETE", str(prog)]
+    fish_env = {
+        **env,
+        "_PROG_COMPLETE": "complete_fish",
+        "_TYPER_COMPLETE_FISH_ACTION": "is-args",
+    }
+    result = subprocess.run(
+        command, env={**fish_env, "_TYPER_COMPLETE_ARGS": "prog de"}
+    )
+    assert result.returncode == 0
+    result = subprocess.run(
+        command, env={**fish_env, "_TYPER_COMPLETE_ARGS": "prog zz"}
+    )
+    assert result.returncode == 1
+
+
+def test_complete_without_server_starts_it(
+    prog: Path, socket_path: Path, env: dict[str, str]
+):
+    env["TYPER_COMPLETION_SERVER_IDLE_TIMEOUT"] = "5"
+    result = complete(prog, env, "prog ", 1)
+    assert result.returncode == 0
+    assert result.stdout == "create\ndelete\n"
+    wait_for(socket_path.exists)
+    result = complete(prog, env, "prog d", 1)
+    assert result.stdout == "delete\n"
+    # Shuts down after the idle timeout
+    wait_for(lambda: not socket_path.exists())
+
+
+def test_source_changed(server, prog: Path, env: dict[str, str]):
+    (prog.parent / "prog_settings.py").write_text("# Changed\n")
+    result = complete(prog, env, "prog ", 1)
+    assert result.returncode == 0
+    assert result.stdout == "create\ndelete\n"
+    server.wait(timeout=30)
+
+
+def test_stale_socket_file(prog: Path, socket_path: Path, env: dict[str, str]):
+    socket_path.write_text("")
+    env["TYPER_COMPLETION_SERVER_IDLE_TIMEOUT"] = "1"
+    result = complete(prog, env, "prog ", 1)
+    assert result.returncode == 0
+    assert result.stdout == "create\ndelete\n"
+
+
+def test_not_private_socket_dir(prog: Path, socket_path: Path, env: dict[str, str]):
+    socket_path.parent.chmod(0o755)
+    process = subprocess.run(
+        [sys.executable, str(prog)], env={**env, "_PROG_COMPLETE": "serve"}
+    )
+    assert process.returncode == 0
+    assert not socket_path.exists()
+
+
+def test_completion_script(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TYPER_COMPLETION_SERVER", "1")
+    for shell in ("bash", "zsh", "fish"):
+        script = get_completion_script(
+            prog_name="prog", complete_var="_PROG_COMPLETE", shell=shell
+        )
+        assert f"-S -E {client_path} _PROG_COMPLETE" in script
+    script = get_completion_script(
+        prog_name="prog", complete_var="_PROG_COMPLETE", shell="powershell"
+    )
+    assert client_path not in script
@@ -0,0 +1,217 @@
+import os
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+from typing import Literal
+
+import pytest
+import typer
+import typer.main
+from typer._completion_shared import get_completion_script
+
+from tests.assets import completion_static as mod
+
+repo_root = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def static_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TYPER_COMPLETION_STATIC", "1")
+
+
+def get_script(shell: str, app: typer.Typer = mod.app) -> str:
+    return get_completion_script(
+        prog_name="prog",
+        complete_var="_PROG_COMPLETE",
+        shell=shell,
+        cli=typer.main.get_command(app),
+    )
+
+
+@pytest.fixture
+def bin_dir(tmp_path: Path) -> Path:
+    prog_path = tmp_path / "prog"
+    prog_path.write_text(
+        f"#!{sys.executable}\n"
+        "import sys\n"
+        f"sys.path.insert(0, {str(repo_root)!r})\n"
+        "from tests.assets.completion_static import app\n"
+        "app()\n"
+    )
+    prog_path.chmod(0o755)
+    return tmp_path
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32" or shutil.which("bash") is None, reason="Requires bash"
+)
+@pytest.mark.parametrize(
+    ("words", "expected"),
+    [
+        (["prog", ""], ["backup", "users"]),
+        (["prog", "--"], ["--install-completion", "--show-completion", "--help"]),
+        (["prog", "users", ""], ["create", "delete"]),
+        (["prog", "users", "c"], ["create"]),
+        (
+            ["prog", "users", "create", "--"],
+            ["--name", "--role", "--force", "--no-force", "--help"],
+        ),
+        (["prog", "users", "create", "--role", ""], ["admin", "guest"]),
+        (["prog", "users", "create", "--force", "--role", "a"], ["admin"]),
+        (
+            ["prog", "users", "create", "--role", "admin", "--n"],
+            ["--name", "--no-force"],
+        ),
+        (["prog", "users", "create", "--name", ""], ["Camila", "Carlos"]),
+        (["prog", "users", "delete", "--config", ""], []),
+        (["prog", "users", "delete", "camila", "--config", "x", ""], []),
+        (["prog", "backup", "target", "h"], ["high"]),
+        (["prog", "backup", "target", "high", "fi"], []),
+        (["prog", "secret", "--v"], ["--verbose"]),
+    ],
+)
+def test_bash(words: list[str], expected: list[str], static_env, bin_dir, tmp_path):
+    script_path = tmp_path / "completion.sh"
+    script_path.write_text(get_script("bash"))
+    result = subprocess.run(
+        [
+            "bash",
+            "-c",
+            f'source {script_path}; COMP_WORDS=("$@"); COMP_CWORD=$(($# - 1)); '
+            '_prog_completion prog; printf "%s\\n" "${COMPREPLY[@]}"',
+            "_",
+            *words,
+        ],
+        capture_output=True,
+        encoding="utf-8",
+        env={**os.environ, "PATH": f"{bin_dir}{os.pathsep}{os.environ['PATH']}"},
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.split() == expected
+
+
+@pytest.mark.skipif(
+    sys.platform == "win32" or shutil.which("bash") is None, reason="Requires bash"
+)
+def test_bash_dirs(static_env, tmp_path: Path):
+    (tmp_path / "data").mkdir()
+    (tmp_path / "data.txt").write_text("")
+    script_path = tmp_path / "completion.sh"
+    script_path.write_text(get_script("bash"))
+    result = subprocess.run(
+        [
+            "bash",
+            "-c",
+            f"source {script_path}; COMP_WORDS=(prog backup da); COMP_CWORD=2; "
+            '_prog_completion prog; printf "%s\\n" "${COMPREPLY[@]}"',
+        ],
+        capture_output=True,
+        encoding="utf-8",
+        cwd=tmp_path,
+    )
+    assert result.stdout.split() == ["data"]
+
+
+def test_spec(static_env):
+    script = get_script("zsh")
+    assert "compdef _prog_completion prog" in script
+    assert "'users create|values|--role') REPLY='choices admin guest' ;;" in script
+    assert "'users create|values|--name') REPLY=dynamic ;;" in script
+    assert "'users delete|values|--config') REPLY=file ;;" in script
+    assert "'backup|argument|0') REPLY=dir ;;" in script
+    assert "'backup|argument|'*) REPLY=file ;;" in script
+    # Hidden commands are completed but not listed
+    assert "'|command|secret') REPLY=1 ;;" in script
+    assert "'|commands|') REPLY='backup users' ;;" in script
+    assert (
+        'eval $(env _TYPER_COMPLETE_ARGS="${words[1,$CURRENT]}" '
+        "_PROG_COMPLETE=complete_zsh prog)" in script
+    )
+
+
+def test_fish(static_env):
+    script = get_script("fish")
+    assert "        case 'users create|values|--role'\n" in script
+    assert "            echo 'choices admin guest'\n" in script
+    assert "        case 'backup|argument|*'\n" in script
+    assert 'complete --command prog --no-files --arguments "(_prog_completion)"' in (
+        script
+    )
+
+
+@pytest.mark.parametrize("shell", ["powershell", "pwsh"])
+def test_powershell(shell: str, static_env):
+    script = get_script(shell)
+    assert "    $spec['users create|values|--role'] = 'choices admin guest'\n" in script
+    assert "    $spec['backup|argument|'] = 'file'\n" in script
+    assert "Register-ArgumentCompleter -Native -CommandName prog" in script
+
+
+def test_static_with_server(static_env, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TYPER_COMPLETION_SERVER", "1")
+    script = get_script("bash")
+    assert "'|commands|') REPLY='backup users' ;;" in script
+    assert "_server_client.py _PROG_COMPLETE $1 ) )" in script
+
+
+def test_not_enabled():
+    script = get_script("bash")
+    assert "_prog_completion_spec" not in script
+    assert "_PROG_COMPLETE=complete_bash $1" in script
+
+
+def test_unsupported_names_use_dynamic_script(static_env):
+    app = typer.Typer()
+
+    @app.command("two words")
+    def first():
+        pass  # pragma: no cover
+
+    @app.command()
+    def second():
+        pass  # pragma: no cover
+
+    script = get_script("bash", app)
+    assert "_prog_completion_spec" not in script
+    assert "_PROG_COMPLETE=complete_bash $1" in script
+
+
+def test_choices_that_need_quoting_are_dynamic(static_env):
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        greeting: Literal["hello world", "bye"],
+        color: Literal["red", "blue"] = typer.Option("red", case_sensitive=False),
+    ):
+        pass  # pragma: no cover
+
+    script = get_script("bash", app)
+    assert "'|argument|0') REPLY=dynamic ;;" in script
+    assert "'|values|--color') REPLY=dynamic ;;" in script
+
+
+def test_show_completion(static_env):
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-m",
+            "coverage",
+            "run",
+            mod.__file__,
+            "--show-completion",
+            "bash",
+        ],
+        capture_output=True,
+        encoding="utf-8",
+        env={
+            **os.environ,
+            "_TYPER_COMPLETE_TEST_DISABLE_SHELL_DETECTION": "True",
+        },
+    )
+    assert "'users|commands|') REPLY='create delete' ;;" in result.stdout
+    assert (
+        "complete -o default -F _completion_staticpy_completion completion_static.py"
+        in result.stdout
+    )
@@ -437,3 +437,71 @@ def test_parameter_name_casing():
     result = runner.invoke(app, ["1", "3", "4", "7", "8", "--ARG5", "5", "--arg9", "9"])
     assert result.exit_code != 0
     assert "No such option: --arg9" in result.output
+
+
+def test_parser_compiled_once() -> None:
+    def main(**kwargs):
+        return kwargs
+
+    command = TyperCommand(
+        name="cmd",
+        params=[
+            TyperOption(param_decls=["--name", "-n"]),
+            TyperArgument(param_decls=["files"], nargs=-1),
+        ],
+        callback=main,
+    )
+    parser = command.make_parser(_click.Context(command))
+    other_parser = command.make_parser(_click.Context(command))
+    assert other_parser is not parser
+    assert other_parser._long_opt is parser._long_opt
+    assert command.main(["-n", "a", "x"], standalone_mode=False) == {
+        "name": "a",
+        "files": ("x",),
+    }
+    assert command.main(["y", "--name=b"], standalone_mode=False) == {
+        "name": "b",
+        "files": ("y",),
+    }
+    with pytest.raises(AssertionError, match="Can't add options"):
+        parser.add_option(obj=command.params[0], opts=["--other"], dest="other")
+    with pytest.raises(AssertionError, match="Can't add arguments"):
+        parser.add_argument(obj=command.params[1], dest="other")
+
+
+def test_parser_compiled_for_each_setting() -> None:
+    command = TyperCommand(
+        name="cmd",
+        params=[TyperOption(param_decls=["--name"])],
+        callback=lambda name: name,
+    )
+    parser = command.make_parser(_click.Context(command))
+    normalized_parser = command.make_parser(
+        _click.Context(command, token_normalize_func=str.lower)
+    )
+    assert normalized_parser._long_opt is not parser._long_opt
+    no_help_parser = command.make_parser(_click.Context(command, help_option_names=[]))
+    assert "--help" in parser._long_opt
+    assert "--help" not in no_help_parser._long_opt
+    strict_parser = command.make_parser(
+        _click.Context(command, allow_interspersed_args=False)
+    )
+    assert strict_parser.allow_interspersed_args is False
+    assert parser.allow_interspersed_args is True
+    with pytest.raises(_click.exceptions.NoSuchOption):
+        command.main(["--NAME", "a"], standalone_mode=False)
+    assert command.main(["--name", "a"], standalone_mode=False) == "a"
+    command.context_settings["token_normalize_func"] = str.lower
+    assert command.main(["--NAME", "b"], standalone_mode=False) == "b"
+    command.params.append(TyperOption(param_decls=["--other"]))
+    assert "--other" in command.make_parser(_click.Context(command))._long_opt
+
+
+def test_parser_tables_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_click.core, "_MAX_PARSER_TABLES", 2)
+    command = TyperCommand(name="cmd", params=[TyperOption(param_decls=["--name"])])
+    for _ in range(5):
+        command.make_parser(
+            _click.Context(command, token_normalize_func=lambda value: value)
+        )
+        assert len(command._parser_tables) <= 2
@@ -0,0 +1,135 @@
+from pathlib import Path
+
+import pytest
+import typer
+from typer import _help_cache
+from typer.testing import CliRunner
+
+from tests.utils import needs_rich
+
+runner = CliRunner()
+
+
+@pytest.fixture(autouse=True)
+def app_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    return tmp_path
+
+
+def create_app(**kwargs) -> typer.Typer:
+    app = typer.Typer(**kwargs)
+    users_app = typer.Typer(help="Manage users.")
+    app.add_typer(users_app, name="users")
+
+    @app.command()
+    def version():
+        """Show the version."""
+
+    @users_app.command()
+    def create(name: str, admin: bool = False):
+        """Create a user."""
+
+    return app
+
+
+def count_renders(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    renders = []
+    original_get_help = _help_cache.get_help
+
+    def counting_get_help(ctx, properties, render):
+        def counting_render() -> str:
+            renders.append(ctx.command_path)
+            return render()
+
+        return original_get_help(ctx, properties, counting_render)
+
+    monkeypatch.setattr(_help_cache, "get_help", counting_get_help)
+    return renders
+
+
+@pytest.mark.parametrize(
+    "rich_markup_mode",
+    [pytest.param("rich", marks=needs_rich), None],
+)
+def test_help_cached(rich_markup_mode, monkeypatch: pytest.MonkeyPatch):
+    renders = count_renders(monkeypatch)
+    app = create_app(help_cache=True, rich_markup_mode=rich_markup_mode)
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "Show the version." in result.output
+    cached = runner.invoke(app, ["--help"])
+    assert cached.output == result.output
+    not_cached = runner.invoke(
+        create_app(rich_markup_mode=rich_markup_mode), ["--help"]
+    )
+    assert not_cached.output == result.output
+    sub_result = runner.invoke(app, ["users", "create", "--help"])
+    assert "Create a user." in sub_result.output
+    assert "--admin" in sub_result.output
+    assert runner.invoke(app, ["users", "create", "--help"]).output == (
+        sub_result.output
+    )
+    assert renders == ["root", "root users create"]
+    assert len(list(_help_cache.get_cache_dir().glob("*.txt"))) == 2
+
+
+def test_changed_app(monkeypatch: pytest.MonkeyPatch):
+    renders = count_renders(monkeypatch)
+    runner.invoke(create_app(help_cache=True), ["--help"])
+    app = create_app(help_cache=True)
+
+    @app.command()
+    def other():
+        """Some other command."""
+
+    result = runner.invoke(app, ["--help"])
+    assert "Some other command." in result.output
+    assert len(renders) == 2
+
+
+@pytest.mark.parametrize(
+    "rich_markup_mode",
+    [pytest.param("rich", marks=needs_rich), None],
+)
+def test_dynamic_defaults(rich_markup_mode, monkeypatch: pytest.MonkeyPatch):
+    app = typer.Typer(help_cache=True, rich_markup_mode=rich_markup_mode)
+
+    @app.command()
+    def main(
+        name: str = typer.Option(..., show_default=True),
+        region: str = typer.Option("eu", envvar="TEST_REGION"),
+    ):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["--help"], default_map={"name": "Camila"})
+    assert "Camila" in result.output
+    result = runner.invoke(app, ["--help"], default_map={"name": "Rick"})
+    assert "Rick" in result.output
+    assert "Camila" not in result.output
+    renders = count_renders(monkeypatch)
+    runner.invoke(app, ["--help"], default_map={"name": "Rick"})
+    assert len(renders) == 0
+    runner.invoke(app, ["--help"], env={"TEST_REGION": "us"})
+    assert len(renders) == 1
+
+
+def test_not_enabled():
+    result = runner.invoke(create_app(), ["--help"])
+    assert "Show the version." in result.output
+    assert not _help_cache.get_cache_dir().exists()
+
+
+def test_max_entries(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(_help_cache, "MAX_ENTRIES", 1)
+    app = create_app(help_cache=True)
+    runner.invoke(app, ["--help"])
+    runner.invoke(app, ["users", "--help"])
+    (entry,) = _help_cache.get_cache_dir().glob("*.txt")
+    assert "Create a user." in entry.read_text()
+
+
+def test_unwritable_cache(app_dir: Path):
+    (app_dir / "typer").write_text("")
+    result = runner.invoke(create_app(help_cache=True), ["--help"])
+    assert result.exit_code == 0
+    assert "Show the version." in result.output
@@ -0,0 +1,136 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from tests.assets import help_renderer as mod
+from tests.utils import needs_rich
+
+runner = CliRunner()
+
+app = typer.Typer(epilog="Made with [red]love[/red]")
+users_app = typer.Typer()
+app.add_typer(
+    users_app, name="users", help="Manage [bold]users[/bold].", rich_help_panel="Admin"
+)
+
+
+@app.command(help="Say [bold]hello[/bold] \\[not a tag].")
+def hello(
+    name: str = typer.Argument(..., help="The [green]name[/green]"),
+    count: int = typer.Option(
+        1, envvar="COUNT", show_envvar=True, help="How many", rich_help_panel="Extra"
+    ),
+):
+    pass  # pragma: no cover
+
+
+@users_app.command()
+def create():
+    pass  # pragma: no cover
+
+
+@pytest.fixture
+def plain(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TYPER_HELP_RENDERER", "plain")
+
+
+@pytest.fixture
+def auto(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TYPER_HELP_RENDERER", "auto")
+    monkeypatch.delenv("_TYPER_FORCE_DISABLE_TERMINAL", raising=False)
+    for name in ["NO_COLOR", "TERM", "GITHUB_ACTIONS", "FORCE_COLOR", "PY_COLORS"]:
+        monkeypatch.delenv(name, raising=False)
+
+
+@needs_rich
+def test_plain_group_help(plain):
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "╭" not in result.output
+    assert "Commands:\n  hello  Say hello [not a tag].\n" in result.output
+    assert "Admin:\n  users  Manage users.\n" in result.output
+    assert "Made with love" in result.output
+
+
+@needs_rich
+def test_plain_command_help(plain):
+    result = runner.invoke(app, ["hello", "--help"])
+    assert result.exit_code == 0
+    assert "  Say hello [not a tag].\n" in result.output
+    assert "Arguments:\n  name  The name  [required]\n" in result.output
+    assert "Options:\n  --help" in result.output
+    assert "Extra:\n  --count <int>  How many  [env var: COUNT; default: 1]\n" in (
+        result.output
+    )
+
+
+@needs_rich
+def test_plain_error(plain):
+    result = runner.invoke(app, ["hello"])
+    assert result.exit_code == 2
+    assert "Error: Missing argument 'name'." in result.output
+    assert "╭" not in result.output
+
+
+@needs_rich
+def test_rich_by_default(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.delenv("TYPER_HELP_RENDERER", raising=False)
+    assert "╭" in runner.invoke(app, ["--help"]).output
+    assert "╭" in runner.invoke(app, ["hello"]).output
+
+
+@needs_rich
+def test_auto_not_a_terminal(auto):
+    assert "╭" not in runner.invoke(app, ["--help"]).output
+    assert "╭" not in runner.invoke(app, ["hello"]).output
+
+
+@needs_rich
+@pytest.mark.parametrize(
+    ("name", "value", "rich"),
+    [("FORCE_COLOR", "1", True), ("NO_COLOR", "1", False), ("TERM", "dumb", False)],
+)
+def test_auto_env(name: str, value: str, rich: bool, auto, monkeypatch):
+    monkeypatch.setenv(name, value)
+    assert ("╭" in runner.invoke(app, ["--help"]).output) is rich
+
+
+@needs_rich
+def test_auto_terminal(auto, monkeypatch: pytest.MonkeyPatch):
+    from typer.core import _use_rich_output
+
+    class Terminal:
+        def isatty(self) -> bool:
+            return True
+
+    monkeypatch.setattr(sys, "stdout", Terminal())
+    assert _use_rich_output()
+    monkeypatch.setattr(sys, "stdout", None)
+    assert not _use_rich_output()
+
+
+# "auto" uses the plain renderer in a pipe
+@pytest.mark.parametrize("renderer", ["plain", "auto"])
+def test_plain_doesnt_import_rich(renderer: str):
+    settings = ["TYPER_HELP_RENDERER", "GITHUB_ACTIONS", "FORCE_COLOR", "PY_COLORS"]
+    env = {name: value for name, value in os.environ.items() if name not in settings}
+    env["TYPER_HELP_RENDERER"] = renderer
+    result = subprocess.run(
+        [sys.executable, "-m", "coverage", "run", mod.__file__, "--help"],
+        capture_output=True,
+        encoding="utf-8",
+        env=env,
+    )
+    assert "The name to greet  [default: World]" in result.stdout
+    loaded_modules = result.stdout.splitlines()
+    assert "rich" not in loaded_modules
+    modules = [
+        module
+        for module in loaded_modules
+        if module.startswith("rich.") and module != "rich._extension"
+    ]
+    assert not modules
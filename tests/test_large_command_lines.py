@@ -0,0 +1,110 @@
+import time
+from collections.abc import Callable
+
+import typer
+from typer.core import TyperCommand, TyperOption
+
+from tests.utils import benchmark
+
+
+def create_app() -> typer.Typer:
+    app = typer.Typer()
+
+    @app.command()
+    def main(
+        files: list[str],
+        tag: list[str] = typer.Option([], "--tag", "-t"),
+        pair: tuple[str, str] = typer.Option(("", "")),
+        verbose: bool = False,
+    ):
+        return files, tag, pair, verbose
+
+    return app
+
+
+def best_time(function: Callable[[], object]) -> float:
+    times = []
+    for _ in range(3):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def test_many_arguments():
+    app = create_app()
+    files = [f"file{i}.txt" for i in range(100_000)]
+    result = app([*files, "--verbose", "--pair", "a", "b"], standalone_mode=False)
+    assert result == (files, [], ("a", "b"), True)
+
+
+def test_many_interspersed_options():
+    app = create_app()
+    args = []
+    for i in range(100_000):
+        args.extend([f"--tag={i}" if i % 2 else f"-t{i}", f"file{i}.txt"])
+    files, tags, _, _ = app(args, standalone_mode=False)
+    assert files == [f"file{i}.txt" for i in range(100_000)]
+    assert tags == [str(i) for i in range(100_000)]
+
+
+@benchmark
+def test_parsing_scales_linearly():
+    # Benchmark parsing 100k arguments against 10k: linear parsing takes ~10 times
+    # longer, while consuming them one by one from the start of a list took ~100
+    app = create_app()
+
+    def get_args(size: int) -> list[str]:
+        return [arg for i in range(size) for arg in ("--tag", str(i), f"file{i}")]
+
+    small_args = get_args(10_000)
+    large_args = get_args(100_000)
+    small = best_time(lambda: app(small_args, standalone_mode=False))
+    large = best_time(lambda: app(large_args, standalone_mode=False))
+    assert large / small < 30
+
+
+def create_many_options_command(size: int) -> TyperCommand:
+    def main(**kwargs):
+        return kwargs
+
+    params = [
+        TyperOption(param_decls=[f"--opt{i}"], default="default") for i in range(size)
+    ]
+    params.append(TyperOption(param_decls=["--tag"], multiple=True))
+    return TyperCommand(name="main", params=params, callback=main)
+
+
+def get_many_options_args(size: int) -> list[str]:
+    args = []
+    for i in range(size):
+        args.extend([f"--opt{i}", str(i), "--tag", str(i)])
+    return args
+
+
+def test_many_options():
+    command = create_many_options_command(1_000)
+    args = get_many_options_args(1_000)
+    result = command.main([*args, "--opt0", "last"], standalone_mode=False)
+    assert result["opt0"] == "last"
+    assert result["opt999"] == "999"
+    assert result["tag"] == tuple(str(i) for i in range(1_000))
+    result = command.main([], standalone_mode=False)
+    assert result["opt999"] == "default"
+
+
+@benchmark
+def test_many_options_scale_linearly():
+    # Benchmark 1k options and a repeated option used 10k times, against 100
+    # options and 1k times: processing them should take ~10 times longer, not
+    # ~100, even when most options are not used
+    def get_args(size: int) -> list[str]:
+        return ["--opt0", "value", *["--tag", "value"] * size * 10]
+
+    small_command = create_many_options_command(100)
+    large_command = create_many_options_command(1_000)
+    small_args = get_args(100)
+    large_args = get_args(1_000)
+    small = best_time(lambda: small_command.main(small_args, standalone_mode=False))
+    large = best_time(lambda: large_command.main(large_args, standalone_mode=False))
+    assert large / small < 30
@@ -0,0 +1,170 @@
+import os
+import pydoc
+import shutil
+
+import pytest
+import typer
+from typer.testing import CliRunner, _NamedTextIOWrapper
+
+from tests.utils import needs_rich
+
+runner = CliRunner()
+
+
+def make_app(count: int, **settings) -> typer.Typer:
+    app = typer.Typer(**settings)
+    users_app = typer.Typer(**settings)
+    app.add_typer(users_app, name="users", rich_help_panel="Admin")
+    for index in range(count):
+
+        def resource_command():
+            pass  # pragma: no cover
+
+        app.command(
+            f"resource-{index:04}",
+            help=f"Manage the resource [bold]{index}[/bold].",
+            deprecated=index == 3,
+        )(resource_command)
+    for name in ["create", "delete", "list"]:
+        users_app.command(name, help=f"{name.title()} users.")(resource_command)
+    return app
+
+
+@pytest.fixture
+def plain(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TYPER_HELP_RENDERER", "plain")
+
+
+@needs_rich
+def test_max_commands():
+    app = make_app(100, help_max_commands=2)
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "resource-0000" in result.output
+    assert "resource-0001" in result.output
+    assert "resource-0002" not in result.output
+    assert "98 more… (filter with 'root --help PREFIX')" in result.output
+    # Panels with fewer commands are listed complete
+    assert "users" in result.output
+    assert "more…" not in result.output.split("Admin")[1]
+
+
+@needs_rich
+def test_max_commands_plain(plain):
+    app = make_app(100, help_max_commands=2)
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert (
+        "  resource-0000  Manage the resource 0.\n"
+        "  resource-0001  Manage the resource 1.\n"
+        "                 98 more… (filter with 'root --help PREFIX')\n"
+    ) in result.output
+    assert "Admin:\n  users\n" in result.output
+
+
+def test_max_commands_no_markup():
+    # All the commands in the same section, without Rich panels
+    app = make_app(100, help_max_commands=2, rich_markup_mode=None)
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert (
+        "  resource-0001  Manage the resource [bold]1[/bold].\n"
+        "                 99 more… (filter with 'root --help PREFIX')\n"
+    ) in result.output
+
+
+@needs_rich
+@pytest.mark.parametrize("renderer", ["rich", "plain"])
+def test_help_prefix(monkeypatch: pytest.MonkeyPatch, renderer: str):
+    monkeypatch.setenv("TYPER_HELP_RENDERER", renderer)
+    app = make_app(100, help_max_commands=5)
+    result = runner.invoke(app, ["--help", "resource-005"])
+    assert result.exit_code == 0
+    assert "resource-0050" in result.output
+    assert "resource-0054" in result.output
+    assert "resource-0055" not in result.output
+    assert "5 more…" in result.output
+    assert "resource-0000" not in result.output
+    assert "users" not in result.output
+    # The subcommands of subgroups are filtered too
+    result = runner.invoke(app, ["users", "--help", "de"])
+    assert result.exit_code == 0
+    assert "delete" in result.output
+    assert "create" not in result.output
+
+
+def test_help_prefix_without_max_commands(plain):
+    # The argument is ignored, as before
+    app = make_app(3)
+    result = runner.invoke(app, ["--help", "users"])
+    assert result.exit_code == 0
+    assert "resource-0000" in result.output
+    assert "users" in result.output
+
+
+def test_help_prefix_subcommand_help(plain):
+    app = make_app(3, help_max_commands=2)
+    result = runner.invoke(app, ["resource-0001", "--help"])
+    assert result.exit_code == 0
+    assert "Usage: root resource-0001 [OPTIONS]" in result.output
+
+
+def test_invalid_max_commands():
+    with pytest.raises(
+        AssertionError, match="help_max_commands must be a positive number"
+    ):
+        typer.Typer(help_max_commands=0)
+
+
+@needs_rich
+def test_chunked_panel(monkeypatch: pytest.MonkeyPatch):
+    from typer import rich_utils
+
+    # With deprecated commands, in the first chunk only
+    app = make_app(45)
+    output = runner.invoke(app, ["--help"]).output
+    monkeypatch.setattr(rich_utils, "COMMANDS_PANEL_CHUNK_SIZE", 10)
+    chunked_output = runner.invoke(app, ["--help"]).output
+    assert chunked_output == output
+    app = make_app(45, help_max_commands=30)
+    monkeypatch.setattr(rich_utils, "COMMANDS_PANEL_CHUNK_SIZE", 1000)
+    output = runner.invoke(app, ["--help"]).output
+    monkeypatch.setattr(rich_utils, "COMMANDS_PANEL_CHUNK_SIZE", 10)
+    chunked_output = runner.invoke(app, ["--help"]).output
+    assert chunked_output == output
+    assert "15 more…" in output
+
+
+@pytest.fixture
+def terminal(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    paged: list[str] = []
+    monkeypatch.setattr(_NamedTextIOWrapper, "isatty", lambda self: True)
+    monkeypatch.setattr(pydoc, "pager", paged.append)
+    monkeypatch.setattr(
+        shutil, "get_terminal_size", lambda *args: os.terminal_size((80, 20))
+    )
+    return paged
+
+
+@needs_rich
+@pytest.mark.parametrize("renderer", ["rich", "plain"])
+def test_help_pager(monkeypatch: pytest.MonkeyPatch, terminal, renderer: str):
+    monkeypatch.setenv("TYPER_HELP_RENDERER", renderer)
+    app = make_app(50, help_pager=True)
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "resource-0000" not in result.output
+    (text,) = terminal
+    assert "resource-0049" in text
+    assert "\x1b[" not in text
+    # Help that fits in the terminal is printed directly
+    result = runner.invoke(app, ["users", "--help"])
+    assert "delete" in result.output
+    assert len(terminal) == 1
+
+
+def test_help_pager_disabled(terminal):
+    app = make_app(50)
+    result = runner.invoke(app, ["--help"])
+    assert "resource-0049" in result.output
+    assert terminal == []
@@ -0,0 +1,110 @@
+import pytest
+import typer
+import typer.main
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def create_app(lazy_commands: bool) -> typer.Typer:
+    app = typer.Typer(lazy_commands=lazy_commands)
+    users_app = typer.Typer(help="Manage users.")
+    app.add_typer(users_app, name="users")
+    extra_app = typer.Typer()
+    app.add_typer(extra_app)
+
+    @app.command(rich_help_panel="Utils")
+    def version():
+        """Show the version."""
+        print("1.0.0")
+
+    @app.command(deprecated=True, help="Old command.")
+    def old():
+        pass  # pragma: no cover
+
+    @users_app.command()
+    def create(name: str):
+        """Create a user."""
+        print(f"Creating user: {name}")
+
+    @extra_app.command(short_help="Some extra command.")
+    def extra():
+        print("extra")
+
+    return app
+
+
+def count_built_commands(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    built = []
+    original_get_command_from_info = typer.main.get_command_from_info
+
+    def counting_get_command_from_info(command_info, **kwargs):
+        command = original_get_command_from_info(command_info, **kwargs)
+        built.append(command.name)
+        return command
+
+    monkeypatch.setattr(
+        typer.main, "get_command_from_info", counting_get_command_from_info
+    )
+    return built
+
+
+def test_help_without_building_commands(monkeypatch: pytest.MonkeyPatch):
+    expected = runner.invoke(create_app(lazy_commands=False), ["--help"])
+    built = count_built_commands(monkeypatch)
+    result = runner.invoke(create_app(lazy_commands=True), ["--help"])
+    assert result.exit_code == 0
+    assert result.output == expected.output
+    assert built == []
+
+
+def test_not_lazy_by_default(monkeypatch: pytest.MonkeyPatch):
+    built = count_built_commands(monkeypatch)
+    result = runner.invoke(create_app(lazy_commands=False), ["--help"])
+    assert result.exit_code == 0
+    assert built == ["version", "old", "create", "extra"]
+
+
+def test_run_builds_only_the_command(monkeypatch: pytest.MonkeyPatch):
+    app = create_app(lazy_commands=True)
+    built = count_built_commands(monkeypatch)
+    result = runner.invoke(app, ["users", "create", "Camila"])
+    assert result.exit_code == 0
+    assert "Creating user: Camila" in result.output
+    assert built == ["create"]
+    result = runner.invoke(app, ["extra"])
+    assert result.exit_code == 0
+    assert "extra" in result.output
+    assert built == ["create", "extra"]
+
+
+def test_group_help():
+    expected = runner.invoke(create_app(lazy_commands=False), ["users", "--help"])
+    result = runner.invoke(create_app(lazy_commands=True), ["users", "--help"])
+    assert result.exit_code == 0
+    assert result.output == expected.output
+
+
+def test_command_help():
+    expected = runner.invoke(create_app(lazy_commands=False), ["version", "--help"])
+    result = runner.invoke(create_app(lazy_commands=True), ["version", "--help"])
+    assert result.exit_code == 0
+    assert result.output == expected.output
+
+
+def test_invalid_parameter_only_fails_when_used():
+    app = typer.Typer(lazy_commands=True)
+
+    @app.command()
+    def valid():
+        print("valid")
+
+    @app.command()
+    def invalid(value: object):
+        pass  # pragma: no cover
+
+    result = runner.invoke(app, ["valid"])
+    assert result.exit_code == 0
+    assert result.output == "valid\n"
+    result = runner.invoke(app, ["invalid", "value"])
+    assert isinstance(result.exception, RuntimeError)
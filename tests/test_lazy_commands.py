@@ -0,0 +1,96 @@
+import sys
+
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from tests.assets.lazy.main import app
+
+runner = CliRunner()
+
+lazy_modules = ("tests.assets.lazy.users", "tests.assets.lazy.train")
+
+
+@pytest.fixture(autouse=True)
+def unload_lazy_modules():
+    for module_name in lazy_modules:
+        sys.modules.pop(module_name, None)
+
+
+def test_run_eager_command_does_not_import():
+    result = runner.invoke(app, ["version"])
+    assert result.exit_code == 0
+    assert "1.0.0" in result.output
+    for module_name in lazy_modules:
+        assert module_name not in sys.modules
+
+
+def test_help_does_not_import():
+    result = runner.invoke(app, ["--help"])
+    assert result.exit_code == 0
+    assert "users" in result.output
+    assert "Manage users." in result.output
+    assert "train-model" in result.output
+    assert "Train the model." in result.output
+    for module_name in lazy_modules:
+        assert module_name not in sys.modules
+
+
+def test_lazy_group():
+    result = runner.invoke(app, ["users", "create", "Camila"])
+    assert result.exit_code == 0
+    assert "Creating user: Camila" in result.output
+    assert "tests.assets.lazy.users" in sys.modules
+    assert "tests.assets.lazy.train" not in sys.modules
+
+
+def test_lazy_group_help():
+    result = runner.invoke(app, ["users", "--help"])
+    assert result.exit_code == 0
+    assert "Manage users." in result.output
+    assert "create" in result.output
+    assert "delete" in result.output
+
+
+def test_lazy_command():
+    result = runner.invoke(app, ["train-model", "--epochs", "3"])
+    assert result.exit_code == 0
+    assert "Training for 3 epochs" in result.output
+    assert "tests.assets.lazy.users" not in sys.modules
+
+
+def test_lazy_single_command():
+    single_app = typer.Typer()
+    single_app.command()("tests.assets.lazy.train:train_model")
+    result = runner.invoke(single_app, ["--epochs", "2"])
+    assert result.exit_code == 0
+    assert "Training for 2 epochs" in result.output
+
+
+def test_completion_does_not_import():
+    result = runner.invoke(
+        app,
+        [],
+        env={
+            "_LAZY_MAIN.PY_COMPLETE": "complete_bash",
+            "COMP_WORDS": "lazy_main.py ",
+            "COMP_CWORD": "1",
+        },
+        prog_name="lazy_main.py",
+    )
+    assert "users" in result.output
+    assert "train-model" in result.output
+    for module_name in lazy_modules:
+        assert module_name not in sys.modules
+
+
+def test_lazy_add_typer_requires_name():
+    app = typer.Typer()
+    with pytest.raises(AssertionError, match="A name is required"):
+        app.add_typer("tests.assets.lazy.users:app")
+
+
+def test_invalid_import_string():
+    app = typer.Typer()
+    with pytest.raises(AssertionError, match="must be in the format"):
+        app.command()("tests.assets.lazy.train.train_model")
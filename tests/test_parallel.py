@@ -0,0 +1,248 @@
+import io
+import itertools
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import typer
+import typer.main
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def square(value: int) -> int:
+    return value * value
+
+
+def get_pid(value: int) -> int:
+    return os.getpid()
+
+
+def test_ordered():
+    assert list(typer.parallel_map(square, range(20), jobs=4)) == [
+        value * value for value in range(20)
+    ]
+
+
+def test_runs_in_parallel():
+    barrier = threading.Barrier(4, timeout=10)
+
+    def wait_for_others(value: int) -> int:
+        # Fails with a timeout unless the 4 items run at the same time
+        barrier.wait()
+        return value
+
+    assert list(typer.parallel_map(wait_for_others, range(4), jobs=4)) == [0, 1, 2, 3]
+
+
+def test_as_completed():
+    def sleep(value: float) -> float:
+        time.sleep(value)
+        return value
+
+    results = list(typer.parallel_map(sleep, [0.5, 0.0], jobs=2, ordered=False))
+    assert results == [0.0, 0.5]
+
+
+def test_single_job_in_current_thread():
+    threads = list(
+        typer.parallel_map(lambda _: threading.get_ident(), range(3), jobs=1)
+    )
+    assert threads == [threading.get_ident()] * 3
+
+
+def test_process_backend():
+    pids = set(typer.parallel_map(get_pid, range(4), jobs=2, backend="process"))
+    assert os.getpid() not in pids
+    assert list(typer.parallel_map(square, range(4), backend="process")) == [
+        0,
+        1,
+        4,
+        9,
+    ]
+
+
+def test_lazy_input():
+    consumed = []
+
+    def numbers():
+        for value in itertools.count():
+            consumed.append(value)
+            yield value
+
+    results = typer.parallel_map(square, numbers(), jobs=2)
+    assert list(itertools.islice(results, 3)) == [0, 1, 4]
+    results.close()
+    # Only a few items are taken ahead of the results
+    assert len(consumed) <= 8
+
+
+def test_exception_cancels_pending():
+    started = []
+
+    def fail_first(value: int) -> int:
+        started.append(value)
+        if value == 0:
+            raise ValueError("Something went wrong")
+        time.sleep(0.1)
+        return value
+
+    with pytest.raises(ValueError, match="Something went wrong"):
+        list(typer.parallel_map(fail_first, range(100), jobs=2))
+    assert len(started) < 100
+
+
+def test_progressbar():
+    output = io.StringIO()
+    with typer.progressbar(length=10, file=output) as progress:
+        results = list(typer.parallel_map(square, range(10), progress=progress))
+    assert len(results) == 10
+    assert progress.pos == 10
+
+
+def test_invalid_jobs():
+    with pytest.raises(AssertionError, match="jobs must be a positive number"):
+        typer.parallel_map(square, range(3), jobs=0)
+
+
+# At the top level, to be sent to worker processes
+def count(paths: list[Path], prefix: str = "Lines"):
+    lines = len(paths.read_text().splitlines())
+    print(f"{prefix} {paths.name}: {lines}")
+    return lines
+
+
+def create_app() -> typer.Typer:
+    app = typer.Typer()
+    app.command(parallel="paths")(count)
+
+    @app.command()
+    def other():
+        pass  # pragma: no cover
+
+    return app
+
+
+def test_parallel_command(tmp_path: Path):
+    paths = []
+    for lines in range(1, 4):
+        path = tmp_path / f"{lines}.txt"
+        path.write_text("line\n" * lines)
+        paths.append(str(path))
+    result = runner.invoke(create_app(), ["count", *paths, "-j", "2"])
+    assert result.exit_code == 0, result.output
+    assert sorted(result.output.splitlines()) == [
+        "Lines 1.txt: 1",
+        "Lines 2.txt: 2",
+        "Lines 3.txt: 3",
+    ]
+    result = runner.invoke(
+        create_app(),
+        [
+            "count",
+            *paths,
+            "--prefix",
+            "Total",
+            "-j",
+            "2",
+            "--parallel-backend",
+            "process",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+
+
+def test_parallel_command_error(tmp_path: Path):
+    result = runner.invoke(create_app(), ["count", str(tmp_path / "missing.txt")])
+    assert result.exit_code == 1
+    assert isinstance(result.exception, FileNotFoundError)
+
+
+def test_parallel_command_help():
+    result = runner.invoke(create_app(), ["count", "--help"])
+    assert "--jobs" in result.output
+    assert "-j" in result.output
+    assert "--parallel-backend" in result.output
+    assert "thread|process" in result.output
+    assert "number of CPUs" in result.output
+
+
+def test_parallel_command_invalid_backend():
+    result = runner.invoke(create_app(), ["count", "a.txt", "--parallel-backend", "x"])
+    assert result.exit_code == 2
+
+
+def test_parallel_parameter_not_a_list():
+    app = typer.Typer()
+
+    @app.command(parallel="name")
+    def main(name: str):
+        pass  # pragma: no cover
+
+    with pytest.raises(AssertionError, match="should be a list"):
+        typer.main.get_command(app)
+
+
+def test_parallel_parameter_missing():
+    app = typer.Typer()
+
+    @app.command(parallel="names")
+    def main(name: list[str]):
+        pass  # pragma: no cover
+
+    with pytest.raises(AssertionError, match="is not a parameter"):
+        typer.main.get_command(app)
+
+
+def test_parallel_command_optional_list():
+    app = typer.Typer()
+
+    @app.command(parallel="names")
+    def main(names: list[str] | None = None):
+        print(f"Hello {names}")
+
+    result = runner.invoke(app, ["--names", "Camila", "-j", "1"])
+    assert result.exit_code == 0, result.output
+    assert result.output == "Hello Camila\n"
+    result = runner.invoke(app, [])
+    assert result.exit_code == 0, result.output
+    assert result.output == ""
+
+
+def test_parallel_command_ordered():
+    app = typer.Typer()
+
+    @app.command(parallel="delays")
+    def main(delays: list[float]):
+        time.sleep(delays)
+        return delays
+
+    result = runner.invoke(app, ["0.5", "0", "-j", "2"], standalone_mode=False)
+    assert result.return_value == [0.5, 0.0]
+    result = runner.invoke(app, ["--help"])
+    assert "--as-completed" not in result.output
+
+
+def test_parallel_command_progress(tmp_path: Path):
+    path = tmp_path / "file.txt"
+    path.write_text("line\n")
+    result = runner.invoke(create_app(), ["count", str(path), "--progress"])
+    assert result.exit_code == 0, result.output
+    assert result.stdout == "Lines file.txt: 1\n"
+    assert "Processing" in result.stderr
+    result = runner.invoke(create_app(), ["count", str(path)])
+    assert "Processing" not in result.stderr
+
+
+def test_parallel_command_context_not_allowed():
+    app = typer.Typer()
+
+    @app.command(parallel="names")
+    def main(ctx: typer.Context, names: list[str]):
+        pass  # pragma: no cover
+
+    with pytest.raises(AssertionError, match="can't have a Context parameter"):
+        typer.main.get_command(app)
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+import typer
+import typer.utils
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+def test_signature_analyzed_once_per_callback(monkeypatch: pytest.MonkeyPatch):
+    app = typer.Typer()
+
+    @app.callback()
+    def main(verbose: bool = False):
+        pass
+
+    @app.command()
+    def hello(name: str, count: int = 1):
+        print(f"Hello {name}" * count)
+
+    analyzed = []
+    original_get_type_hints = typer.utils.get_type_hints
+
+    def counting_get_type_hints(obj, *args, **kwargs):
+        analyzed.append(obj)
+        return original_get_type_hints(obj, *args, **kwargs)
+
+    monkeypatch.setattr(typer.utils, "get_type_hints", counting_get_type_hints)
+
+    result = runner.invoke(app, ["hello", "Camila"])
+    assert result.exit_code == 0
+    assert "Hello Camila" in result.output
+    assert analyzed.count(main) == 1
+    assert analyzed.count(hello) == 1
+
+    result = runner.invoke(app, ["hello", "Rick"])
+    assert result.exit_code == 0
+    assert analyzed.count(hello) == 1
+
+
+def test_cached_params_are_not_shared():
+    def main(name: str, count: int = 1):
+        pass  # pragma: no cover
+
+    params = typer.utils.get_params_from_function(main)
+    params.pop("name")
+    new_params = typer.utils.get_params_from_function(main)
+    assert list(new_params) == ["name", "count"]
+    assert new_params["count"].annotation is int
@@ -298,3 +298,144 @@ def test_rich_lowercase_bracketed_metavar() -> None:
     usage_line = result.output.splitlines()[0]
     assert usage_line.startswith("Usage: typer [path_or_module] run [OPTIONS] {name}")
     assert "Try 'typer [path_or_module] run --help' for help." in result.output
+
+
+@needs_rich
+def test_console_cached_per_stream(monkeypatch: pytest.MonkeyPatch):
+    import io
+
+    from typer import rich_utils
+
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    console = rich_utils._get_rich_console()
+    assert rich_utils._get_rich_console() is console
+    assert rich_utils._get_rich_console(stderr=True) is not console
+    # A new stream, e.g. in a new CliRunner invocation, gets a new console
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    new_console = rich_utils._get_rich_console()
+    assert new_console is not console
+    # Customized styles are used after the console was created
+    monkeypatch.setattr(rich_utils, "STYLE_OPTION", "bold red")
+    styled_console = rich_utils._get_rich_console()
+    assert styled_console is not new_console
+    assert str(styled_console.get_style("option")) == "bold red"
+
+
+@needs_rich
+def test_repeated_help_and_errors_create_console_once(monkeypatch: pytest.MonkeyPatch):
+    import io
+
+    from typer import rich_utils
+
+    app = typer.Typer()
+
+    @app.command()
+    def main(name: str):
+        pass  # pragma: no cover
+
+    command = typer.main.get_command(app)
+    created: list[object] = []
+
+    class CountingConsole(rich_utils.Console):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(rich_utils, "Console", CountingConsole)
+    monkeypatch.setattr(sys, "stdout", io.StringIO())
+    monkeypatch.setattr(sys, "stderr", io.StringIO())
+    for _ in range(20):
+        command.main(["--help"], prog_name="prog", standalone_mode=False)
+        with pytest.raises(typer.BadParameter) as exc_info:
+            raise typer.BadParameter("Invalid name")
+        rich_utils.rich_format_error(exc_info.value)
+    assert len(created) == 2
+    assert sys.stdout.getvalue().count("Usage: prog [OPTIONS]") == 20
+    assert sys.stderr.getvalue().count("Invalid name") == 20
+
+    # Rendering errors and text reuses the same consoles and theme
+    theme_misses = rich_utils._make_theme.cache_info().misses
+    for _ in range(20):
+        rich_utils.rich_format_error(typer.BadParameter("Invalid name"))
+        rich_utils.rich_abort_error()
+        rich_utils.rich_render_text("[bold]Hello[/bold] --name")
+    assert len(created) == 2
+    assert rich_utils._make_theme.cache_info().misses == theme_misses
+
+
+@needs_rich
+def test_console_depends_on_env(monkeypatch: pytest.MonkeyPatch):
+    from typer import rich_utils
+
+    monkeypatch.delenv("NO_COLOR", raising=False)
+    console = rich_utils._get_rich_console()
+    assert rich_utils._get_rich_console() is console
+    monkeypatch.setenv("NO_COLOR", "1")
+    no_color_console = rich_utils._get_rich_console()
+    assert no_color_console is not console
+    assert no_color_console.no_color
+    monkeypatch.setenv("TERM", "dumb")
+    assert rich_utils._get_rich_console() is not no_color_console
+
+
+@needs_rich
+def test_markdown_help_parsed_once(monkeypatch: pytest.MonkeyPatch):
+    from typer import rich_utils
+
+    app = typer.Typer(rich_markup_mode="markdown", epilog="Made with **love**")
+
+    @app.command()
+    def main(name: str = typer.Option(..., help="The *name* :sparkles:")):
+        """
+        Say **hello**.
+
+        More details in `the docs`.
+        """
+
+    parsed: list[str] = []
+
+    class CountingMarkdown(rich_utils.Markdown):
+        def __init__(self, markup: str, *args, **kwargs):
+            parsed.append(markup)
+            super().__init__(markup, *args, **kwargs)
+
+    monkeypatch.setattr(rich_utils, "Markdown", CountingMarkdown)
+    rich_utils._parse_rich_text.cache_clear()
+    output = runner.invoke(app, ["--help"]).output
+    assert "Say hello" in output
+    assert "✨" in output
+    count = len(parsed)
+    assert count > 0
+    assert runner.invoke(app, ["--help"]).output == output
+    assert len(parsed) == count
+
+
+@needs_rich
+def test_make_rich_text_returns_new_text():
+    from typer import rich_utils
+
+    text = rich_utils._make_rich_text(text="[bold]Hello[/bold]", markup_mode="rich")
+    text.stylize("red")
+    again = rich_utils._make_rich_text(text="[bold]Hello[/bold]", markup_mode="rich")
+    assert again is not text
+    assert again.plain == "Hello"
+    assert len(again.spans) == len(text.spans) - 1
+
+
+@needs_rich
+def test_rich_to_html_cached(monkeypatch: pytest.MonkeyPatch):
+    from typer import rich_utils
+
+    created: list[object] = []
+
+    class CountingConsole(rich_utils.Console):
+        def __init__(self, *args, **kwargs):
+            created.append(self)
+            super().__init__(*args, **kwargs)
+
+    monkeypatch.setattr(rich_utils, "Console", CountingConsole)
+    rich_utils._rich_to_html.cache_clear()
+    html = rich_utils.rich_to_html("[bold]Hello[/bold]")
+    assert "Hello" in html
+    assert rich_utils.rich_to_html("[bold]Hello[/bold]") == html
+    assert len(created) == 1
@@ -0,0 +1,157 @@
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+import typer._server_client
+
+pytestmark = pytest.mark.skipif(
+    sys.platform == "win32", reason="The command server uses Unix sockets"
+)
+
+repo_root = Path(__file__).parent.parent
+client_path = typer._server_client.__file__
+
+
+@pytest.fixture
+def prog(tmp_path: Path) -> Path:
+    prog_path = tmp_path / "prog"
+    prog_path.write_text(
+        f"#!{sys.executable}\n"
+        "import runpy, sys\n"
+        f"sys.path.insert(0, {str(repo_root)!r})\n"
+        "runpy.run_module('tests.assets.command_server', run_name='__main__')\n"
+    )
+    prog_path.chmod(0o755)
+    return prog_path
+
+
+@pytest.fixture
+def socket_path(tmp_path: Path) -> Path:
+    socket_dir = tmp_path / "run"
+    socket_dir.mkdir(mode=0o700)
+    return socket_dir / "prog.sock"
+
+
+def wait_for(condition, timeout: float = 30):
+    start = time.monotonic()
+    while not condition():
+        if time.monotonic() - start > timeout:  # pragma: no cover
+            raise TimeoutError()
+        time.sleep(0.05)
+
+
+def start_server(prog: Path, socket_path: Path, **env: str) -> subprocess.Popen:
+    process = subprocess.Popen(
+        [sys.executable, "-m", "coverage", "run", str(prog)],
+        env={**os.environ, "TEST_SERVER_SOCKET": str(socket_path), **env},
+    )
+    wait_for(socket_path.exists)
+    return process
+
+
+@pytest.fixture
+def server(prog: Path, socket_path: Path):
+    process = start_server(prog, socket_path)
+    yield process
+    process.terminate()
+    process.wait()
+
+
+def run(
+    prog: Path, socket_path: Path, *args: str, **kwargs
+) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-S", "-E", client_path, "--socket", str(socket_path)]
+        + [str(prog), *args],
+        capture_output=True,
+        encoding="utf-8",
+        **kwargs,
+    )
+
+
+def test_run_with_server(server, prog: Path, socket_path: Path, tmp_path: Path):
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+    result = run(
+        prog,
+        socket_path,
+        "hello",
+        "Camila",
+        cwd=work_dir,
+        env={**os.environ, "GREETING_END": "!"},
+    )
+    assert result.returncode == 0
+    assert result.stdout == "Hello Camila from work!\n"
+    result = run(prog, socket_path, "hello", "Rick", "--code", "3")
+    assert result.returncode == 3
+    assert result.stdout.startswith("Hello Rick from ")
+    assert server.poll() is None
+
+
+def test_usage_error(server, prog: Path, socket_path: Path):
+    result = run(prog, socket_path, "hello")
+    assert result.returncode == 2
+    assert "Usage: prog hello [OPTIONS]" in result.stderr
+    assert "Missing argument" in result.stderr
+
+
+def test_exception(server, prog: Path, socket_path: Path):
+    result = run(prog, socket_path, "fail")
+    assert result.returncode == 1
+    assert "ValueError: Something went wrong" in result.stderr
+    assert server.poll() is None
+
+
+def test_server_stopped_while_running(
+    server, prog: Path, socket_path: Path, tmp_path: Path
+):
+    log_path = tmp_path / "log.txt"
+    result = run(prog, socket_path, "crash", str(log_path))
+    assert result.returncode == 1
+    assert "The server stopped while running the command" in result.stderr
+    # The command line is not run again without the server
+    assert log_path.read_text() == "run\n"
+    assert server.poll() is None
+
+
+def test_without_server_runs_prog(prog: Path, socket_path: Path):
+    result = run(prog, socket_path, "hello", "Camila")
+    assert result.returncode == 0
+    assert result.stdout.startswith("Hello Camila from ")
+    assert not socket_path.exists()
+
+
+def test_max_concurrency(prog: Path, socket_path: Path, tmp_path: Path):
+    process = start_server(prog, socket_path, TEST_SERVER_MAX_CONCURRENCY="1")
+    log_path = tmp_path / "log.txt"
+    command = [sys.executable, "-S", "-E", client_path, "--socket", str(socket_path)]
+    clients = [
+        subprocess.Popen([*command, str(prog), "slow", str(log_path)]) for _ in range(3)
+    ]
+    for client in clients:
+        assert client.wait() == 0
+    process.terminate()
+    process.wait()
+    # Each one starts after the previous one ended
+    events = [line.split()[0] for line in log_path.read_text().splitlines()]
+    assert events == ["start", "end"] * 3
+
+
+def test_idle_timeout(prog: Path, socket_path: Path):
+    process = start_server(prog, socket_path, TEST_SERVER_IDLE_TIMEOUT="1")
+    result = run(prog, socket_path, "hello", "Camila")
+    assert result.returncode == 0
+    assert process.wait(timeout=30) == 0
+    assert not socket_path.exists()
+
+
+def test_already_running(server, prog: Path, socket_path: Path):
+    result = subprocess.run(
+        [sys.executable, str(prog)],
+        env={**os.environ, "TEST_SERVER_SOCKET": str(socket_path)},
+    )
+    assert result.returncode == 3
+    assert server.poll() is None
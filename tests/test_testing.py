@@ -0,0 +1,253 @@
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import typer
+from typer._click import termui
+from typer.testing import CliRunner
+
+app = typer.Typer()
+
+
+@app.command()
+def hello(
+    name: str,
+    password: str = typer.Option(..., prompt=True, hide_input=True),
+    color: str = typer.Option("none", envvar="TEST_COLOR"),
+):
+    typer.echo(f"Hello {name}, color {color}, password {len(password)}")
+    typer.echo(f"Error for {name}", err=True)
+    print(f"Printed {name}")
+
+
+@app.command()
+def env(value: str = typer.Option("unset", envvar=["TEST_NEW", "TEST_EXISTING"])):
+    typer.echo(value)
+
+
+def test_concurrent_invocations():
+    runner = CliRunner(isolation_mode="context")
+
+    def invoke(index: int) -> None:
+        result = runner.invoke(
+            app,
+            ["hello", f"user{index}"],
+            input=f"{'x' * index}\n",
+            env={"TEST_COLOR": f"color{index}"},
+        )
+        assert result.exit_code == 0, result.output
+        assert result.stdout == (
+            "Password: \n"
+            f"Hello user{index}, color color{index}, password {index}\n"
+            f"Printed user{index}\n"
+        )
+        assert result.stderr == f"Error for user{index}\n"
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(invoke, range(1, 65)))
+
+
+def test_concurrent_errors():
+    runner = CliRunner(isolation_mode="context")
+
+    def invoke(index: int) -> None:
+        result = runner.invoke(app, ["hello"])
+        assert result.exit_code == 2
+        assert result.stdout == ""
+        assert "Missing argument" in result.stderr
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(invoke, range(16)))
+
+
+def test_concurrent_help_width():
+    runner = CliRunner(isolation_mode="context")
+
+    def invoke(index: int) -> str:
+        return runner.invoke(app, ["hello", "--help"]).output
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        outputs = list(executor.map(invoke, range(8)))
+    assert "Usage: root hello [OPTIONS]" in outputs[0]
+    assert len(set(outputs)) == 1
+
+
+def test_env_overlay(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("TEST_EXISTING", "existing")
+    runner = CliRunner(isolation_mode="context")
+    result = runner.invoke(app, ["env"])
+    assert result.output == "existing\n"
+    result = runner.invoke(app, ["env"], env={"TEST_EXISTING": None})
+    assert result.output == "unset\n"
+    result = runner.invoke(app, ["env"], env={"TEST_NEW": "new"})
+    assert result.output == "new\n"
+    assert "TEST_NEW" not in os.environ
+    assert os.environ["TEST_EXISTING"] == "existing"
+
+
+def test_real_environ_untouched():
+    runner = CliRunner(isolation_mode="context")
+    app_globals = typer.Typer()
+    environ = os.environ
+
+    @app_globals.command()
+    def main():
+        # Only Typer uses the isolated environment, os.environ is the real one
+        assert os.environ is environ
+        assert "TEST_OVERRIDE" not in os.environ
+        print("ok")
+        print("error", file=sys.stderr)
+
+    result = runner.invoke(app_globals, env={"TEST_OVERRIDE": "value"})
+    assert result.stdout == "ok\n", result.output
+    assert result.stderr == "error\n"
+
+
+def test_globals_restored():
+    stdout = sys.stdout
+    environ = os.environ
+    visible_prompt_func = termui.visible_prompt_func
+    runner = CliRunner(isolation_mode="context")
+    result = runner.invoke(app, ["hello", "Camila"], input="secret\n")
+    assert result.exit_code == 0
+    assert sys.stdout is stdout
+    assert os.environ is environ
+    assert termui.visible_prompt_func is visible_prompt_func
+
+
+def test_invalid_isolation_mode():
+    with pytest.raises(AssertionError, match="Unknown isolation mode: 'threads'"):
+        CliRunner(isolation_mode="threads")  # type: ignore[arg-type]
+
+
+counter = typer.Typer()
+calls: list[str] = []
+
+
+@counter.command()
+def count(name: str):
+    calls.append(name)
+    print(f"{name}: {len(calls)}")
+
+
+@counter.command()
+def fail():
+    raise ValueError("Failed")
+
+
+def test_invoke_many_builds_once(monkeypatch: pytest.MonkeyPatch):
+    built = []
+    get_command = typer.testing._get_command
+
+    def counting_get_command(app: typer.Typer):
+        built.append(app)
+        return get_command(app)
+
+    monkeypatch.setattr(typer.testing, "_get_command", counting_get_command)
+    runner = CliRunner()
+    results = runner.invoke_many(
+        app,
+        [
+            "hello Camila --password secret",
+            ["hello", "Carlos", "--password", "pw"],
+            {
+                "args": ["hello", "Sebastián"],
+                "input": "x\n",
+                "env": {"TEST_COLOR": "red"},
+            },
+        ],
+    )
+    assert len(built) == 1
+    assert [result.exit_code for result in results] == [0, 0, 0]
+    assert "Hello Camila, color none, password 6" in results[0].output
+    assert "Hello Carlos, color none, password 2" in results[1].output
+    assert "Hello Sebastián, color red, password 1" in results[2].output
+
+
+def test_invoke_many_processes():
+    calls.clear()
+    runner = CliRunner()
+    results = runner.invoke_many(
+        counter, [["count", f"item{index}"] for index in range(6)], processes=2
+    )
+    assert [result.exit_code for result in results] == [0] * 6
+    for index, result in enumerate(results):
+        assert result.output.startswith(f"item{index}: ")
+    # The global state is changed only in the worker processes
+    assert calls == []
+
+
+def test_invoke_many_processes_exception():
+    runner = CliRunner()
+    (result,) = runner.invoke_many(counter, ["fail"], processes=1)
+    assert result.exit_code == 1
+    assert isinstance(result.exception, ValueError)
+    assert result.exc_info is None
+
+
+big = typer.Typer()
+
+
+@big.command()
+def lines(count: int):
+    for index in range(count):
+        typer.echo(f"line {index}")
+    typer.echo("done", err=True)
+
+
+def test_max_output_bytes():
+    runner = CliRunner()
+    result = runner.invoke(big, ["1000"], max_output_bytes=20)
+    assert result.stdout.startswith("line 0\nlin\n[... ")
+    assert "bytes truncated ...]\n" in result.stdout
+    assert result.stdout.endswith("line 999\n")
+    assert result.stderr == "done\n"
+    small = runner.invoke(big, ["2"], max_output_bytes=100)
+    assert small.stdout == "line 0\nline 1\n"
+    assert small.output == "line 0\nline 1\ndone\n"
+
+
+def test_output_to_file():
+    runner = CliRunner()
+    result = runner.invoke(big, ["3"], output_to_file=True)
+    assert result.stdout == "line 0\nline 1\nline 2\n"
+    assert result.stderr == "done\n"
+    assert result.output == "line 0\nline 1\nline 2\ndone\n"
+    # Still readable after reading once
+    assert result.stdout_bytes == b"line 0\nline 1\nline 2\n"
+
+
+def test_on_output_without_mix():
+    chunks: list[tuple[str, bytes]] = []
+    runner = CliRunner()
+    result = runner.invoke(
+        big,
+        ["2"],
+        mix_output=False,
+        max_output_bytes=0,
+        on_output=lambda name, data: chunks.append((name, data)),
+    )
+    assert b"".join(data for name, data in chunks if name == "stdout") == (
+        b"line 0\nline 1\n"
+    )
+    assert chunks[-1] == ("stderr", b"done\n")
+    assert result.stderr == "\n[... 5 bytes truncated ...]\n"
+    with pytest.raises(ValueError, match="mix_output=False"):
+        result.output_bytes  # noqa: B018
+
+
+def test_output_options_conflict():
+    runner = CliRunner()
+    with pytest.raises(AssertionError, match="both limited in size and stored"):
+        runner.invoke(big, ["1"], max_output_bytes=10, output_to_file=True)
+
+
+def test_invoke_many_processes_output_options():
+    runner = CliRunner()
+    (result,) = runner.invoke_many(
+        big, [{"args": ["2"], "mix_output": False}], processes=1
+    )
+    assert result.stdout == "line 0\nline 1\n"
+    with pytest.raises(ValueError, match="was not captured"):
+        result.output_bytes  # noqa: B018
@@ -23,7 +23,7 @@ def test_traceback_rich():
             "_TYPER_STANDARD_TRACEBACK": "",
         },
     )
-    assert "return get_command(self)(*args, **kwargs)" not in result.stderr
+    assert "return self._get_command()(*args, **kwargs)" not in result.stderr
 
     assert "app()" not in result.stderr
     assert "print(name + 3)" in result.stderr
@@ -42,7 +42,7 @@ def test_standard_traceback_env_var(env_var: str):
         encoding="utf-8",
         env={**os.environ, env_var: "1"},
     )
-    assert "return get_command(self)(*args, **kwargs)" in result.stderr
+    assert "return self._get_command()(*args, **kwargs)" in result.stderr
 
     assert "app()" in result.stderr
     assert "print(name + 3)" in result.stderr
@@ -22,7 +22,7 @@ def test_traceback_rich_pretty_short_disable():
             "_TYPER_STANDARD_TRACEBACK": "",
         },
     )
-    assert "return get_command(self)(*args, **kwargs)" not in result.stderr
+    assert "return self._get_command()(*args, **kwargs)" not in result.stderr
 
     assert "app()" in result.stderr
     assert "print(name + 3)" in result.stderr
@@ -22,7 +22,7 @@ def test_rich_pretty_exceptions_disable():
             "_TYPER_STANDARD_TRACEBACK": "",
         },
     )
-    assert "return get_command(self)(*args, **kwargs)" in result.stderr
+    assert "return self._get_command()(*args, **kwargs)" in result.stderr
 
     assert "app()" in result.stderr
     assert "print(name + 3)" in result.stderr
@@ -3,6 +3,8 @@ from enum import Enum
 import pytest
 import typer
 from typer import _click
+from typer._types import TyperChoice
+from typer.core import TyperCommand, TyperOption
 from typer.testing import CliRunner
 
 app = typer.Typer(context_settings={"token_normalize_func": str.lower})
@@ -114,6 +116,68 @@ def test_enum_choice_missing_message() -> None:
     assert "morty" in result.output
 
 
+def test_choice_index_reused() -> None:
+    choice = TyperChoice([f"region-{i}" for i in range(5_000)])
+    ctx = _click.Context(TyperCommand(name="cmd"))
+    normalize_calls = []
+    original_normalize_choice = choice.normalize_choice
+
+    def counting_normalize_choice(choice, ctx):
+        normalize_calls.append(choice)
+        return original_normalize_choice(choice=choice, ctx=ctx)
+
+    choice.normalize_choice = counting_normalize_choice  # type: ignore[method-assign]
+    assert choice.convert("region-4999", None, ctx) == "region-4999"
+    assert choice.convert("region-0", None, ctx) == "region-0"
+    # The choices are only normalized once, then just each value
+    assert len(normalize_calls) == 5_000 + 2
+    with pytest.raises(
+        _click.exceptions.BadParameter, match="'region-x' is not one of"
+    ):
+        choice.convert("region-x", None, ctx)
+
+
+def test_choice_index_settings() -> None:
+    choice = TyperChoice(["Rick", "rick", "Morty"], case_sensitive=False)
+    ctx = _click.Context(TyperCommand(name="cmd"))
+    # The first choice wins when several are normalized to the same value
+    assert choice.convert("RICK", None, ctx) == "Rick"
+    choice.case_sensitive = True
+    assert choice.convert("rick", None, ctx) == "rick"
+    with pytest.raises(_click.exceptions.BadParameter):
+        choice.convert("RICK", None, ctx)
+    upper_ctx = _click.Context(TyperCommand(name="cmd"), token_normalize_func=str.upper)
+    assert choice.convert("morty", None, upper_ctx) == "Morty"
+    choice.choices = ("Summer",)
+    assert choice.convert("Summer", None, ctx) == "Summer"
+    with pytest.raises(_click.exceptions.BadParameter):
+        choice.convert("Rick", None, ctx)
+
+
+@pytest.mark.parametrize(
+    ("case_sensitive", "incomplete", "expected"),
+    [
+        (True, "re", ["red", "read", "reed"]),
+        (True, "Re", ["Red"]),
+        (True, "ree", ["reed"]),
+        (True, "x", []),
+        (True, "", ["red", "Red", "blue", "read", "reed"]),
+        (False, "RE", ["red", "Red", "read", "reed"]),
+        (False, "b", ["blue"]),
+    ],
+)
+def test_choice_shell_complete(
+    case_sensitive: bool, incomplete: str, expected: list[str]
+) -> None:
+    choice = TyperChoice(
+        ["red", "Red", "blue", "read", "reed"], case_sensitive=case_sensitive
+    )
+    ctx = _click.Context(TyperCommand(name="cmd"))
+    param = TyperOption(param_decls=["--color"], type=choice)
+    completions = choice.shell_complete(ctx, param, incomplete)
+    assert [item.value for item in completions] == expected
+
+
 def test_list() -> None:
     result = runner.invoke(
         app, ["hello-all-options", "--name", "Rick", "--name", "Morty"]
@@ -32,6 +32,13 @@ requires_completion_permission = pytest.mark.skipif(
     reason="Test requires permission to run completion installation tests",
 )
 
+# Timing comparisons are unreliable in the default parallel run, run them with
+# _TYPER_RUN_BENCHMARKS=1 pytest -p no:xdist tests/...
+benchmark = pytest.mark.skipif(
+    not getenv("_TYPER_RUN_BENCHMARKS", False),
+    reason="Benchmarks only run when requested with _TYPER_RUN_BENCHMARKS",
+)
+
 
 def strip_double_spaces(text: str) -> str:
     return re.sub(r" {2,}", " ", text)
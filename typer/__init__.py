@@ -14,11 +14,14 @@ from ._click.termui import progressbar as progressbar
 from ._click.termui import prompt as prompt
 from ._click.termui import secho as secho
 from ._click.termui import style as style
+from ._click.utils import buffered_output as buffered_output
 from ._click.utils import echo as echo
+from ._click.utils import flush_buffered_output as flush_buffered_output
 from ._click.utils import format_filename as format_filename
 from ._click.utils import get_app_dir as get_app_dir
 from ._click.utils import get_binary_stream as get_binary_stream
 from ._click.utils import get_text_stream as get_text_stream
+from ._parallel import parallel_map as parallel_map
 from .main import Typer as Typer
 from .main import launch as launch
 from .main import run as run
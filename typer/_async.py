@@ -0,0 +1,161 @@
+import asyncio
+import os
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from functools import update_wrapper
+from types import TracebackType
+from typing import Any, TypeVar
+
+from . import _click
+from ._click.globals import get_current_context
+
+T = TypeVar("T")
+
+LoopFactory = Callable[[], asyncio.AbstractEventLoop]
+
+# Set in the root command, to create the event loop of each invocation
+loop_factory_attr_name = "__typer_loop_factory__"
+_runner_meta_key = "typer.async_runner"
+# The frames of the event loop running a coroutine, between Typer and the user code.
+# Other asyncio frames, e.g. from `asyncio.wait_for()` in the user code, are kept
+_runner_frames = {
+    ("base_events.py", "run_until_complete"),
+    ("base_events.py", "run_forever"),
+    ("base_events.py", "_run_once"),
+    ("events.py", "_run"),
+    ("runners.py", "run"),
+    ("tasks.py", "__step"),
+    ("tasks.py", "__step_run_and_handle_result"),
+    ("tasks.py", "__wakeup"),
+}
+
+
+class _Runner:
+    """
+    Run awaitables on the same event loop, created the first time it's needed,
+    until it's closed. Like `asyncio.Runner`, available only in Python 3.11+.
+    """
+
+    def __init__(self, loop_factory: LoopFactory | None) -> None:
+        self._loop_factory = loop_factory or asyncio.new_event_loop
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def run(self, awaitable: Awaitable[T]) -> T:
+        if self._loop is None:
+            self._loop = self._loop_factory()
+            asyncio.set_event_loop(self._loop)
+        return self._loop.run_until_complete(awaitable)
+
+    def close(self) -> None:
+        loop = self._loop
+        if loop is None:
+            return
+        try:
+            _cancel_all_tasks(loop)
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.run_until_complete(loop.shutdown_default_executor())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+            self._loop = None
+
+
+def _cancel_all_tasks(loop: asyncio.AbstractEventLoop) -> None:
+    tasks = asyncio.all_tasks(loop)
+    if not tasks:
+        return
+    for task in tasks:
+        task.cancel()
+    loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+
+
+def _get_loop_factory(ctx: _click.Context | None) -> LoopFactory | None:
+    if ctx is None:
+        return None
+    return getattr(ctx.find_root().command, loop_factory_attr_name, None)
+
+
+def run(ctx: _click.Context | None, awaitable: Awaitable[T]) -> T:
+    """
+    Run `awaitable` on the event loop of the invocation of `ctx`, so that all the
+    async callbacks of the same invocation share it. The loop is closed with the
+    root context.
+    """
+    if ctx is None:
+        return run_once(ctx, awaitable)
+    root = ctx.find_root()
+    runner: _Runner | None = root.meta.get(_runner_meta_key)
+    if runner is None:
+        runner = _Runner(_get_loop_factory(root))
+        root.meta[_runner_meta_key] = runner
+        root.call_on_close(runner.close)
+    return runner.run(awaitable)
+
+
+def run_once(ctx: _click.Context | None, awaitable: Awaitable[T]) -> T:
+    """
+    Run `awaitable` on a new event loop, closed right after, e.g. for shell
+    completion, that runs after its context is closed.
+    """
+    runner = _Runner(_get_loop_factory(ctx))
+    try:
+        return runner.run(awaitable)
+    finally:
+        runner.close()
+
+
+def get_sync_callback(callback: Callable[..., Awaitable[T]]) -> Callable[..., T]:
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return run(get_current_context(silent=True), callback(*args, **kwargs))
+
+    update_wrapper(wrapper, callback)
+    return wrapper
+
+
+def _is_runner_frame(tb: TracebackType) -> bool:
+    code = tb.tb_frame.f_code
+    asyncio_dir = os.path.dirname(asyncio.__file__)
+    file_dir, file_name = os.path.split(code.co_filename)
+    return file_dir == asyncio_dir and (file_name, code.co_name) in _runner_frames
+
+
+def _strip_traceback(tb: TracebackType | None) -> TracebackType | None:
+    # Only the frames of the event loop right after _Runner.run, until the user code,
+    # so that an event loop started by the user code keeps all its frames
+    frames: list[TracebackType] = []
+    in_runner = False
+    while tb is not None:
+        if tb.tb_frame.f_code is _Runner.run.__code__:
+            in_runner = True
+        elif in_runner and _is_runner_frame(tb):
+            tb = tb.tb_next
+            continue
+        else:
+            in_runner = False
+        frames.append(tb)
+        tb = tb.tb_next
+    new_tb: TracebackType | None = None
+    for frame in reversed(frames):
+        new_tb = TracebackType(new_tb, frame.tb_frame, frame.tb_lasti, frame.tb_lineno)
+    return new_tb
+
+
+@contextmanager
+def runner_frames_stripped(exc: BaseException) -> Iterator[None]:
+    """
+    Remove the frames of the event loop running async commands from the tracebacks
+    of `exc` and its chained exceptions, and restore them at the end of the block.
+    """
+    original_tracebacks: list[tuple[BaseException, TracebackType | None]] = []
+    seen: set[int] = set()
+    current: BaseException | None = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        original_tracebacks.append((current, current.__traceback__))
+        current.__traceback__ = _strip_traceback(current.__traceback__)
+        current = current.__cause__ or current.__context__
+    try:
+        yield
+    finally:
+        for current, tb in original_tracebacks:
+            current.__traceback__ = tb
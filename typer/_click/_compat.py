@@ -4,6 +4,7 @@ import os
 import re
 import sys
 from collections.abc import Callable, Mapping, MutableMapping
+from contextvars import ContextVar
 from types import TracebackType
 from typing import (
     IO,
@@ -11,6 +12,7 @@ from typing import (
     BinaryIO,
     TextIO,
     cast,
+    overload,
 )
 from weakref import WeakKeyDictionary
 
@@ -20,6 +22,80 @@ auto_wrap_for_ansi: Callable[[TextIO], TextIO] | None = None
 _ansi_re = re.compile(r"\033\[[;?0-9]*[a-zA-Z]")
 
 
+class _Isolation:
+    """
+    The standard streams, environment overrides and input functions used instead
+    of the global ones in a context, e.g. by each invocation of
+    `CliRunner(isolation_mode="context")`. The real `sys.std*` and `os.environ`
+    are not changed. A `None` value in `env` removes the variable.
+    """
+
+    def __init__(
+        self,
+        *,
+        stdin: IO[Any],
+        stdout: IO[Any],
+        stderr: IO[Any],
+        env: Mapping[str, str | None],
+        visible_prompt_func: Callable[[str], str],
+        hidden_prompt_func: Callable[[str], str],
+        getchar: Callable[[bool], str],
+        should_strip_ansi: Callable[[IO[Any] | None, bool | None], bool],
+    ) -> None:
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self.env = env
+        self.visible_prompt_func = visible_prompt_func
+        self.hidden_prompt_func = hidden_prompt_func
+        self.getchar = getchar
+        self.should_strip_ansi = should_strip_ansi
+
+
+_current_isolation: ContextVar[_Isolation | None] = ContextVar(
+    "typer_isolation", default=None
+)
+
+
+def _get_std_stream(name: str) -> Any:
+    # The standard stream "stdin", "stdout" or "stderr" of the current context
+    isolation = _current_isolation.get()
+    if isolation is None:
+        return getattr(sys, name)
+    return getattr(isolation, name)
+
+
+@overload
+def getenv(key: str) -> str | None: ...
+
+
+@overload
+def getenv(key: str, default: str) -> str: ...
+
+
+def getenv(key: str, default: str | None = None) -> str | None:
+    """Like `os.getenv()`, with the environment overrides of the current context."""
+    isolation = _current_isolation.get()
+    if isolation is not None and key in isolation.env:
+        value = isolation.env[key]
+        return default if value is None else value
+    return os.environ.get(key, default)
+
+
+def get_environ() -> Mapping[str, str]:
+    """The environment variables, with the overrides of the current context."""
+    isolation = _current_isolation.get()
+    if isolation is None:
+        return os.environ
+    environ = dict(os.environ)
+    for key, value in isolation.env.items():
+        if value is None:
+            environ.pop(key, None)
+        else:
+            environ[key] = value
+    return environ
+
+
 def _make_text_stream(
     stream: BinaryIO,
     encoding: str | None,
@@ -267,45 +343,48 @@ def _force_correct_text_writer(
 
 
 def get_binary_stdin() -> BinaryIO:
-    reader = _find_binary_reader(sys.stdin)
+    reader = _find_binary_reader(_get_std_stream("stdin"))
     if reader is None:  # pragma: no cover
         raise RuntimeError("Was not able to determine binary stream for sys.stdin.")
     return reader
 
 
 def get_binary_stdout() -> BinaryIO:
-    writer = _find_binary_writer(sys.stdout)
+    writer = _find_binary_writer(_get_std_stream("stdout"))
     if writer is None:  # pragma: no cover
         raise RuntimeError("Was not able to determine binary stream for sys.stdout.")
     return writer
 
 
 def get_binary_stderr() -> BinaryIO:
-    writer = _find_binary_writer(sys.stderr)
+    writer = _find_binary_writer(_get_std_stream("stderr"))
     if writer is None:  # pragma: no cover
         raise RuntimeError("Was not able to determine binary stream for sys.stderr.")
     return writer
 
 
 def get_text_stdin(encoding: str | None = None, errors: str | None = None) -> TextIO:
-    rv = _get_windows_console_stream(sys.stdin, encoding, errors)
+    stream = _get_std_stream("stdin")
+    rv = _get_windows_console_stream(stream, encoding, errors)
     if rv is not None:
         return rv
-    return _force_correct_text_reader(sys.stdin, encoding, errors)
+    return _force_correct_text_reader(stream, encoding, errors)
 
 
 def get_text_stdout(encoding: str | None = None, errors: str | None = None) -> TextIO:
-    rv = _get_windows_console_stream(sys.stdout, encoding, errors)
+    stream = _get_std_stream("stdout")
+    rv = _get_windows_console_stream(stream, encoding, errors)
     if rv is not None:
         return rv
-    return _force_correct_text_writer(sys.stdout, encoding, errors)
+    return _force_correct_text_writer(stream, encoding, errors)
 
 
 def get_text_stderr(encoding: str | None = None, errors: str | None = None) -> TextIO:
-    rv = _get_windows_console_stream(sys.stderr, encoding, errors)
+    stream = _get_std_stream("stderr")
+    rv = _get_windows_console_stream(stream, encoding, errors)
     if rv is not None:
         return rv
-    return _force_correct_text_writer(sys.stderr, encoding, errors)
+    return _force_correct_text_writer(stream, encoding, errors)
 
 
 def _wrap_io_open(
@@ -449,9 +528,12 @@ def _is_jupyter_kernel_output(stream: IO[Any]) -> bool:
 
 
 def should_strip_ansi(stream: IO[Any] | None = None, color: bool | None = None) -> bool:
+    isolation = _current_isolation.get()
+    if isolation is not None:
+        return isolation.should_strip_ansi(stream, color)
     if color is None:
         if stream is None:
-            stream = sys.stdin
+            stream = _get_std_stream("stdin")
         return not isatty(stream) and not _is_jupyter_kernel_output(stream)
     return not color
 
@@ -551,9 +633,15 @@ def _make_cached_stream_func(
     return func
 
 
-_default_text_stdin = _make_cached_stream_func(lambda: sys.stdin, get_text_stdin)
-_default_text_stdout = _make_cached_stream_func(lambda: sys.stdout, get_text_stdout)
-_default_text_stderr = _make_cached_stream_func(lambda: sys.stderr, get_text_stderr)
+_default_text_stdin = _make_cached_stream_func(
+    lambda: _get_std_stream("stdin"), get_text_stdin
+)
+_default_text_stdout = _make_cached_stream_func(
+    lambda: _get_std_stream("stdout"), get_text_stdout
+)
+_default_text_stderr = _make_cached_stream_func(
+    lambda: _get_std_stream("stderr"), get_text_stderr
+)
 
 
 binary_streams: Mapping[str, Callable[[], BinaryIO]] = {
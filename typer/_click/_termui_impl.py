@@ -21,7 +21,7 @@ from ._compat import (
     isatty,
     term_len,
 )
-from .utils import echo
+from .utils import echo, flush_buffered_output
 
 V = TypeVar("V")
 
@@ -135,6 +135,7 @@ class ProgressBar(Generic[V]):
     def render_finish(self) -> None:
         if self.hidden or not self._is_atty:
             return
+        flush_buffered_output()
         self.file.write(AFTER_BAR)
         self.file.flush()
 
@@ -270,6 +271,7 @@ class ProgressBar(Generic[V]):
         if line != self._last_line:
             self._last_line = line
             echo(line, file=self.file, color=self.color, nl=False)
+            flush_buffered_output()
             self.file.flush()
 
     def make_step(self, n_steps: int) -> None:
@@ -1,6 +1,5 @@
 import enum
 import inspect
-import os
 from abc import ABC, abstractmethod
 from collections.abc import Callable, Iterator, Mapping, MutableMapping, Sequence
 from contextlib import AbstractContextManager, ExitStack, contextmanager
@@ -17,6 +16,7 @@ from typing import (
 )
 
 from . import types
+from ._compat import getenv
 from .exceptions import (
     Abort,
     BadParameter,
@@ -27,7 +27,7 @@ from .exceptions import (
 )
 from .formatting import HelpFormatter
 from .globals import pop_context, push_context
-from .parser import _OptionParser
+from .parser import _OptionParser, _ParserTable
 from .termui import style
 from .utils import echo, make_default_short_help
 
@@ -38,6 +38,9 @@ if TYPE_CHECKING:
 F = TypeVar("F", bound="Callable[..., Any]")
 V = TypeVar("V")
 
+# Compiled parsers kept for each command, one for each combination of settings
+_MAX_PARSER_TABLES = 16
+
 
 def _complete_visible_commands(
     ctx: "Context", incomplete: str
@@ -52,7 +55,7 @@ def _complete_visible_commands(
 
     for name in multi.list_commands(ctx):
         if name.startswith(incomplete):
-            command = multi.get_command(ctx, name)
+            command = multi._get_listed_command(ctx, name)
 
             if command is not None and not command.hidden:
                 yield name, command
@@ -93,13 +96,14 @@ def iter_params_for_processing(
     https://click.palletsprojects.com/en/stable/advanced/#callback-evaluation-order
     """
 
-    def sort_key(item: Parameter) -> tuple[bool, float]:
-        try:
-            idx: float = invocation_order.index(item)
-        except ValueError:
-            idx = float("inf")
+    # Index of the first invocation of each parameter, computed once instead of
+    # searching the invocation order for each declared parameter
+    first_invocation: dict[Parameter, int] = {}
+    for idx, item in enumerate(invocation_order):
+        first_invocation.setdefault(item, idx)
 
-        return not item.is_eager, idx
+    def sort_key(item: Parameter) -> tuple[bool, float]:
+        return not item.is_eager, first_invocation.get(item, float("inf"))
 
     return sorted(declaration_order, key=sort_key)
 
@@ -547,6 +551,7 @@ class Command(ABC):
         self.short_help = short_help
         self.add_help_option = add_help_option
         self._help_option: TyperOption | None = None
+        self._parser_tables: dict[tuple[Any, ...], _ParserTable] = {}
         self.no_args_is_help = no_args_is_help
         self.hidden = hidden
         self.deprecated = deprecated
@@ -616,10 +621,27 @@ class Command(ABC):
 
     def make_parser(self, ctx: Context) -> _OptionParser:
         """Creates the underlying option parser for this command."""
-        parser = _OptionParser(ctx)
-        for param in self.get_params(ctx):
-            param.add_to_parser(parser, ctx)
-        return parser
+        # The options are compiled once for each combination of the settings
+        # that change them, and reused by the parsers of later parses
+        key = (
+            tuple(self.params),
+            self.add_help_option,
+            tuple(ctx.help_option_names),
+            ctx.token_normalize_func,
+            ctx.allow_interspersed_args,
+            ctx.ignore_unknown_options,
+        )
+        table = self._parser_tables.get(key)
+        if table is None:
+            parser = _OptionParser(ctx)
+            for param in self.get_params(ctx):
+                param.add_to_parser(parser, ctx)
+            table = parser.compile()
+            if len(self._parser_tables) >= _MAX_PARSER_TABLES:
+                # E.g. a different token_normalize_func for each parse
+                self._parser_tables.clear()
+            self._parser_tables[key] = table
+        return _OptionParser(ctx, table=table)
 
     def get_help(self, ctx: Context) -> str:
         """Formats the help into a string and returns it."""
@@ -779,6 +801,19 @@ class Command(ABC):
                     if name.startswith(incomplete)
                 )
 
+        # avoid circular imports
+        from ..core import TyperGroup
+
+        while ctx.parent is not None:
+            ctx = ctx.parent
+
+            if isinstance(ctx.command, TyperGroup) and ctx.command.chain:
+                results.extend(
+                    CompletionItem(name, help=command.get_short_help_str())
+                    for name, command in _complete_visible_commands(ctx, incomplete)
+                    if name not in ctx._protected_args
+                )
+
         return results
 
     @abstractmethod
@@ -1023,13 +1058,13 @@ class Parameter(ABC):
             return None
 
         if isinstance(self.envvar, str):
-            rv = os.environ.get(self.envvar)
+            rv = getenv(self.envvar)
 
             if rv:
                 return rv
         else:
             for envvar in self.envvar:
-                rv = os.environ.get(envvar)
+                rv = getenv(envvar)
 
                 # Return the first non-empty value of the list of environment variables.
                 if rv:
@@ -1,11 +1,14 @@
 from collections.abc import Iterable, Iterator, Sequence
 from contextlib import contextmanager
+from contextvars import ContextVar
 
 from ._compat import term_len
 from .parser import _split_opt
 
 # Can force a width.  This is used by the test system
 FORCED_WIDTH: int | None = None
+# The same, only for the current context, so that tests can run concurrently
+forced_width_var: ContextVar[int | None] = ContextVar("forced_width", default=None)
 
 
 def measure_table(rows: Iterable[tuple[str, str]]) -> tuple[int, ...]:
@@ -109,7 +112,9 @@ class HelpFormatter:
         if width is None:
             import shutil
 
-            width = FORCED_WIDTH
+            width = forced_width_var.get()
+            if width is None:
+                width = FORCED_WIDTH
             if width is None:
                 width = max(min(shutil.get_terminal_size().columns, max_width) - 2, 50)
         self.width = width
@@ -200,10 +200,28 @@ class _ParsingState:
     def __init__(self, rargs: list[str]) -> None:
         self.opts: dict[str, Any] = {}
         self.largs: list[str] = []
-        self.rargs = rargs
+        # A deque, so that consuming arguments from the left, and pushing back
+        # the ones that weren't consumed, is O(1) instead of O(len(rargs))
+        self.rargs: deque[str] = deque(rargs)
         self.order: list[CoreParameter] = []
 
 
+class _ParserTable:
+    """The options and arguments of an `_OptionParser`, compiled once and
+    shared by the parsers of all the parses with the same settings.  It's not
+    modified after it's created, the state of each parse is only in
+    `_ParsingState`.
+    """
+
+    def __init__(self, parser: "_OptionParser") -> None:
+        self.allow_interspersed_args = parser.allow_interspersed_args
+        self.ignore_unknown_options = parser.ignore_unknown_options
+        self.short_opt = parser._short_opt
+        self.long_opt = parser._long_opt
+        self.opt_prefixes = frozenset(parser._opt_prefixes)
+        self.args = tuple(parser._args)
+
+
 class _OptionParser:
     """The option parser is an internal class that is ultimately used to
     parse options and arguments.  It's modelled after optparse and brings
@@ -215,7 +233,11 @@ class _OptionParser:
     types or defaults).
     """
 
-    def __init__(self, ctx: Union["Context", None] = None) -> None:
+    def __init__(
+        self,
+        ctx: Union["Context", None] = None,
+        table: _ParserTable | None = None,
+    ) -> None:
         self.ctx = ctx
         # This controls how the parser deals with interspersed arguments.
         # If this is set to `False`, the parser will stop on the first
@@ -236,6 +258,22 @@ class _OptionParser:
         self._long_opt: dict[str, _Option] = {}
         self._opt_prefixes = {"-", "--"}
         self._args: list[_Argument] = []
+        self._table = table
+
+        if table is not None:
+            self.allow_interspersed_args = table.allow_interspersed_args
+            self.ignore_unknown_options = table.ignore_unknown_options
+            # Shared with other parsers, not copied
+            self._short_opt = table.short_opt
+            self._long_opt = table.long_opt
+            self._opt_prefixes = set(table.opt_prefixes)
+            self._args = list(table.args)
+
+    def compile(self) -> _ParserTable:
+        """Returns the options and arguments added to this parser, to create
+        other parsers with them without adding them again.
+        """
+        return _ParserTable(self)
 
     def add_option(
         self,
@@ -254,6 +292,7 @@ class _OptionParser:
         The `obj` can be used to identify the option in the order list
         that is returned from the parser.
         """
+        assert self._table is None, "Can't add options to a compiled parser"
         opts = [_normalize_opt(opt, self.ctx) for opt in opts]
         option = _Option(obj, opts, dest, action=action, nargs=nargs, const=const)
         self._opt_prefixes.update(option.prefixes)
@@ -270,6 +309,7 @@ class _OptionParser:
         The `obj` can be used to identify the option in the order list
         that is returned from the parser.
         """
+        assert self._table is None, "Can't add arguments to a compiled parser"
         self._args.append(_Argument(obj, dest=dest, nargs=nargs))
 
     def parse_args(
@@ -292,18 +332,18 @@ class _OptionParser:
 
     def _process_args_for_args(self, state: _ParsingState) -> None:
         pargs, args = _unpack_args(
-            state.largs + state.rargs, [x.nargs for x in self._args]
+            [*state.largs, *state.rargs], [x.nargs for x in self._args]
         )
 
         for idx, arg in enumerate(self._args):
             arg.process(pargs[idx], state)
 
         state.largs = args
-        state.rargs = []
+        state.rargs = deque()
 
     def _process_args_for_options(self, state: _ParsingState) -> None:
         while state.rargs:
-            arg = state.rargs.pop(0)
+            arg = state.rargs.popleft()
             arglen = len(arg)
             # Double dashes always handled explicitly regardless of what
             # prefixes are valid.
@@ -314,7 +354,7 @@ class _OptionParser:
             elif self.allow_interspersed_args:
                 state.largs.append(arg)
             else:
-                state.rargs.insert(0, arg)
+                state.rargs.appendleft(arg)
                 return
 
         # Say this is the original argument list:
@@ -353,7 +393,7 @@ class _OptionParser:
             # branch.  This means that the inserted value will be fully
             # consumed.
             if explicit_value is not None:
-                state.rargs.insert(0, explicit_value)
+                state.rargs.appendleft(explicit_value)
 
             value = self._get_value_from_state(opt, option, state)
 
@@ -385,7 +425,7 @@ class _OptionParser:
                 # Any characters left in arg?  Pretend they're the
                 # next arg, and stop consuming characters of arg.
                 if i < len(arg):
-                    state.rargs.insert(0, arg[i:])
+                    state.rargs.appendleft(arg[i:])
                     stop = True
 
                 value = self._get_value_from_state(opt, option, state)
@@ -419,10 +459,9 @@ class _OptionParser:
                 f"Option {option_name!r} requires {msg}",
             )
         elif nargs == 1:
-            value = state.rargs.pop(0)
+            value = state.rargs.popleft()
         else:
-            value = tuple(state.rargs[:nargs])
-            del state.rargs[:nargs]
+            value = tuple(state.rargs.popleft() for _ in range(nargs))
 
         return value
 
@@ -437,22 +476,23 @@ class _OptionParser:
             long_opt = arg
         norm_long_opt = _normalize_opt(long_opt, self.ctx)
 
+        # If the long option matching would fail, we need to try with short
+        # options.  However there is a special rule which says, that if we
+        # have a two character options prefix (applies to "--foo" for
+        # instance), we do not dispatch to the short option code and will
+        # instead raise the no option error.  This is checked upfront, so
+        # that short options like "-n5" don't build a NoSuchOption error
+        # (looking for close matches) each time.
+        if norm_long_opt not in self._long_opt and arg[:2] not in self._opt_prefixes:
+            self._match_short_opt(arg, state)
+            return
+
         # At this point we will match the (assumed) long option through
         # the long option matching code.  Note that this allows options
         # like "-foo" to be matched as long options.
         try:
             self._match_long_opt(norm_long_opt, explicit_value, state)
         except NoSuchOption:
-            # At this point the long option matching failed, and we need
-            # to try with short options.  However there is a special rule
-            # which says, that if we have a two character options prefix
-            # (applies to "--foo" for instance), we do not dispatch to the
-            # short option code and will instead raise the no option
-            # error.
-            if arg[:2] not in self._opt_prefixes:
-                self._match_short_opt(arg, state)
-                return
-
             if not self.ignore_unknown_options:
                 raise
 
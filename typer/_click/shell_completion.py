@@ -247,17 +247,39 @@ def _resolve_context(
             command = ctx.command
 
             if isinstance(command, TyperGroup):
-                # if not command.chain:
-                name, cmd, args = command.resolve_command(ctx, args)
+                if not command.chain:
+                    name, cmd, args = command.resolve_command(ctx, args)
+
+                    if cmd is None:
+                        return ctx
+
+                    with cmd.make_context(
+                        name, args, parent=ctx, resilient_parsing=True
+                    ) as sub_ctx:
+                        ctx = sub_ctx
+                        args = ctx._protected_args + ctx.args
+                else:
+                    sub_ctx = ctx
+
+                    while args:
+                        name, cmd, args = command.resolve_command(ctx, args)
+
+                        if cmd is None:
+                            return ctx
+
+                        with cmd.make_context(
+                            name,
+                            args,
+                            parent=ctx,
+                            allow_extra_args=True,
+                            allow_interspersed_args=False,
+                            resilient_parsing=True,
+                        ) as sub_sub_ctx:
+                            sub_ctx = sub_sub_ctx
+                            args = sub_ctx.args
 
-                if cmd is None:
-                    return ctx
-
-                with cmd.make_context(
-                    name, args, parent=ctx, resilient_parsing=True
-                ) as sub_ctx:
                     ctx = sub_ctx
-                    args = ctx._protected_args + ctx.args
+                    args = [*sub_ctx._protected_args, *sub_ctx.args]
             else:  # pragma: no cover
                 break
 
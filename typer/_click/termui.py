@@ -3,10 +3,11 @@ from collections.abc import Callable, Iterable
 from contextlib import AbstractContextManager
 from typing import IO, TYPE_CHECKING, Any, AnyStr, TextIO, TypeVar, overload
 
+from ._compat import _current_isolation
 from .exceptions import Abort, UsageError
 from .globals import resolve_color_default
 from .types import ParamType, convert_type
-from .utils import LazyFile, echo
+from .utils import LazyFile, echo, flush_buffered_output
 
 if TYPE_CHECKING:
     from ._termui_impl import ProgressBar
@@ -45,6 +46,17 @@ def hidden_prompt_func(prompt: str) -> str:
     return getpass.getpass(prompt)
 
 
+def _get_prompt_func(hide_input: bool) -> Callable[[str], str]:
+    isolation = _current_isolation.get()
+    if isolation is not None:
+        return (
+            isolation.hidden_prompt_func
+            if hide_input
+            else isolation.visible_prompt_func
+        )
+    return hidden_prompt_func if hide_input else visible_prompt_func
+
+
 def _build_prompt(
     text: str,
     suffix: str,
@@ -91,11 +103,12 @@ def prompt(
     """
 
     def prompt_func(text: str) -> str:
-        f = hidden_prompt_func if hide_input else visible_prompt_func
+        f = _get_prompt_func(hide_input)
         try:
             # Write the prompt separately so that we get nice
             # coloring through colorama on Windows
             echo(text[:-1], nl=False, err=err)
+            flush_buffered_output()
             # Echo the last character to stdout to work around an issue where
             # readline causes backspace to clear the whole line.
             return f(text[-1:])
@@ -173,9 +186,10 @@ def confirm(
             # Write the prompt separately so that we get nice
             # coloring through colorama on Windows
             echo(prompt[:-1], nl=False, err=err)
+            flush_buffered_output()
             # Echo the last character to stdout to work around an issue where
             # readline causes backspace to clear the whole line.
-            value = visible_prompt_func(prompt[-1:]).lower().strip()
+            value = _get_prompt_func(False)(prompt[-1:]).lower().strip()
         except (KeyboardInterrupt, EOFError):  # pragma: no cover
             raise Abort() from None
         if value in ("y", "yes"):
@@ -416,6 +430,10 @@ def getchar(echo: bool = False) -> str:
     """
     global _getchar
 
+    flush_buffered_output()
+    isolation = _current_isolation.get()
+    if isolation is not None:
+        return isolation.getchar(echo)
     if _getchar is None:
         from ._termui_impl import getchar as f
 
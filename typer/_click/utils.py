@@ -1,7 +1,11 @@
+import contextlib
 import os
 import re
 import sys
+import threading
+import time
 from collections.abc import Callable, Iterable, Iterator
+from contextvars import ContextVar
 from functools import update_wrapper
 from types import ModuleType, TracebackType
 from typing import (
@@ -23,6 +27,7 @@ from ._compat import (
     _find_binary_writer,
     auto_wrap_for_ansi,
     binary_streams,
+    getenv,
     open_stream,
     should_strip_ansi,
     strip_ansi,
@@ -189,6 +194,150 @@ class LazyFile:
         return iter(self._f)  # type: ignore
 
 
+class _EchoBuffer:
+    """The text written by `echo` in `buffered_output`, not written to its
+    stream yet.
+    """
+
+    def __init__(self, max_size: int, max_delay: float) -> None:
+        self.max_size = max_size
+        self.max_delay = max_delay
+        self.file: IO[Any] | None = None
+        self.parts: list[str] = []
+        self.size = 0
+        self.started = 0.0
+        # A single thread for the whole block writes the text after max_delay even
+        # if nothing else is written, e.g. while the command waits for something
+        self.thread: threading.Thread | None = None
+        self.closed = False
+        # An error writing in that thread, e.g. a broken pipe, raised by the next
+        # write or at the end of the block, in the thread of the command
+        self.error: OSError | None = None
+        self.condition = threading.Condition()
+        # Whether to strip ANSI codes, by stream and color
+        self.strip_ansi: dict[tuple[int, bool | None], tuple[IO[Any], bool]] = {}
+
+    def should_strip_ansi(self, file: IO[Any], color: bool | None) -> bool:
+        key = (id(file), color)
+        cached = self.strip_ansi.get(key)
+        if cached is None or cached[0] is not file:
+            cached = (file, should_strip_ansi(file, resolve_color_default(color)))
+            self.strip_ansi[key] = cached
+        return cached[1]
+
+    def write(self, file: IO[Any], text: str) -> None:
+        with self.condition:
+            self._raise_error()
+            if file is not self.file:
+                # Keep the order of the writes to different streams
+                self._flush()
+                self.file = file
+                self.started = time.monotonic()
+                if self.max_delay > 0:
+                    if self.thread is None:
+                        self.thread = threading.Thread(
+                            target=self._flush_after_delay, daemon=True
+                        )
+                        self.thread.start()
+                    self.condition.notify()
+            self.parts.append(text)
+            self.size += len(text)
+            if (
+                self.size >= self.max_size
+                or time.monotonic() - self.started >= self.max_delay
+            ):
+                self._flush()
+
+    def flush(self) -> None:
+        with self.condition:
+            self._raise_error()
+            self._flush()
+
+    def close(self) -> None:
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        if self.thread is not None:
+            self.thread.join()
+        self.flush()
+
+    def _raise_error(self) -> None:
+        error = self.error
+        if error is not None:
+            self.error = None
+            raise error
+
+    def _flush_after_delay(self) -> None:
+        with self.condition:
+            while not self.closed:
+                if self.file is None:
+                    # Nothing buffered, wait for the next text
+                    self.condition.wait()
+                    continue
+                remaining = self.started + self.max_delay - time.monotonic()
+                if remaining > 0:
+                    self.condition.wait(remaining)
+                    continue
+                try:
+                    self._flush()
+                except OSError as e:
+                    self.error = e
+                    return
+
+    def _flush(self) -> None:
+        file = self.file
+        if file is None:
+            return
+        text = "".join(self.parts)
+        self.file = None
+        self.parts = []
+        self.size = 0
+        file.write(text)
+        file.flush()
+
+
+_echo_buffer: ContextVar[_EchoBuffer | None] = ContextVar("echo_buffer", default=None)
+
+
+@contextlib.contextmanager
+def buffered_output(
+    max_size: int = 64 * 1024, max_delay: float = 0.1
+) -> Iterator[None]:
+    """Buffer the text written with `echo` in this block, to write it to its
+    stream in bigger chunks instead of writing and flushing on each call.
+    This makes printing lots of lines much faster.
+
+    The buffer is written when it has ``max_size`` characters, ``max_delay``
+    seconds after its first text (even if nothing else is written, e.g. while
+    the command waits), when text is written to a different stream, before
+    prompting, and at the end of the block.
+
+    Whether to strip ANSI codes is decided only once for each stream.
+
+    Text written to the streams in any other way, e.g. with `print`, is not
+    buffered, and could be shown before the text buffered before it. Call
+    `flush_buffered_output` before that.
+    """
+    if _echo_buffer.get() is not None:
+        # Already buffered by an outer block
+        yield
+        return
+    buffer = _EchoBuffer(max_size=max_size, max_delay=max_delay)
+    token = _echo_buffer.set(buffer)
+    try:
+        yield
+    finally:
+        _echo_buffer.reset(token)
+        buffer.close()
+
+
+def flush_buffered_output() -> None:
+    """Write the text buffered by `buffered_output`, if there's any."""
+    buffer = _echo_buffer.get()
+    if buffer is not None:
+        buffer.flush()
+
+
 def echo(
     message: Any | None = None,
     file: IO[Any] | None = None,
@@ -209,7 +358,7 @@ def echo(
     -   Supports colors and styles on Windows.
     -   Removes ANSI color and style codes if the output does not look
         like an interactive terminal.
-    -   Always flushes the output.
+    -   Always flushes the output, unless it's in `buffered_output`.
     """
     if file is None:
         if err:
@@ -235,6 +384,16 @@ def echo(
         else:
             out += b"\n"
 
+    buffer = _echo_buffer.get()
+    if buffer is not None:
+        if isinstance(out, str) and out:
+            strip = buffer.should_strip_ansi(file, color)
+            # On Windows, the colors need the stream wrapped for each write
+            if strip or not WIN:
+                buffer.write(file, strip_ansi(out) if strip else out)
+                return
+        buffer.flush()
+
     if not out:
         file.flush()
         return
@@ -352,7 +511,7 @@ def get_app_dir(app_name: str, roaming: bool = True, force_posix: bool = False)
     """
     if WIN:
         key = "APPDATA" if roaming else "LOCALAPPDATA"
-        folder = os.environ.get(key)
+        folder = getenv(key)
         if folder is None:
             folder = os.path.expanduser("~")
         return os.path.join(folder, app_name)
@@ -363,7 +522,7 @@ def get_app_dir(app_name: str, roaming: bool = True, force_posix: bool = False)
             os.path.expanduser("~/Library/Application Support"), app_name
         )
     return os.path.join(
-        os.environ.get("XDG_CONFIG_HOME", os.path.expanduser("~/.config")),
+        getenv("XDG_CONFIG_HOME", os.path.expanduser("~/.config")),
         _posixify(app_name),
     )
 
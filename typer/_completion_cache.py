@@ -0,0 +1,107 @@
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+from ._click.utils import get_app_dir
+
+# The oldest entries are removed when there are more
+MAX_ENTRIES = 256
+
+# A completion item, its value and help
+Completion = tuple[str, str | None]
+
+
+def get_cache_path(prog_name: str) -> Path:
+    # A file for each program, so that apps don't evict the entries of each other
+    name = "".join(c if c.isalnum() or c in "-_." else "_" for c in prog_name)
+    return Path(get_app_dir("typer")) / "completions" / f"{name or '_'}.json"
+
+
+def _get_key(
+    command_path: str, param_name: str, inputs: Any, incomplete: str | None
+) -> str:
+    return json.dumps(
+        [command_path, param_name, inputs, incomplete], default=str, sort_keys=True
+    )
+
+
+def _load_entries(path: Path) -> dict[str, Any]:
+    try:
+        with path.open(encoding="utf-8") as f:
+            entries = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(entries, dict):
+        return {}
+    return entries
+
+
+def get_cached_completions(
+    *,
+    prog_name: str,
+    command_path: str,
+    param_name: str,
+    inputs: Any,
+    incomplete: str | None,
+    ttl: float,
+) -> list[Completion] | None:
+    """
+    Return the completions cached in the last `ttl` seconds for the same `inputs`
+    (the other values in the command line) and `incomplete`, as the function
+    returned them, or `None` if there are none.
+
+    `incomplete` is `None` when the function doesn't receive it, then the same
+    completions are used for any incomplete value.
+    """
+    entries = _load_entries(get_cache_path(prog_name))
+    entry = entries.get(_get_key(command_path, param_name, inputs, incomplete))
+    if not isinstance(entry, dict) or time.time() - entry.get("time", 0) > ttl:
+        return None
+    return [(value, help) for value, help in entry.get("items", [])]
+
+
+def save_completions(
+    *,
+    prog_name: str,
+    command_path: str,
+    param_name: str,
+    inputs: Any,
+    incomplete: str | None,
+    ttl: float,
+    completions: list[Completion],
+) -> None:
+    path = get_cache_path(prog_name)
+    entries = _load_entries(path)
+    now = time.time()
+    # Expired entries of this parameter are not used anymore
+    entries = {
+        key: entry
+        for key, entry in entries.items()
+        if isinstance(entry, dict)
+        and (
+            now - entry.get("time", 0) <= ttl
+            or json.loads(key)[:2] != [command_path, param_name]
+        )
+    }
+    entries[_get_key(command_path, param_name, inputs, incomplete)] = {
+        "time": now,
+        "items": completions,
+    }
+    if len(entries) > MAX_ENTRIES:
+        newest = sorted(entries.items(), key=lambda item: item[1].get("time", 0))
+        entries = dict(newest[-MAX_ENTRIES:])
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tmp_path.open("w", encoding="utf-8") as f:
+            json.dump(entries, f, separators=(",", ":"))
+        # Atomic, concurrent completions never read a partially written cache
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is only an optimization, completion works without it
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
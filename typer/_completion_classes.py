@@ -1,10 +1,10 @@
 import importlib.util
-import os
 import re
 import sys
 from typing import Any
 
 from . import _click
+from ._click._compat import get_environ, getenv
 from ._click.shell_completion import CompletionItem, ShellComplete, add_completion_class
 from ._click.shell_completion import split_arg_string as click_split_arg_string
 from ._completion_shared import (
@@ -37,8 +37,8 @@ class BashComplete(ShellComplete):
         }
 
     def get_completion_args(self) -> tuple[list[str], str]:
-        cwords = click_split_arg_string(os.environ["COMP_WORDS"])
-        cword = int(os.environ["COMP_CWORD"])
+        cwords = click_split_arg_string(get_environ()["COMP_WORDS"])
+        cword = int(get_environ()["COMP_CWORD"])
         args = cwords[1:cword]
 
         try:
@@ -107,7 +107,7 @@ class ZshComplete(ShellComplete):
         }
 
     def get_completion_args(self) -> tuple[list[str], str]:
-        completion_args = os.getenv("_TYPER_COMPLETE_ARGS", "")
+        completion_args = getenv("_TYPER_COMPLETE_ARGS", "")
         cwords = click_split_arg_string(completion_args)
         args = cwords[1:]
         if args and not completion_args.endswith(" "):
@@ -158,7 +158,7 @@ class FishComplete(ShellComplete):
         }
 
     def get_completion_args(self) -> tuple[list[str], str]:
-        completion_args = os.getenv("_TYPER_COMPLETE_ARGS", "")
+        completion_args = getenv("_TYPER_COMPLETE_ARGS", "")
         cwords = click_split_arg_string(completion_args)
         args = cwords[1:]
         if args and not completion_args.endswith(" "):
@@ -182,7 +182,7 @@ class FishComplete(ShellComplete):
             return f"{item.value}"
 
     def complete(self) -> str:
-        complete_action = os.getenv("_TYPER_COMPLETE_FISH_ACTION", "")
+        complete_action = getenv("_TYPER_COMPLETE_FISH_ACTION", "")
         args, incomplete = self.get_completion_args()
         completions = self.get_completions(args, incomplete)
         show_args = [self.format_completion(item) for item in completions]
@@ -211,8 +211,8 @@ class PowerShellComplete(ShellComplete):
         }
 
     def get_completion_args(self) -> tuple[list[str], str]:
-        completion_args = os.getenv("_TYPER_COMPLETE_ARGS", "")
-        incomplete = os.getenv("_TYPER_COMPLETE_WORD_TO_COMPLETE", "")
+        completion_args = getenv("_TYPER_COMPLETE_ARGS", "")
+        incomplete = getenv("_TYPER_COMPLETE_WORD_TO_COMPLETE", "")
         cwords = click_split_arg_string(completion_args)
         args = cwords[1:-1] if incomplete else cwords[1:]
         return args, incomplete
@@ -1,13 +1,16 @@
-import os
 import re
+import shlex
 import subprocess
+import sys
 from enum import Enum
 from pathlib import Path
 
 import shellingham
 
 from . import _click
+from ._click._compat import getenv
 from ._click.globals import get_current_context
+from .utils import parse_boolean_env_var
 
 
 class Shells(str, Enum):
@@ -64,6 +67,32 @@ $scriptblock = {
 Register-ArgumentCompleter -Native -CommandName %(prog_name)s -ScriptBlock $scriptblock
 """
 
+# Used when TYPER_COMPLETION_SERVER is enabled, the completion client talks to an
+# instance of the app kept running in the background instead of starting it each time
+COMPLETION_SCRIPT_BASH_SERVER = """
+%(complete_func)s() {
+    local IFS=$'\n'
+    COMPREPLY=( $( env COMP_WORDS="${COMP_WORDS[*]}" \\
+                   COMP_CWORD=$COMP_CWORD \\
+                   %(autocomplete_var)s=complete_bash %(client)s $1 ) )
+    return 0
+}
+
+complete -o default -F %(complete_func)s %(prog_name)s
+"""
+
+COMPLETION_SCRIPT_ZSH_SERVER = """
+#compdef %(prog_name)s
+
+%(complete_func)s() {
+  eval $(env _TYPER_COMPLETE_ARGS="${words[1,$CURRENT]}" %(autocomplete_var)s=complete_zsh %(client)s %(prog_name)s)
+}
+
+compdef %(complete_func)s %(prog_name)s
+"""
+
+COMPLETION_SCRIPT_FISH_SERVER = 'complete --command %(prog_name)s --no-files --arguments "(env %(autocomplete_var)s=complete_fish _TYPER_COMPLETE_FISH_ACTION=get-args _TYPER_COMPLETE_ARGS=(commandline -cp) %(client)s %(prog_name)s)" --condition "env %(autocomplete_var)s=complete_fish _TYPER_COMPLETE_FISH_ACTION=is-args _TYPER_COMPLETE_ARGS=(commandline -cp) %(client)s %(prog_name)s"'
+
 _completion_scripts = {
     "bash": COMPLETION_SCRIPT_BASH,
     "zsh": COMPLETION_SCRIPT_ZSH,
@@ -72,27 +101,83 @@ _completion_scripts = {
     "pwsh": COMPLETION_SCRIPT_POWER_SHELL,
 }
 
+_completion_server_scripts = {
+    "bash": COMPLETION_SCRIPT_BASH_SERVER,
+    "zsh": COMPLETION_SCRIPT_ZSH_SERVER,
+    "fish": COMPLETION_SCRIPT_FISH_SERVER,
+}
+
 # TODO: Probably refactor this, copied from Click 7.x
 _invalid_ident_char_re = re.compile(r"[^a-zA-Z0-9_]")
 
 
-def get_completion_script(*, prog_name: str, complete_var: str, shell: str) -> str:
+def _use_completion_server() -> bool:
+    return parse_boolean_env_var(getenv("TYPER_COMPLETION_SERVER"), default=False)
+
+
+def _get_server_client_command(complete_var: str) -> str:
+    from . import _server_client
+
+    return " ".join(
+        shlex.quote(part)
+        for part in (
+            sys.executable,
+            "-S",
+            "-E",
+            _server_client.__file__,
+            complete_var,
+        )
+    )
+
+
+def _use_static_completion() -> bool:
+    return parse_boolean_env_var(getenv("TYPER_COMPLETION_STATIC"), default=False)
+
+
+def get_completion_script(
+    *,
+    prog_name: str,
+    complete_var: str,
+    shell: str,
+    cli: _click.Command | None = None,
+) -> str:
     cf_name = _invalid_ident_char_re.sub("", prog_name.replace("-", "_"))
     script = _completion_scripts.get(shell)
     if script is None:
         _click.echo(f"Shell {shell} not supported.", err=True)
         raise _click.exceptions.Exit(1)
-    return (
-        script
-        % {
-            "complete_func": f"_{cf_name}_completion",
-            "prog_name": prog_name,
-            "autocomplete_var": complete_var,
-        }
-    ).strip()
+    script_vars = {
+        "complete_func": f"_{cf_name}_completion",
+        "prog_name": prog_name,
+        "autocomplete_var": complete_var,
+    }
+    # How the program is called to complete, in the static scripts only for
+    # parameters with custom completion
+    dynamic_prog = "$1" if shell == "bash" else prog_name
+    if _use_completion_server() and shell in _completion_server_scripts:
+        script = _completion_server_scripts[shell]
+        script_vars["client"] = _get_server_client_command(complete_var)
+        dynamic_prog = f"{script_vars['client']} {dynamic_prog}"
+    if cli is not None and _use_static_completion():
+        from ._completion_static import get_static_completion_script
+
+        static_script = get_static_completion_script(
+            cli=cli,
+            shell=shell,
+            script_vars={**script_vars, "dynamic_prog": dynamic_prog},
+        )
+        if static_script is not None:
+            return static_script.strip()
+    return (script % script_vars).strip()
 
 
-def install_bash(*, prog_name: str, complete_var: str, shell: str) -> Path:
+def install_bash(
+    *,
+    prog_name: str,
+    complete_var: str,
+    shell: str,
+    cli: _click.Command | None = None,
+) -> Path:
     # Ref: https://github.com/scop/bash-completion#faq
     # It seems bash-completion is the official completion system for bash:
     # Ref: https://www.gnu.org/software/bash/manual/html_node/A-Programmable-Completion-Example.html
@@ -112,13 +197,19 @@ def install_bash(*, prog_name: str, complete_var: str, shell: str) -> Path:
     # Install completion
     completion_path.parent.mkdir(parents=True, exist_ok=True)
     script_content = get_completion_script(
-        prog_name=prog_name, complete_var=complete_var, shell=shell
+        prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
     )
     completion_path.write_text(script_content)
     return completion_path
 
 
-def install_zsh(*, prog_name: str, complete_var: str, shell: str) -> Path:
+def install_zsh(
+    *,
+    prog_name: str,
+    complete_var: str,
+    shell: str,
+    cli: _click.Command | None = None,
+) -> Path:
     # Setup Zsh and load ~/.zfunc
     zshrc_path = Path.home() / ".zshrc"
     zshrc_path.parent.mkdir(parents=True, exist_ok=True)
@@ -140,24 +231,36 @@ def install_zsh(*, prog_name: str, complete_var: str, shell: str) -> Path:
     path_obj = Path.home() / f".zfunc/_{prog_name}"
     path_obj.parent.mkdir(parents=True, exist_ok=True)
     script_content = get_completion_script(
-        prog_name=prog_name, complete_var=complete_var, shell=shell
+        prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
     )
     path_obj.write_text(script_content)
     return path_obj
 
 
-def install_fish(*, prog_name: str, complete_var: str, shell: str) -> Path:
+def install_fish(
+    *,
+    prog_name: str,
+    complete_var: str,
+    shell: str,
+    cli: _click.Command | None = None,
+) -> Path:
     path_obj = Path.home() / f".config/fish/completions/{prog_name}.fish"
     parent_dir: Path = path_obj.parent
     parent_dir.mkdir(parents=True, exist_ok=True)
     script_content = get_completion_script(
-        prog_name=prog_name, complete_var=complete_var, shell=shell
+        prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
     )
     path_obj.write_text(f"{script_content}\n")
     return path_obj
 
 
-def install_powershell(*, prog_name: str, complete_var: str, shell: str) -> Path:
+def install_powershell(
+    *,
+    prog_name: str,
+    complete_var: str,
+    shell: str,
+    cli: _click.Command | None = None,
+) -> Path:
     subprocess.run(
         [
             shell,
@@ -193,7 +296,7 @@ def install_powershell(*, prog_name: str, complete_var: str, shell: str) -> Path
     parent_dir: Path = path_obj.parent
     parent_dir.mkdir(parents=True, exist_ok=True)
     script_content = get_completion_script(
-        prog_name=prog_name, complete_var=complete_var, shell=shell
+        prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
     )
     with path_obj.open(mode="a") as f:
         f.write(f"{script_content}\n")
@@ -204,32 +307,33 @@ def install(
     shell: str | None = None,
     prog_name: str | None = None,
     complete_var: str | None = None,
+    cli: _click.Command | None = None,
 ) -> tuple[str, Path]:
     prog_name = prog_name or get_current_context().find_root().info_name
     assert prog_name
     if complete_var is None:
         complete_var = "_{}_COMPLETE".format(prog_name.replace("-", "_").upper())
-    test_disable_detection = os.getenv("_TYPER_COMPLETE_TEST_DISABLE_SHELL_DETECTION")
+    test_disable_detection = getenv("_TYPER_COMPLETE_TEST_DISABLE_SHELL_DETECTION")
     if shell is None and not test_disable_detection:
         shell = _get_shell_name()
     if shell == "bash":
         installed_path = install_bash(
-            prog_name=prog_name, complete_var=complete_var, shell=shell
+            prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
         )
         return shell, installed_path
     elif shell == "zsh":
         installed_path = install_zsh(
-            prog_name=prog_name, complete_var=complete_var, shell=shell
+            prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
         )
         return shell, installed_path
     elif shell == "fish":
         installed_path = install_fish(
-            prog_name=prog_name, complete_var=complete_var, shell=shell
+            prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
         )
         return shell, installed_path
     elif shell in {"powershell", "pwsh"}:
         installed_path = install_powershell(
-            prog_name=prog_name, complete_var=complete_var, shell=shell
+            prog_name=prog_name, complete_var=complete_var, shell=shell, cli=cli
         )
         return shell, installed_path
     else:
@@ -0,0 +1,464 @@
+"""
+Completion scripts that don't need to run the program for each TAB.
+
+The command tree is walked once, when the script is generated, and everything
+that is known in advance (subcommands, options, choices, files and directories) is
+written in the script itself. The program is only called to complete parameters
+with custom completion, e.g. with `autocompletion`.
+"""
+
+import re
+import shlex
+from collections.abc import Callable
+
+from . import _click
+from ._click import types
+from ._types import TyperChoice
+from .core import TyperArgument, TyperGroup, TyperOption
+from .models import TyperPath
+
+# Words that can be written in a script and split by spaces without any quoting
+_safe_word_re = re.compile(r"^[\w.,:@%+=/-]+$")
+
+# Each entry is a key, its value, and whether the key is a prefix, e.g. for the
+# positions taken by an argument with nargs=-1
+SpecEntry = tuple[str, str, bool]
+
+
+class _UnsupportedCommand(Exception):
+    pass
+
+
+def _get_value_kind(param: _click.Parameter) -> str:
+    param_type = param.type
+    if param._custom_shell_complete is not None:
+        return "dynamic"
+    if isinstance(param_type, TyperChoice):
+        choices = [str(choice) for choice in param_type.choices]
+        if not param_type.case_sensitive or not all(
+            _safe_word_re.match(choice) for choice in choices
+        ):
+            return "dynamic"
+        return " ".join(["choices", *choices])
+    if isinstance(param_type, TyperPath):
+        if param_type.dir_okay and not param_type.file_okay:
+            return "dir"
+        return "file"
+    if isinstance(param_type, types.File):
+        return "file"
+    if type(param_type).shell_complete is not types.ParamType.shell_complete:
+        # A custom type with its own completion
+        return "dynamic"
+    return ""
+
+
+def _add_command_spec(
+    command: _click.Command, ctx: _click.Context, path: str, spec: list[SpecEntry]
+) -> None:
+    option_names = []
+    position = 0
+    for param in command.get_params(ctx):
+        if isinstance(param, TyperOption):
+            if param.hidden:
+                continue
+            nargs = 0 if param.is_flag or param.count else param.nargs
+            kind = _get_value_kind(param) if nargs else ""
+            for name in [*param.opts, *param.secondary_opts]:
+                if not _safe_word_re.match(name):
+                    raise _UnsupportedCommand(name)
+                option_names.append(name)
+                spec.append((f"{path}|nargs|{name}", str(nargs), False))
+                if kind:
+                    spec.append((f"{path}|values|{name}", kind, False))
+        elif isinstance(param, TyperArgument) and position >= 0:
+            kind = _get_value_kind(param)
+            if param.nargs < 0:
+                spec.append((f"{path}|argument|", kind, True))
+                # The rest of the positions are taken by this argument
+                position = -1
+                continue
+            for _ in range(param.nargs):
+                spec.append((f"{path}|argument|{position}", kind, False))
+                position += 1
+    spec.append((f"{path}|options|", " ".join(option_names), False))
+    if not isinstance(command, TyperGroup):
+        return
+    visible_names = []
+    for name in command.list_commands(ctx):
+        sub_command = command.get_command(ctx, name)
+        if sub_command is None:
+            continue
+        if not _safe_word_re.match(name):
+            raise _UnsupportedCommand(name)
+        # Hidden commands are not listed, but their parameters are still completed
+        if not sub_command.hidden:
+            visible_names.append(name)
+        spec.append((f"{path}|command|{name}", "1", False))
+        sub_ctx = _click.Context(sub_command, info_name=name, parent=ctx)
+        sub_path = f"{path} {name}" if path else name
+        _add_command_spec(sub_command, sub_ctx, sub_path, spec)
+    spec.append((f"{path}|commands|", " ".join(visible_names), False))
+
+
+def get_completion_spec(cli: _click.Command, prog_name: str) -> list[SpecEntry] | None:
+    """
+    Return what can be completed for each command in `cli`, or `None` if it has
+    names that can't be written in a static script.
+    """
+    spec: list[SpecEntry] = []
+    ctx = _click.Context(cli, info_name=prog_name, resilient_parsing=True)
+    try:
+        _add_command_spec(cli, ctx, "", spec)
+    except _UnsupportedCommand:
+        return None
+    return spec
+
+
+COMPLETION_SCRIPT_BASH_STATIC = """
+%(spec_func)s() {
+    case "$1" in
+%(spec)s
+        *) REPLY='' ;;
+    esac
+}
+
+%(complete_func)s() {
+    local cur="${COMP_WORDS[COMP_CWORD]}" cmd_path="" opt="" kind="" word REPLY
+    local -i i nargs=0 position=0
+    # With the default COMP_WORDBREAKS, "--name=value" is split in 3 words
+    [[ "$cur" == "=" ]] && cur=""
+    for ((i = 1; i < COMP_CWORD; i++)); do
+        word="${COMP_WORDS[i]}"
+        [[ "$word" == "=" ]] && continue
+        if ((nargs > 0)); then
+            nargs=nargs-1
+            continue
+        fi
+        if [[ "$word" == -* ]]; then
+            %(spec_func)s "$cmd_path|nargs|$word"
+            nargs=${REPLY:-0}
+            opt="$word"
+            continue
+        fi
+        %(spec_func)s "$cmd_path|command|$word"
+        if [[ -n "$REPLY" ]]; then
+            cmd_path="${cmd_path:+$cmd_path }$word"
+            position=0
+        else
+            position=position+1
+        fi
+    done
+    if ((nargs > 0)); then
+        %(spec_func)s "$cmd_path|values|$opt"
+        kind="$REPLY"
+    elif [[ "$cur" == -* ]]; then
+        %(spec_func)s "$cmd_path|options|"
+        COMPREPLY=( $(compgen -W "$REPLY" -- "$cur") )
+        return 0
+    else
+        %(spec_func)s "$cmd_path|commands|"
+        if [[ -n "$REPLY" ]]; then
+            COMPREPLY=( $(compgen -W "$REPLY" -- "$cur") )
+            return 0
+        fi
+        %(spec_func)s "$cmd_path|argument|$position"
+        kind="$REPLY"
+    fi
+    case "$kind" in
+        dynamic)
+            local IFS=$'\n'
+            COMPREPLY=( $( env COMP_WORDS="${COMP_WORDS[*]}" \\
+                           COMP_CWORD=$COMP_CWORD \\
+                           %(autocomplete_var)s=complete_bash %(dynamic_prog)s ) )
+            ;;
+        dir)
+            COMPREPLY=( $(compgen -d -- "$cur") )
+            ;;
+        choices\\ *)
+            COMPREPLY=( $(compgen -W "${kind#choices }" -- "$cur") )
+            ;;
+    esac
+    # Anything else, e.g. files, is completed by readline with -o default
+    return 0
+}
+
+complete -o default -F %(complete_func)s %(prog_name)s
+"""
+
+COMPLETION_SCRIPT_ZSH_STATIC = """
+#compdef %(prog_name)s
+
+%(spec_func)s() {
+    case "$1" in
+%(spec)s
+        *) REPLY='' ;;
+    esac
+}
+
+%(complete_func)s() {
+    local cur="${words[CURRENT]}" cmd_path="" opt="" kind="" word REPLY
+    local -i i nargs=0 position=0
+    for ((i = 2; i < CURRENT; i++)); do
+        word="${words[i]}"
+        if ((nargs > 0)); then
+            nargs=nargs-1
+            continue
+        fi
+        if [[ "$word" == -* ]]; then
+            %(spec_func)s "$cmd_path|nargs|$word"
+            nargs=${REPLY:-0}
+            opt="$word"
+            continue
+        fi
+        %(spec_func)s "$cmd_path|command|$word"
+        if [[ -n "$REPLY" ]]; then
+            cmd_path="${cmd_path:+$cmd_path }$word"
+            position=0
+        else
+            position=position+1
+        fi
+    done
+    if ((nargs > 0)); then
+        %(spec_func)s "$cmd_path|values|$opt"
+        kind="$REPLY"
+    elif [[ "$cur" == -* ]]; then
+        %(spec_func)s "$cmd_path|options|"
+        compadd -- ${=REPLY}
+        return
+    else
+        %(spec_func)s "$cmd_path|commands|"
+        if [[ -n "$REPLY" ]]; then
+            compadd -- ${=REPLY}
+            return
+        fi
+        %(spec_func)s "$cmd_path|argument|$position"
+        kind="$REPLY"
+    fi
+    case "$kind" in
+        dynamic)
+            eval $(env _TYPER_COMPLETE_ARGS="${words[1,$CURRENT]}" %(autocomplete_var)s=complete_zsh %(dynamic_prog)s)
+            ;;
+        dir)
+            _files -/
+            ;;
+        choices\\ *)
+            compadd -- ${=kind#choices }
+            ;;
+        *)
+            _files
+            ;;
+    esac
+}
+
+compdef %(complete_func)s %(prog_name)s
+"""
+
+COMPLETION_SCRIPT_FISH_STATIC = """
+function %(spec_func)s
+    switch $argv[1]
+%(spec)s
+    end
+end
+
+function %(complete_func)s
+    set -l tokens (commandline -opc)
+    set -e tokens[1]
+    set -l cur (commandline -ct)
+    set -l cmd_path ''
+    set -l opt ''
+    set -l kind ''
+    set -l nargs 0
+    set -l position 0
+    for word in $tokens
+        if test $nargs -gt 0
+            set nargs (math $nargs - 1)
+            continue
+        end
+        if string match -q -- '-*' $word
+            set nargs (%(spec_func)s "$cmd_path|nargs|$word")
+            test -n "$nargs"; or set nargs 0
+            set opt $word
+            continue
+        end
+        set -l is_command (%(spec_func)s "$cmd_path|command|$word")
+        if test -n "$is_command"
+            if test -n "$cmd_path"
+                set cmd_path "$cmd_path $word"
+            else
+                set cmd_path $word
+            end
+            set position 0
+        else
+            set position (math $position + 1)
+        end
+    end
+    if test $nargs -gt 0
+        set kind (%(spec_func)s "$cmd_path|values|$opt")
+    else if string match -q -- '-*' $cur
+        string split ' ' -- (%(spec_func)s "$cmd_path|options|")
+        return
+    else
+        set -l commands (%(spec_func)s "$cmd_path|commands|")
+        if test -n "$commands"
+            string split ' ' -- $commands
+            return
+        end
+        set kind (%(spec_func)s "$cmd_path|argument|$position")
+    end
+    switch "$kind"
+        case dynamic
+            set -l results (env %(autocomplete_var)s=complete_fish _TYPER_COMPLETE_FISH_ACTION=get-args _TYPER_COMPLETE_ARGS=(commandline -cp) %(dynamic_prog)s)
+            if set -q results[1]
+                string join \\n -- $results
+            else
+                __fish_complete_path $cur
+            end
+        case dir
+            __fish_complete_directories $cur
+        case 'choices *'
+            string split ' ' -- (string replace 'choices ' '' -- $kind)
+        case '*'
+            __fish_complete_path $cur
+    end
+end
+
+complete --command %(prog_name)s --no-files --arguments "(%(complete_func)s)"
+"""
+
+COMPLETION_SCRIPT_POWER_SHELL_STATIC = """
+Import-Module PSReadLine
+Set-PSReadLineKeyHandler -Chord Tab -Function MenuComplete
+$scriptblock = {
+    param($wordToComplete, $commandAst, $cursorPosition)
+    # Option names are case sensitive, e.g. -v and -V
+    $spec = [System.Collections.Hashtable]::new([System.StringComparer]::Ordinal)
+%(spec)s
+    $elements = @($commandAst.CommandElements | ForEach-Object { $_.ToString() })
+    $end = $elements.Count
+    if ($wordToComplete) {
+        $end -= 1
+    }
+    $cmdPath = ''
+    $opt = ''
+    $kind = ''
+    $nargs = 0
+    $position = 0
+    for ($i = 1; $i -lt $end; $i++) {
+        $word = $elements[$i]
+        if ($nargs -gt 0) {
+            $nargs -= 1
+            continue
+        }
+        if ($word.StartsWith('-')) {
+            $nargs = [int]$spec["$cmdPath|nargs|$word"]
+            $opt = $word
+            continue
+        }
+        if ($spec["$cmdPath|command|$word"]) {
+            $cmdPath = if ($cmdPath) { "$cmdPath $word" } else { $word }
+            $position = 0
+        } else {
+            $position += 1
+        }
+    }
+    $candidates = @()
+    if ($nargs -gt 0) {
+        $kind = $spec["$cmdPath|values|$opt"]
+    } elseif ($wordToComplete.StartsWith('-')) {
+        $candidates = $spec["$cmdPath|options|"] -split ' '
+    } elseif ($spec["$cmdPath|commands|"]) {
+        $candidates = $spec["$cmdPath|commands|"] -split ' '
+    } else {
+        $kind = $spec["$cmdPath|argument|$position"]
+        if ($null -eq $kind) {
+            $kind = $spec["$cmdPath|argument|"]
+        }
+    }
+    if ($kind -eq 'dynamic') {
+        $Env:%(autocomplete_var)s = "complete_powershell"
+        $Env:_TYPER_COMPLETE_ARGS = $commandAst.ToString()
+        $Env:_TYPER_COMPLETE_WORD_TO_COMPLETE = $wordToComplete
+        %(dynamic_prog)s | ForEach-Object {
+            $commandArray = $_ -Split ":::"
+            $command = $commandArray[0]
+            $helpString = $commandArray[1]
+            [System.Management.Automation.CompletionResult]::new(
+                $command, $command, 'ParameterValue', $helpString)
+        }
+        $Env:%(autocomplete_var)s = ""
+        $Env:_TYPER_COMPLETE_ARGS = ""
+        $Env:_TYPER_COMPLETE_WORD_TO_COMPLETE = ""
+        return
+    }
+    if ($kind -and $kind.StartsWith('choices ')) {
+        $candidates = $kind.Substring(8) -split ' '
+    }
+    # Without results, files and directories are completed by PowerShell
+    $candidates | Where-Object { $_ -and $_.StartsWith($wordToComplete) } | ForEach-Object {
+        [System.Management.Automation.CompletionResult]::new(
+            $_, $_, 'ParameterValue', $_)
+    }
+}
+Register-ArgumentCompleter -Native -CommandName %(prog_name)s -ScriptBlock $scriptblock
+"""
+
+
+def _fish_quote(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+def _powershell_quote(value: str) -> str:
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
+
+
+def _render_sh_spec(spec: list[SpecEntry]) -> str:
+    return "\n".join(
+        f"        {shlex.quote(key)}{'*' if prefix else ''}) REPLY={shlex.quote(value)} ;;"
+        for key, value, prefix in spec
+    )
+
+
+def _render_fish_spec(spec: list[SpecEntry]) -> str:
+    return "\n".join(
+        f"        case {_fish_quote(key + ('*' if prefix else ''))}\n"
+        f"            echo {_fish_quote(value)}"
+        for key, value, prefix in spec
+    )
+
+
+def _render_powershell_spec(spec: list[SpecEntry]) -> str:
+    return "\n".join(
+        f"    $spec[{_powershell_quote(key)}] = {_powershell_quote(value)}"
+        for key, value, _prefix in spec
+    )
+
+
+_static_completion_scripts: dict[str, tuple[str, Callable[[list[SpecEntry]], str]]] = {
+    "bash": (COMPLETION_SCRIPT_BASH_STATIC, _render_sh_spec),
+    "zsh": (COMPLETION_SCRIPT_ZSH_STATIC, _render_sh_spec),
+    "fish": (COMPLETION_SCRIPT_FISH_STATIC, _render_fish_spec),
+    "powershell": (COMPLETION_SCRIPT_POWER_SHELL_STATIC, _render_powershell_spec),
+    "pwsh": (COMPLETION_SCRIPT_POWER_SHELL_STATIC, _render_powershell_spec),
+}
+
+
+def get_static_completion_script(
+    *, cli: _click.Command, shell: str, script_vars: dict[str, str]
+) -> str | None:
+    """
+    Return the static completion script for `shell`, or `None` if the command can't
+    be completed statically and the dynamic script should be used instead.
+    """
+    if shell not in _static_completion_scripts:
+        return None
+    spec = get_completion_spec(cli, script_vars["prog_name"])
+    if spec is None:
+        return None
+    script, render_spec = _static_completion_scripts[shell]
+    return script % {
+        **script_vars,
+        "spec_func": f"{script_vars['complete_func']}_spec",
+        "spec": render_spec(spec),
+    }
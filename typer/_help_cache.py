@@ -0,0 +1,187 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from . import __version__, _click
+from ._click.utils import get_app_dir
+from .models import DefaultPlaceholder, TyperInfo
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .main import Typer
+
+# Set in the root command of apps with `help_cache`, a function that returns the
+# fingerprint of the app
+fingerprint_attr_name = "__typer_help_cache_fingerprint__"
+
+# The oldest entries are removed when there are more
+MAX_ENTRIES = 256
+
+
+def get_cache_dir() -> Path:
+    return Path(get_app_dir("typer")) / "help"
+
+
+def _get_callback_id(callback: Any) -> str | None:
+    if isinstance(callback, DefaultPlaceholder):
+        callback = callback.value
+    if callback is None:
+        return None
+    if isinstance(callback, str):
+        # Lazy import string
+        return callback
+    module = getattr(callback, "__module__", None)
+    qualname = getattr(callback, "__qualname__", None)
+    return f"{module}:{qualname}"
+
+
+def _get_callback_source(callback: Any) -> str | None:
+    if isinstance(callback, DefaultPlaceholder):
+        callback = callback.value
+    if callback is None or isinstance(callback, str):
+        return None
+    module = sys.modules.get(getattr(callback, "__module__", None) or "")
+    return getattr(module, "__file__", None)
+
+
+def _iter_group_callbacks(typer_info: TyperInfo) -> Iterator[Any]:
+    yield typer_info.callback
+    typer_instance = typer_info.typer_instance
+    if isinstance(typer_instance, DefaultPlaceholder) or typer_instance is None:
+        return
+    if isinstance(typer_instance, str):
+        yield typer_instance
+        return
+    yield typer_instance.info.callback
+    if typer_instance.registered_callback:
+        yield typer_instance.registered_callback.callback
+
+
+def _get_structure(typer_instance: "Typer") -> list[Any]:
+    # What was registered, without building anything, so that different apps
+    # defined in the same modules get different fingerprints
+    structure: list[Any] = [
+        _get_callback_id(callback)
+        for callback in _iter_group_callbacks(TyperInfo(typer_instance))
+    ]
+    for command_info in typer_instance.registered_commands:
+        structure.append([command_info.name, _get_callback_id(command_info.callback)])
+    for group_info in typer_instance.registered_groups:
+        name = group_info.name
+        if isinstance(name, DefaultPlaceholder):
+            name = name.value
+        group_structure: list[Any] = [name]
+        if isinstance(group_info.typer_instance, str):
+            group_structure.append(group_info.typer_instance)
+        elif group_info.typer_instance is not None:
+            group_structure.append(_get_structure(group_info.typer_instance))
+        group_structure.append(_get_callback_id(group_info.callback))
+        structure.append(group_structure)
+    return structure
+
+
+def _iter_sources(typer_instance: "Typer") -> Iterator[str]:
+    for callback in _iter_group_callbacks(TyperInfo(typer_instance)):
+        source = _get_callback_source(callback)
+        if source:
+            yield source
+    for command_info in typer_instance.registered_commands:
+        source = _get_callback_source(command_info.callback)
+        if source:
+            yield source
+    for group_info in typer_instance.registered_groups:
+        source = _get_callback_source(group_info.callback)
+        if source:
+            yield source
+        if group_info.typer_instance and not isinstance(group_info.typer_instance, str):
+            yield from _iter_sources(group_info.typer_instance)
+
+
+def get_fingerprint(typer_instance: "Typer") -> str:
+    # It changes when the app is changed: what was registered, the version of Typer,
+    # and the source files of the callbacks
+    sources = sorted(set(_iter_sources(typer_instance)))
+    stats: list[list[Any]] = []
+    for source in sources:
+        try:
+            stat = os.stat(source)
+        except OSError:
+            stats.append([source, None, None])
+        else:
+            stats.append([source, stat.st_mtime_ns, stat.st_size])
+    data = json.dumps([__version__, _get_structure(typer_instance), stats], default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def is_enabled(ctx: _click.Context) -> bool:
+    return hasattr(ctx.find_root().command, fingerprint_attr_name)
+
+
+def _get_param_values(ctx: _click.Context) -> list[Any]:
+    # The values shown in the help that can change between runs of the same app: the
+    # defaults, e.g. from the default_map or computed when the app is imported, and
+    # the values of the environment variables
+    values = []
+    for param in ctx.command.get_params(ctx):
+        default = param.get_default(ctx, call=False)
+        if inspect.isfunction(default):
+            # Shown as "(dynamic)", without calling it
+            default = None
+        values.append([param.name, default, param.resolve_envvar_value(ctx)])
+    return values
+
+
+def _get_key(ctx: _click.Context, properties: list[Any]) -> str:
+    get_app_fingerprint: Callable[[], str] = getattr(
+        ctx.find_root().command, fingerprint_attr_name
+    )
+    data = json.dumps(
+        [
+            get_app_fingerprint(),
+            ctx.command_path,
+            ctx.color,
+            properties,
+            _get_param_values(ctx),
+        ],
+        default=str,
+    )
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def _save_help(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        entries = sorted(path.parent.glob("*.txt"), key=os.path.getmtime)
+        for old_path in entries[: max(len(entries) - MAX_ENTRIES + 1, 0)]:
+            old_path.unlink()
+        tmp_path.write_text(text, encoding="utf-8")
+        # Atomic, concurrent processes never read a partially written help
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is only an optimization, help works without it
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def get_help(
+    ctx: _click.Context, properties: list[Any], render: Callable[[], str]
+) -> str:
+    """
+    Return the help of the command of `ctx` rendered before for the same app, command
+    and terminal `properties`, or `render` it and save it for the next time.
+    """
+    path = get_cache_dir() / f"{_get_key(ctx, properties)}.txt"
+    try:
+        return path.read_text(encoding="utf-8")
+    except (OSError, ValueError):
+        pass
+    text = render()
+    _save_help(path, text)
+    return text
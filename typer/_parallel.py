@@ -0,0 +1,256 @@
+import os
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from typing import TYPE_CHECKING, Annotated, Any, Literal, TypeVar
+
+from annotated_doc import Doc
+
+if TYPE_CHECKING:  # pragma: no cover
+    from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+    from ._click._termui_impl import ProgressBar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+ParallelBackend = Literal["thread", "process"]
+
+# Names of the parameters added to commands with `parallel`
+JOBS_PARAM_NAME = "jobs"
+BACKEND_PARAM_NAME = "parallel_backend"
+PROGRESS_PARAM_NAME = "progress"
+PARAM_NAMES = (
+    JOBS_PARAM_NAME,
+    BACKEND_PARAM_NAME,
+    PROGRESS_PARAM_NAME,
+)
+
+
+def _iter_sequential(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    progress: "ProgressBar[Any] | None",
+) -> Iterator[R]:
+    for item in items:
+        result = func(item)
+        if progress is not None:
+            progress.update(1)
+        yield result
+
+
+def _iter_pool(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    executor_class: "type[ThreadPoolExecutor | ProcessPoolExecutor]",
+    jobs: int,
+    ordered: bool,
+    progress: "ProgressBar[Any] | None",
+) -> Iterator[R]:
+    with executor_class(max_workers=jobs) as executor:
+        yield from _iter_submitted(
+            func,
+            items,
+            executor=executor,
+            jobs=jobs,
+            ordered=ordered,
+            progress=progress,
+        )
+
+
+def _iter_submitted(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    executor: "Executor",
+    jobs: int,
+    ordered: bool,
+    progress: "ProgressBar[Any] | None",
+) -> Iterator[R]:
+    from concurrent.futures import FIRST_COMPLETED, Future, wait
+
+    items_iter = iter(items)
+    # Only a few items are submitted ahead of the workers, so that big or lazy
+    # inputs are not loaded all at once
+    max_pending = jobs * 2
+    pending: deque[Future[R]] = deque()
+
+    def submit_next() -> None:
+        for item in items_iter:
+            pending.append(executor.submit(func, item))
+            if len(pending) >= max_pending:
+                return
+
+    try:
+        submit_next()
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                done = [future for future in pending if future in finished]
+                for future in done:
+                    pending.remove(future)
+            for future in done:
+                result = future.result()
+                if progress is not None:
+                    progress.update(1)
+                yield result
+            submit_next()
+    finally:
+        # After an error, or when the results are not needed anymore, don't start
+        # the items that are still pending
+        for future in pending:
+            future.cancel()
+
+
+def parallel_map(
+    func: Annotated[
+        Callable[[T], R],
+        Doc(
+            """
+            The function to call with each item. With the `"process"` backend, it has to be
+            importable by the worker processes, e.g. a function defined at the top level of a module.
+            """
+        ),
+    ],
+    items: Annotated[
+        Iterable[T],
+        Doc(
+            """
+            The items to process, each one is passed to `func` independently.
+            """
+        ),
+    ],
+    *,
+    jobs: Annotated[
+        int | None,
+        Doc(
+            """
+            The number of items processed at the same time. By default, the number of CPUs.
+            With `1`, the items are processed one after the other in the current thread.
+            """
+        ),
+    ] = None,
+    backend: Annotated[
+        ParallelBackend,
+        Doc(
+            """
+            Use a pool of `"thread"`s (the default, for I/O bound work) or of `"process"`es
+            (for CPU bound work).
+            """
+        ),
+    ] = "thread",
+    ordered: Annotated[
+        bool,
+        Doc(
+            """
+            Return the results in the same order as `items`. With `False`, each result is
+            returned as soon as it's ready.
+            """
+        ),
+    ] = True,
+    progress: Annotated[
+        "ProgressBar[Any] | None",
+        Doc(
+            """
+            A progress bar created with `typer.progressbar()`, advanced one step for each
+            finished item.
+            """
+        ),
+    ] = None,
+) -> Iterator[R]:
+    """
+    Call `func` with each one of the `items` in parallel, using a pool of threads or
+    processes, and return an iterator with the results.
+
+    If `func` raises an exception for any item, the items not started yet are
+    cancelled and the exception is raised when its result is reached, so that it's
+    shown the same as any other error in a command.
+
+    **Example**
+
+    ```python
+    from pathlib import Path
+
+    import typer
+
+
+    def count_lines(path: Path) -> int:
+        return len(path.read_text().splitlines())
+
+
+    def main(paths: list[Path]):
+        with typer.progressbar(length=len(paths), label="Counting") as progress:
+            total = sum(typer.parallel_map(count_lines, paths, progress=progress))
+        print(f"Total lines: {total}")
+    ```
+    """
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+    assert jobs > 0, "jobs must be a positive number"
+    assert backend in ("thread", "process"), f"Unknown parallel backend: {backend!r}"
+    if jobs == 1:
+        return _iter_sequential(func, items, progress)
+    # Imported only when used, they are not needed by most apps
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+    executor_class: type[ThreadPoolExecutor | ProcessPoolExecutor] = (
+        ThreadPoolExecutor if backend == "thread" else ProcessPoolExecutor
+    )
+    return _iter_pool(
+        func,
+        items,
+        executor_class=executor_class,
+        jobs=jobs,
+        ordered=ordered,
+        progress=progress,
+    )
+
+
+class _ItemCall:
+    """
+    Call a command function with one of the items of its list parameter and the
+    rest of its parameters. A class instead of a closure so that it can be sent to
+    worker processes.
+    """
+
+    def __init__(
+        self, callback: Callable[..., Any], item_name: str, params: dict[str, Any]
+    ) -> None:
+        self.callback = callback
+        self.item_name = item_name
+        self.params = params
+
+    def __call__(self, item: Any) -> Any:
+        return self.callback(**self.params, **{self.item_name: item})
+
+
+def run_command(
+    callback: Callable[..., Any], params: dict[str, Any], *, items_name: str
+) -> list[Any]:
+    # Run the function of a command with `parallel=items_name` for each item
+    use_params = dict(params)
+    jobs = use_params.pop(JOBS_PARAM_NAME)
+    backend = use_params.pop(BACKEND_PARAM_NAME)
+    show_progress = use_params.pop(PROGRESS_PARAM_NAME)
+    items = use_params.pop(items_name) or []
+    func = _ItemCall(callback, items_name, use_params)
+    if not show_progress:
+        return list(parallel_map(func, items, jobs=jobs, backend=backend))
+    from ._click.termui import progressbar
+    from ._click.utils import get_text_stream
+
+    # On stderr, to keep it apart from the output of the items
+    with progressbar(
+        length=len(items), label="Processing", file=get_text_stream("stderr")
+    ) as progress:
+        return list(
+            parallel_map(
+                func,
+                items,
+                jobs=jobs,
+                backend=backend,
+                progress=progress,
+            )
+        )
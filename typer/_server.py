@@ -0,0 +1,227 @@
+import json
+import os
+import select
+import socket
+import struct
+import sys
+import time
+from collections.abc import Callable
+
+from ._server_client import FALLBACK_STATUS, STARTED_STATUS, is_private_dir
+from .utils import get_exit_code
+
+# Shut down after this many seconds without requests
+DEFAULT_IDLE_TIMEOUT = 15 * 60
+# Requests handled at the same time, the next ones wait in the socket backlog
+DEFAULT_MAX_CONCURRENCY = 16
+# While requests are running, check this often if they finished
+REAP_INTERVAL = 1.0
+
+
+class _Request:
+    def __init__(
+        self, *, argv: list[str], env: dict[str, str], cwd: str, fds: list[int]
+    ) -> None:
+        self.argv = argv
+        self.env = env
+        self.cwd = cwd
+        self.fds = fds
+
+
+def _recv_exact(conn: socket.socket, size: int) -> bytes:
+    data = b""
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+        if not chunk:
+            raise ConnectionError("Connection closed before the request was read")
+        data += chunk
+    return data
+
+
+def _recv_request(conn: socket.socket) -> _Request:
+    header, fds, _flags, _addr = socket.recv_fds(conn, 8, 3)
+    try:
+        if len(header) < 8:
+            header += _recv_exact(conn, 8 - len(header))
+        (size,) = struct.unpack("!Q", header)
+        payload = json.loads(_recv_exact(conn, size))
+    except BaseException:
+        for fd in fds:
+            os.close(fd)
+        raise
+    return _Request(
+        argv=payload["argv"], env=payload["env"], cwd=payload["cwd"], fds=fds
+    )
+
+
+def _send_status(conn: socket.socket, status: int) -> None:
+    try:
+        conn.sendall(struct.pack("!i", status))
+    except OSError:
+        pass
+
+
+def _get_source_stat(path: str) -> tuple[int, int]:
+    stat = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _get_sources_stats() -> dict[str, tuple[int, int]]:
+    stats = {}
+    for module in list(sys.modules.values()):
+        path = getattr(module, "__file__", None)
+        if not path:
+            continue
+        try:
+            stats[path] = _get_source_stat(path)
+        except OSError:
+            pass
+    return stats
+
+
+def _sources_changed(stats: dict[str, tuple[int, int]]) -> bool:
+    for path, stat in stats.items():
+        try:
+            if _get_source_stat(path) != stat:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def _bind(socket_path: str) -> socket.socket | None:
+    socket_dir = os.path.dirname(socket_path)
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    if not is_private_dir(socket_dir):
+        return None
+    if os.path.exists(socket_path):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(socket_path)
+            except OSError:
+                # Left behind by a server that didn't shut down cleanly
+                os.unlink(socket_path)
+            else:
+                # Another server is already running
+                return None
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        server.bind(socket_path)
+        server.listen()
+    except OSError:
+        server.close()
+        return None
+    return server
+
+
+def _handle_in_child(
+    conn: socket.socket,
+    request: _Request,
+    handler: Callable[[list[str]], int],
+) -> None:
+    status = 1
+    try:
+        for target_fd, fd in enumerate(request.fds):
+            os.dup2(fd, target_fd)
+            os.close(fd)
+        os.environ.clear()
+        os.environ.update(request.env)
+        os.chdir(request.cwd)
+        try:
+            status = handler(request.argv)
+        except SystemExit as e:
+            status = get_exit_code(e)
+    finally:
+        try:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        except OSError:
+            pass
+        _send_status(conn, status)
+        os._exit(0)
+
+
+def _reap_children(children: set[int], *, block: bool = False) -> None:
+    while children:
+        try:
+            pid, _ = os.waitpid(-1, 0 if block else os.WNOHANG)
+        except ChildProcessError:  # pragma: no cover
+            children.clear()
+            return
+        if pid == 0:
+            return
+        children.discard(pid)
+        block = False
+
+
+def serve(
+    socket_path: str,
+    handler: Callable[[list[str]], int],
+    *,
+    idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> bool:
+    """
+    Run `handler` for each request received in `socket_path`, until there are no
+    requests for `idle_timeout` seconds or the source code of a loaded module changes.
+
+    Each request is handled in a forked process, with the argv, environment, working
+    directory and standard streams of the client, so the state loaded by this
+    process is reused but never modified by a request. At most `max_concurrency`
+    requests are handled at the same time.
+
+    Return `False` if the socket couldn't be used, e.g. because another server is
+    already running in it.
+    """
+    assert max_concurrency > 0, "max_concurrency must be a positive number"
+    # Before accepting requests, so that no change can be missed
+    sources_stats = _get_sources_stats()
+    server = _bind(socket_path)
+    if server is None:
+        return False
+    children: set[int] = set()
+    deadline = time.monotonic() + idle_timeout
+    try:
+        while True:
+            _reap_children(children)
+            if len(children) >= max_concurrency:
+                _reap_children(children, block=True)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 and not children:
+                break
+            # Running requests are reaped when they finish, and the server doesn't
+            # shut down until they do
+            timeout = REAP_INTERVAL if children else remaining
+            readable, _, _ = select.select([server], [], [], timeout)
+            if not readable:
+                continue
+            conn, _ = server.accept()
+            deadline = time.monotonic() + idle_timeout
+            with conn:
+                try:
+                    request = _recv_request(conn)
+                except (OSError, ValueError, KeyError):
+                    continue
+                if _sources_changed(sources_stats):
+                    for fd in request.fds:
+                        os.close(fd)
+                    _send_status(conn, FALLBACK_STATUS)
+                    break
+                _send_status(conn, STARTED_STATUS)
+                sys.stdout.flush()
+                sys.stderr.flush()
+                pid = os.fork()
+                if pid == 0:  # pragma: no cover
+                    server.close()
+                    _handle_in_child(conn, request, handler)
+                children.add(pid)
+                for fd in request.fds:
+                    os.close(fd)
+    finally:
+        server.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+    return True
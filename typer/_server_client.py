@@ -0,0 +1,145 @@
+"""
+Minimal client for a resident Typer app, used for apps run with `app.serve()` and
+by the completion scripts.
+
+It's run with `python -S -E`, so it only uses the standard library and doesn't
+import Typer or the app. When no server is running (or it can't handle the request)
+it runs the program normally instead. For completion, it also starts a server in
+the background for the next requests.
+
+Usage: python -S -E _server_client.py COMPLETE_VAR PROG [ARGS]...
+       python -S -E _server_client.py --socket SOCKET_PATH PROG [ARGS]...
+"""
+
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import sys
+
+SOCKET_ENV_VAR = "_TYPER_COMPLETE_SOCKET"
+# Sent by the server instead of an exit code when the client should fall back to
+# running the program, e.g. when the source code of the app changed
+FALLBACK_STATUS = -1
+# Sent by the server right before running the command line, after that the client
+# can't fall back anymore, the command line could have already done something
+STARTED_STATUS = -2
+# The exit code when the server stopped while running the command line
+LOST_STATUS = 1
+
+
+def get_socket_dir() -> str:
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR", "/tmp")
+    return os.path.join(runtime_dir, f"typer-{os.getuid()}")
+
+
+def get_socket_path(prog_name: str) -> str:
+    # The same program name can be installed in different environments
+    executable_hash = hashlib.sha256(sys.executable.encode("utf-8")).hexdigest()[:8]
+    name = "".join(c if c.isalnum() or c in "-_." else "_" for c in prog_name)
+    return os.path.join(get_socket_dir(), f"{name}-{executable_hash}.sock")
+
+
+def is_private_dir(path: str) -> bool:
+    # Don't pass file descriptors to, or accept them from, other users
+    try:
+        dir_stat = os.stat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(dir_stat.st_mode)
+        and dir_stat.st_uid == os.getuid()
+        and not dir_stat.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    )
+
+
+def _recv_status(sock: socket.socket) -> int | None:
+    data = b""
+    while len(data) < 4:
+        chunk = sock.recv(4 - len(data))
+        if not chunk:
+            return None
+        data += chunk
+    status: int = struct.unpack("!i", data)[0]
+    return status
+
+
+def request(socket_path: str, argv: list[str]) -> int | None:
+    """
+    Ask the server at `socket_path` to run `argv` with the environment, working
+    directory and standard streams of this process, and return its exit code.
+
+    Return `None` when there's no server to handle it. Once the server started
+    running it, never return `None`, so that the command line is never run twice.
+    """
+    if not is_private_dir(os.path.dirname(socket_path)):
+        return None
+    payload = json.dumps(
+        {"argv": argv, "env": dict(os.environ), "cwd": os.getcwd()}
+    ).encode("utf-8")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+            header = struct.pack("!Q", len(payload))
+            socket.send_fds(sock, [header], [0, 1, 2])
+            sock.sendall(payload)
+            sock.shutdown(socket.SHUT_WR)
+            status = _recv_status(sock)
+        except OSError:
+            return None
+        if status is None or status == FALLBACK_STATUS:
+            return None
+        if status == STARTED_STATUS:
+            try:
+                status = _recv_status(sock)
+            except OSError:
+                status = None
+            if status is None:
+                sys.stderr.write(
+                    "Error: The server stopped while running the command\n"
+                )
+                return LOST_STATUS
+    return status
+
+
+def start_server(complete_var: str, prog: str, socket_path: str) -> None:
+    import subprocess
+
+    env = {**os.environ, complete_var: "serve", SOCKET_ENV_VAR: socket_path}
+    try:
+        subprocess.Popen(
+            [prog],
+            env=env,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError:
+        pass
+
+
+def main() -> None:
+    if sys.argv[1] == "--socket":
+        socket_path, prog, *args = sys.argv[2:]
+        status = request(socket_path, [prog, *args])
+        if status is not None:
+            sys.exit(status)
+        os.execvp(prog, [prog, *args])
+    complete_var, prog, *args = sys.argv[1:]
+    socket_path = os.environ.get(SOCKET_ENV_VAR) or get_socket_path(
+        os.path.basename(prog)
+    )
+    status = request(socket_path, [prog, *args])
+    if status is not None:
+        sys.exit(status)
+    start_server(complete_var, prog, socket_path)
+    os.execvp(prog, [prog, *args])
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,5 @@
-from collections.abc import Iterable, Mapping, Sequence
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from enum import Enum
 from typing import Any, Generic, TypeVar
 
@@ -8,6 +9,9 @@ from ._click.shell_completion import CompletionItem
 
 ParamTypeValue = TypeVar("ParamTypeValue")
 
+# Normalized indexes kept for each choice type, one for each combination of settings
+_MAX_NORMALIZED_INDEXES = 8
+
 
 class TyperChoice(types.ParamType, Generic[ParamTypeValue]):
     # Code adapted from Click 8.3.1, with Typer using enum values in normalize_choice
@@ -18,6 +22,62 @@ class TyperChoice(types.ParamType, Generic[ParamTypeValue]):
     ) -> None:
         self.choices: Sequence[ParamTypeValue] = tuple(choices)
         self.case_sensitive = case_sensitive
+        # Computed on first use, for the choices they were computed from
+        self._indexed_choices: Sequence[ParamTypeValue] | None = None
+        self._normalized_indexes: dict[
+            tuple[bool, Callable[[str], str] | None],
+            tuple[Mapping[ParamTypeValue, str], Mapping[str, ParamTypeValue]],
+        ] = {}
+        self._prefix_indexes: dict[bool, list[tuple[str, int, str]]] = {}
+
+    def _check_indexes(self) -> None:
+        if self._indexed_choices is not self.choices:
+            self._indexed_choices = self.choices
+            self._normalized_indexes = {}
+            self._prefix_indexes = {}
+
+    def _get_normalized_index(
+        self, ctx: _click.Context | None
+    ) -> tuple[Mapping[ParamTypeValue, str], Mapping[str, ParamTypeValue]]:
+        """
+        Returns the normalized mapping, and its reverse index from each normalized
+        value to the first original choice with that value. They are computed once
+        for each combination of the settings that change them.
+        """
+        self._check_indexes()
+        token_normalize_func = ctx.token_normalize_func if ctx is not None else None
+        key = (self.case_sensitive, token_normalize_func)
+        index = self._normalized_indexes.get(key)
+        if index is None:
+            mapping = {
+                choice: self.normalize_choice(choice=choice, ctx=ctx)
+                for choice in self.choices
+            }
+            reverse_index: dict[str, ParamTypeValue] = {}
+            for choice, normalized in mapping.items():
+                reverse_index.setdefault(normalized, choice)
+            if len(self._normalized_indexes) >= _MAX_NORMALIZED_INDEXES:
+                # E.g. a different token_normalize_func for each context
+                self._normalized_indexes.clear()
+            index = self._normalized_indexes[key] = (mapping, reverse_index)
+        return index
+
+    def _get_prefix_index(self) -> list[tuple[str, int, str]]:
+        """
+        Returns the choices as strings, sorted by the value compared with the
+        incomplete value in `shell_complete()`, with their original position.
+        """
+        self._check_indexes()
+        index = self._prefix_indexes.get(self.case_sensitive)
+        if index is None:
+            index = []
+            for position, choice in enumerate(self.choices):
+                str_choice = str(choice)
+                key = str_choice if self.case_sensitive else str_choice.lower()
+                index.append((key, position, str_choice))
+            index.sort()
+            self._prefix_indexes[self.case_sensitive] = index
+        return index
 
     def _normalized_mapping(
         self, ctx: _click.Context | None = None
@@ -26,13 +86,8 @@ class TyperChoice(types.ParamType, Generic[ParamTypeValue]):
         Returns mapping where keys are the original choices and the values are
         the normalized values that are accepted via the command line.
         """
-        return {
-            choice: self.normalize_choice(
-                choice=choice,
-                ctx=ctx,
-            )
-            for choice in self.choices
-        }
+        mapping, _ = self._get_normalized_index(ctx)
+        return mapping
 
     def normalize_choice(
         self, choice: ParamTypeValue, ctx: _click.Context | None
@@ -77,15 +132,11 @@ class TyperChoice(types.ParamType, Generic[ParamTypeValue]):
         matched "original" choice.
         """
         normed_value = self.normalize_choice(choice=value, ctx=ctx)
-        normalized_mapping = self._normalized_mapping(ctx=ctx)
+        _, reverse_index = self._get_normalized_index(ctx)
 
         try:
-            return next(
-                original
-                for original, normalized in normalized_mapping.items()
-                if normalized == normed_value
-            )
-        except StopIteration:
+            return reverse_index[normed_value]
+        except KeyError:
             self.fail(
                 self.get_invalid_choice_message(value=value, ctx=ctx),
                 param=param,
@@ -105,12 +156,17 @@ class TyperChoice(types.ParamType, Generic[ParamTypeValue]):
     ) -> list[CompletionItem]:
         """Complete choices that start with the incomplete value."""
 
-        str_choices = map(str, self.choices)
-
-        if self.case_sensitive:
-            matched = (c for c in str_choices if c.startswith(incomplete))
-        else:
+        if not self.case_sensitive:
             incomplete = incomplete.lower()
-            matched = (c for c in str_choices if c.lower().startswith(incomplete))
 
-        return [CompletionItem(c) for c in matched]
+        # The choices that start with the incomplete value are contiguous
+        index = self._get_prefix_index()
+        matched = []
+        i = bisect_left(index, (incomplete,))
+        while i < len(index) and index[i][0].startswith(incomplete):
+            _, position, str_choice = index[i]
+            matched.append((position, str_choice))
+            i += 1
+        matched.sort()
+
+        return [CompletionItem(c) for _, c in matched]
@@ -1,11 +1,11 @@
-import os
 import sys
 from collections.abc import MutableMapping
 from typing import Any
 
 from . import _click
 from ._click import shell_completion
-from ._completion_classes import completion_init
+from ._click._compat import getenv
+from ._completion_classes import _sanitize_help_text, completion_init
 from ._completion_shared import Shells, _get_shell_name, get_completion_script, install
 from .models import ParamMeta
 from .params import Option
@@ -16,7 +16,7 @@ _click_patched = False
 
 def get_completion_inspect_parameters() -> tuple[ParamMeta, ParamMeta]:
     completion_init()
-    test_disable_detection = os.getenv("_TYPER_COMPLETE_TEST_DISABLE_SHELL_DETECTION")
+    test_disable_detection = getenv("_TYPER_COMPLETE_TEST_DISABLE_SHELL_DETECTION")
     if not test_disable_detection:
         parameters = get_params_from_function(_install_completion_placeholder_function)
     else:
@@ -30,10 +30,11 @@ def get_completion_inspect_parameters() -> tuple[ParamMeta, ParamMeta]:
 def install_callback(ctx: _click.Context, param: _click.Parameter, value: Any) -> Any:
     if not value or ctx.resilient_parsing:
         return value  # pragma: no cover
+    cli = ctx.find_root().command
     if isinstance(value, str):
-        shell, path = install(shell=value)
+        shell, path = install(shell=value, cli=cli)
     else:
-        shell, path = install()
+        shell, path = install(cli=cli)
     _click.termui.secho(f"{shell} completion installed in {path}", fg="green")
     _click.echo("Completion will take effect once you restart the terminal")
     sys.exit(0)
@@ -46,7 +47,7 @@ def show_callback(ctx: _click.Context, param: _click.Parameter, value: Any) -> A
     assert prog_name
     complete_var = "_{}_COMPLETE".format(prog_name.replace("-", "_").upper())
     shell = ""
-    test_disable_detection = os.getenv("_TYPER_COMPLETE_TEST_DISABLE_SHELL_DETECTION")
+    test_disable_detection = getenv("_TYPER_COMPLETE_TEST_DISABLE_SHELL_DETECTION")
     if isinstance(value, str):
         shell = value
     elif not test_disable_detection:
@@ -54,7 +55,10 @@ def show_callback(ctx: _click.Context, param: _click.Parameter, value: Any) -> A
         if detected_shell is not None:
             shell = detected_shell
     script_content = get_completion_script(
-        prog_name=prog_name, complete_var=complete_var, shell=shell
+        prog_name=prog_name,
+        complete_var=complete_var,
+        shell=shell,
+        cli=ctx.find_root().command,
     )
     _click.echo(script_content)
     sys.exit(0)
@@ -143,3 +147,28 @@ def shell_complete(
 
     _click.echo(f'Completion instruction "{instruction}" not supported.', err=True)
     return 1
+
+
+def serve_completion(
+    cli: _click.Command,
+    ctx_args: MutableMapping[str, Any],
+    prog_name: str,
+    complete_var: str,
+) -> None:
+    from ._server import serve
+    from ._server_client import SOCKET_ENV_VAR, get_socket_path
+
+    socket_path = getenv(SOCKET_ENV_VAR) or get_socket_path(prog_name)
+    completion_init()
+    # Import what every completion request needs once, before forking for them
+    _sanitize_help_text("")
+
+    def handler(argv: list[str]) -> int:
+        instruction = getenv(complete_var, "")
+        return shell_complete(cli, dict(ctx_args), prog_name, complete_var, instruction)
+
+    idle_timeout = getenv("TYPER_COMPLETION_SERVER_IDLE_TIMEOUT")
+    if idle_timeout:
+        serve(socket_path, handler, idle_timeout=float(idle_timeout))
+    else:
+        serve(socket_path, handler)
@@ -1,25 +1,42 @@
 import errno
 import inspect
+import itertools
 import os
+import re
+import shutil
 import sys
-from collections.abc import Callable, Mapping, MutableMapping, Sequence
+from collections import deque
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from contextlib import AbstractContextManager, ExitStack, nullcontext
 from difflib import get_close_matches
 from enum import Enum
+from functools import partial
 from gettext import gettext as _
 from typing import (
     Any,
     TextIO,
+    TypeVar,
     Union,
     cast,
 )
 
 from . import _click
 from ._click import types
+from ._click._compat import _get_std_stream, getenv
 from ._click.parser import _OptionParser
 from ._click.shell_completion import CompletionItem
 from ._typing import Literal
 from .utils import parse_boolean_env_var
 
+T = TypeVar("T")
+
 MarkupMode = Literal["markdown", "rich", None]
 MARKUP_MODE_KEY = "TYPER_RICH_MARKUP_MODE"
 
@@ -30,6 +47,50 @@ if HAS_RICH:
 else:
     DEFAULT_MARKUP_MODE = None
 
+# "rich" (the default), "plain", or "auto" to use Rich only in terminals with colors
+HELP_RENDERER_ENV_VAR = "TYPER_HELP_RENDERER"
+
+# The same as rich.markup.RE_TAGS
+_RICH_TAG_RE = re.compile(r"(\\*)\[([a-z#/@][^[]*?)]")
+
+
+def _use_rich_output(*, stderr: bool = False) -> bool:
+    # Formatting help and errors with Rich is much slower, and its styles are
+    # lost when the output is not a terminal, e.g. piped to grep or in CI logs
+    if not HAS_RICH:
+        return False
+    renderer = getenv(HELP_RENDERER_ENV_VAR, "rich").lower()
+    if renderer == "plain":
+        return False
+    if renderer != "auto":
+        return True
+    if getenv("NO_COLOR") or getenv("TERM") == "dumb":
+        return False
+    if getenv("_TYPER_FORCE_DISABLE_TERMINAL"):
+        return False
+    if getenv("GITHUB_ACTIONS") or getenv("FORCE_COLOR") or getenv("PY_COLORS"):
+        return True
+    stream = _get_std_stream("stderr" if stderr else "stdout")
+    try:
+        return bool(stream.isatty())
+    except (AttributeError, ValueError):
+        return False
+
+
+def _strip_markup(text: str, markup_mode: MarkupMode) -> str:
+    # Remove the Rich markup tags, without importing Rich, Markdown is readable as is
+    if markup_mode != "rich" or "[" not in text:
+        return text
+
+    def replace(match: re.Match[str]) -> str:
+        backslashes, tag = match.groups()
+        escapes, escaped = divmod(len(backslashes), 2)
+        if escaped:
+            return "\\" * escapes + f"[{tag}]"
+        return "\\" * escapes
+
+    return _RICH_TAG_RE.sub(replace, text)
+
 
 # Copy from _click.parser._split_opt
 def _split_opt(opt: str) -> tuple[str, str]:
@@ -154,6 +215,92 @@ def _extract_default_help_str(
     return default_value
 
 
+def _format_plain_help(
+    format_help: Callable[[_click.Context, _click.HelpFormatter], None],
+    ctx: _click.Context,
+    formatter: _click.HelpFormatter,
+) -> None:
+    from . import _help_cache
+
+    use_cache = _help_cache.is_enabled(ctx)
+    use_pager = _use_help_pager(ctx)
+    if not use_cache and not use_pager:
+        format_help(ctx, formatter)
+        return
+
+    def render() -> str:
+        start = len(formatter.buffer)
+        format_help(ctx, formatter)
+        text = "".join(formatter.buffer[start:])
+        del formatter.buffer[start:]
+        return text
+
+    if use_cache:
+        properties = [None, formatter.width, _get_help_prefix(ctx)]
+        text = _help_cache.get_help(ctx, properties, render)
+    else:
+        text = render()
+    if not (use_pager and _page_help(text)):
+        formatter.write(text)
+
+
+# Set in the root command of apps with `output_buffering`
+output_buffering_attr_name = "__typer_output_buffering__"
+# Set in the root command of apps with `help_max_commands`
+help_max_commands_attr_name = "__typer_help_max_commands__"
+# Set in the root command of apps with `help_pager`
+help_pager_attr_name = "__typer_help_pager__"
+# The start of the names of the commands to list, from `--help PREFIX`
+_help_prefix_meta_key = "typer.help_prefix"
+
+
+def _get_help_max_commands(ctx: _click.Context) -> int | None:
+    return getattr(ctx.find_root().command, help_max_commands_attr_name, None)
+
+
+def _get_help_prefix(ctx: _click.Context) -> str | None:
+    return ctx.meta.get(_help_prefix_meta_key)
+
+
+def _limit_help_commands(
+    ctx: _click.Context, commands: list[T]
+) -> tuple[list[T], str | None]:
+    # Only the first commands of a panel are listed in big groups, the rest are
+    # summarized in a last row, so that the help stays fast and short
+    max_commands = _get_help_max_commands(ctx)
+    if max_commands is None or len(commands) <= max_commands:
+        return commands, None
+    more_text = _("{count} more… (filter with '{command_path} {help_option} PREFIX')")
+    return commands[:max_commands], more_text.format(
+        count=len(commands) - max_commands,
+        command_path=ctx.command_path,
+        help_option=ctx.help_option_names[0],
+    )
+
+
+def _use_help_pager(ctx: _click.Context) -> bool:
+    if not getattr(ctx.find_root().command, help_pager_attr_name, False):
+        return False
+    try:
+        return bool(_get_std_stream("stdout").isatty())
+    except (AttributeError, ValueError):
+        return False
+
+
+def _page_help(text: str) -> bool:
+    # Show the help through the pager only when it doesn't fit in the terminal
+    if text.count("\n") < shutil.get_terminal_size().lines:
+        return False
+    import pydoc
+
+    from ._click._compat import strip_ansi
+
+    # The pager takes over the terminal, show the buffered output before it
+    _click.utils.flush_buffered_output()
+    pydoc.pager(strip_ansi(text))
+    return True
+
+
 def _main(
     self: _click.Command,
     *,
@@ -183,9 +330,16 @@ def _main(
     # Process shell completion requests and exit early.
     self._main_shell_completion(extra, prog_name, complete_var)
 
+    # Flushed when the command finishes, before showing any error, so that a
+    # broken pipe while flushing is handled below too
+    output_buffering: AbstractContextManager[None] = (
+        _click.utils.buffered_output()
+        if getattr(self, output_buffering_attr_name, False)
+        else nullcontext()
+    )
     try:
         try:
-            with self.make_context(prog_name, args, **extra) as ctx:
+            with output_buffering, self.make_context(prog_name, args, **extra) as ctx:
                 rv = self.invoke(ctx)
                 if not standalone_mode:
                     return rv
@@ -198,7 +352,7 @@ def _main(
                 # by its truthiness/falsiness
                 ctx.exit()
         except EOFError as e:
-            _click.echo(file=sys.stderr)
+            _click.echo(err=True)
             raise _click.exceptions.Abort() from e
         except KeyboardInterrupt as e:
             raise _click.exceptions.Exit(130) from e
@@ -206,7 +360,7 @@ def _main(
             if not standalone_mode:
                 raise
             # Typer override
-            if HAS_RICH and rich_markup_mode is not None:
+            if rich_markup_mode is not None and _use_rich_output(stderr=True):
                 from . import rich_utils
 
                 rich_utils.rich_format_error(e)
@@ -238,12 +392,12 @@ def _main(
         if not standalone_mode:
             raise
         # Typer override
-        if HAS_RICH and rich_markup_mode is not None:
+        if rich_markup_mode is not None and _use_rich_output(stderr=True):
             from . import rich_utils
 
             rich_utils.rich_abort_error()
         else:
-            _click.echo(_("Aborted!"), file=sys.stderr)
+            _click.echo(_("Aborted!"), err=True)
         # Typer override end
         sys.exit(1)
 
@@ -701,7 +855,7 @@ class TyperOption(_click.Parameter):
             and self.name is not None
         ):
             envvar = f"{ctx.auto_envvar_prefix}_{self.name.upper()}"
-            rv = os.environ.get(envvar)
+            rv = getenv(envvar)
 
             if rv:
                 return rv
@@ -885,6 +1039,108 @@ def _typer_format_options(
             formatter.write_dl(opts)
 
 
+def _format_plain_panels(
+    command: _click.Command,
+    *,
+    ctx: _click.Context,
+    formatter: _click.HelpFormatter,
+    markup_mode: MarkupMode,
+) -> None:
+    # The same panels as the Rich help, with the plain formatter
+    arguments_title = _("Arguments")
+    options_title = _("Options")
+    commands_title = _("Commands")
+    argument_panels: dict[str, list[tuple[str, str]]] = {arguments_title: []}
+    option_panels: dict[str, list[tuple[str, str]]] = {options_title: []}
+    for param in command.get_params(ctx):
+        rv = param.get_help_record(ctx)
+        if rv is None:
+            continue
+        name, help = rv
+        param_help = getattr(param, "help", None)
+        if param_help and help.startswith(param_help):
+            # Only the help of the parameter has markup, not the extra information
+            help = _strip_markup(param_help, markup_mode) + help[len(param_help) :]
+        panel_name = getattr(param, "rich_help_panel", None)
+        if param.param_type_name == "argument":
+            argument_panels.setdefault(panel_name or arguments_title, []).append(
+                (name, help)
+            )
+        elif param.param_type_name == "option":
+            option_panels.setdefault(panel_name or options_title, []).append(
+                (name, help)
+            )
+    panels = [*argument_panels.items(), *option_panels.items()]
+
+    if isinstance(command, TyperGroup):
+        commands: dict[str, list[tuple[str, _click.Command]]] = {commands_title: []}
+        for command_name, sub_command in command._list_help_commands(ctx):
+            panel_name = getattr(sub_command, "rich_help_panel", None)
+            commands.setdefault(panel_name or commands_title, []).append(
+                (command_name, sub_command)
+            )
+        limited = {
+            panel_name: _limit_help_commands(ctx, command_rows)
+            for panel_name, command_rows in commands.items()
+        }
+        names = [
+            name
+            for command_rows, _more_text in limited.values()
+            for name, _sub_command in command_rows
+        ]
+        if names:
+            limit = formatter.width - 6 - max(len(name) for name in names)
+            for panel_name, (command_rows, more_text) in limited.items():
+                rows = [
+                    (
+                        name,
+                        _strip_markup(
+                            sub_command.get_short_help_str(limit), markup_mode
+                        ),
+                    )
+                    for name, sub_command in command_rows
+                ]
+                if more_text:
+                    rows.append(("", more_text))
+                panels.append((panel_name, rows))
+
+    for panel_name, rows in panels:
+        if rows:
+            with formatter.section(panel_name):
+                formatter.write_dl(rows)
+
+
+def _format_fast_help(
+    command: _click.Command,
+    ctx: _click.Context,
+    formatter: _click.HelpFormatter,
+    *,
+    markup_mode: MarkupMode,
+) -> None:
+    # Help of commands with Rich markup, without Rich
+    command.format_usage(ctx, formatter)
+    text = inspect.cleandoc(command.help or "").partition("\f")[0]
+    text = _strip_markup(text, markup_mode)
+    if command.deprecated:
+        deprecated_message = (
+            f"(DEPRECATED: {command.deprecated})"
+            if isinstance(command.deprecated, str)
+            else "(DEPRECATED)"
+        )
+        text = f"{text} {deprecated_message}"
+    if text:
+        formatter.write_paragraph()
+        with formatter.indentation():
+            formatter.write_text(text)
+    _format_plain_panels(command, ctx=ctx, formatter=formatter, markup_mode=markup_mode)
+    if command.epilog:
+        formatter.write_paragraph()
+        with formatter.indentation():
+            formatter.write_text(
+                _strip_markup(inspect.cleandoc(command.epilog), markup_mode)
+            )
+
+
 def _typer_main_shell_completion(
     self: _click.core.Command,
     *,
@@ -895,11 +1151,17 @@ def _typer_main_shell_completion(
     if complete_var is None:
         complete_var = f"_{prog_name}_COMPLETE".replace("-", "_").upper()
 
-    instruction = os.environ.get(complete_var)
+    instruction = getenv(complete_var)
 
     if not instruction:
         return
 
+    if instruction == "serve":
+        from .completion import serve_completion
+
+        serve_completion(self, ctx_args, prog_name, complete_var)
+        sys.exit(0)
+
     from .completion import shell_complete
 
     rv = shell_complete(self, ctx_args, prog_name, complete_var, instruction)
@@ -984,7 +1246,13 @@ class TyperCommand(_click.core.Command):
                 ctx.ensure_object(dict)
             if isinstance(ctx.obj, dict):
                 ctx.obj[MARKUP_MODE_KEY] = self.rich_markup_mode
-            return super().format_help(ctx, formatter)
+            return _format_plain_help(super().format_help, ctx, formatter)
+        if not _use_rich_output():
+            return _format_plain_help(
+                partial(_format_fast_help, self, markup_mode=self.rich_markup_mode),
+                ctx,
+                formatter,
+            )
         from . import rich_utils
 
         return rich_utils.rich_format_help(
@@ -994,6 +1262,66 @@ class TyperCommand(_click.core.Command):
         )
 
 
+class TyperLazyCommand(TyperCommand):
+    """
+    Placeholder for a command registered with an import string, or in an app with
+    `lazy_commands`.
+
+    It only holds what is needed to list it in help and completion, the actual
+    command is built by `loader` the first time the group resolves it.
+    """
+
+    def __init__(
+        self,
+        name: str | None,
+        *,
+        loader: Callable[[], _click.Command],
+        is_group: bool = False,
+        help: str | None = None,
+        short_help: str | None = None,
+        hidden: bool = False,
+        deprecated: bool = False,
+        # Rich settings
+        rich_markup_mode: MarkupMode = DEFAULT_MARKUP_MODE,
+        rich_help_panel: str | None = None,
+    ) -> None:
+        super().__init__(
+            name=name,
+            help=help,
+            short_help=short_help,
+            hidden=hidden,
+            deprecated=deprecated,
+            rich_markup_mode=rich_markup_mode,
+            rich_help_panel=rich_help_panel,
+        )
+        self.loader = loader
+        self.is_group = is_group
+
+    def load(self) -> _click.Command:
+        return self.loader()
+
+
+def _compose_stream(stream: Iterator[Any], value: Any) -> Iterator[Any]:
+    # The return value of each command in a chain, in order:
+    # * None (the command doesn't produce items): the stream is unchanged
+    # * A callable, e.g. a generator function: it receives the stream of the previous
+    #   commands and returns the new stream, to filter or transform it lazily. If it
+    #   returns None, it consumed the stream (a sink), and the new stream is empty
+    # * An iterable, e.g. a generator: its items are added after the previous ones,
+    #   it doesn't receive the stream, only a callable does
+    # * Any other value: it's added as a single item
+    if value is None:
+        return stream
+    if callable(value):
+        new_stream = value(stream)
+        if new_stream is None:
+            return iter(())
+        return iter(new_stream)
+    if isinstance(value, Iterable) and not isinstance(value, (str, bytes, Mapping)):
+        return itertools.chain(stream, value)
+    return itertools.chain(stream, (value,))
+
+
 class TyperGroup(_click.Command):
     allow_extra_args = True
     allow_interspersed_args = False
@@ -1013,6 +1341,7 @@ class TyperGroup(_click.Command):
         invoke_without_command: bool = False,
         no_args_is_help: bool = False,
         subcommand_metavar: str | None = None,
+        chain: bool = False,
         result_callback: Callable[..., Any] | None = None,
         **attrs: Any,
     ) -> None:
@@ -1036,19 +1365,89 @@ class TyperGroup(_click.Command):
         self.invoke_without_command = invoke_without_command
 
         if subcommand_metavar is None:
-            subcommand_metavar = "COMMAND [ARGS]..."
+            if chain:
+                subcommand_metavar = "COMMAND1 [ARGS]... [COMMAND2 [ARGS]...]..."
+            else:
+                subcommand_metavar = "COMMAND [ARGS]..."
 
         self.subcommand_metavar = subcommand_metavar
+        self.chain = chain
         self._result_callback = result_callback
 
+        if self.chain:
+            for param in self.params:
+                if isinstance(param, TyperArgument) and not param.required:
+                    raise RuntimeError(
+                        "A group in chain mode cannot have optional arguments."
+                    )
+            for cmd_name, cmd in self.commands.items():
+                self._check_chained_command(cmd_name, cmd)
+
+    def _check_chained_command(self, name: str, cmd: _click.Command) -> None:
+        # A lazy group is checked before it's loaded, and any lazy command once loaded
+        is_group = isinstance(cmd, TyperGroup) or (
+            isinstance(cmd, TyperLazyCommand) and cmd.is_group
+        )
+        if self.chain and is_group:
+            raise RuntimeError(
+                f"It is not possible to add the group {name!r} to another group"
+                " that is in chain mode."
+            )
+
     def add_command(self, cmd: _click.Command, name: str | None = None) -> None:
         name = name or cmd.name
         if name is None:
             raise TypeError("Command has no name.")
+        self._check_chained_command(name, cmd)
         self.commands[name] = cmd
 
     def get_command(self, ctx: _click.Context, cmd_name: str) -> _click.Command | None:
-        return self.commands.get(cmd_name)
+        cmd = self.commands.get(cmd_name)
+        if isinstance(cmd, TyperLazyCommand):
+            cmd = cmd.load()
+            self._check_chained_command(cmd_name, cmd)
+            self.commands[cmd_name] = cmd
+        return cmd
+
+    def _get_listed_command(
+        self, ctx: _click.Context, cmd_name: str
+    ) -> _click.Command | None:
+        # Listing subcommands in help and completion only needs their declared name
+        # and help, so don't import lazy commands just for that
+        cmd = self.commands.get(cmd_name)
+        if isinstance(cmd, TyperLazyCommand):
+            return cmd
+        return self.get_command(ctx, cmd_name)
+
+    def _list_help_commands(
+        self, ctx: _click.Context
+    ) -> list[tuple[str, _click.Command]]:
+        # The subcommands listed in the help, only the ones that start with the
+        # prefix from `--help PREFIX`, checked before getting each command
+        prefix = _get_help_prefix(ctx) or ""
+        commands = []
+        for subcommand in self.list_commands(ctx):
+            if not subcommand.startswith(prefix):
+                continue
+            cmd = self._get_listed_command(ctx, subcommand)
+            if cmd is None or cmd.hidden:
+                continue
+            commands.append((subcommand, cmd))
+        return commands
+
+    def _parse_help_prefix(self, ctx: _click.Context, args: list[str]) -> None:
+        # In apps with `help_max_commands`, an argument after the help option is
+        # the start of the names of the commands to list, e.g. `--help user`
+        help_option = self.get_help_option(ctx)
+        if help_option is None or not any(arg in help_option.opts for arg in args):
+            return
+        try:
+            opts, rest, _ = self.make_parser(ctx).parse_args(args=list(args))
+        except _click.exceptions.UsageError:
+            # Shown when parsing the arguments again below
+            return
+        if help_option.name and opts.get(help_option.name) and rest:
+            ctx.meta[_help_prefix_meta_key] = rest[0]
 
     def collect_usage_pieces(self, ctx: _click.Context) -> list[str]:
         rv = super().collect_usage_pieces(ctx)
@@ -1058,13 +1457,7 @@ class TyperGroup(_click.Command):
     def format_commands(
         self, ctx: _click.Context, formatter: _click.HelpFormatter
     ) -> None:
-        commands = []
-        for subcommand in self.list_commands(ctx):
-            cmd = self.get_command(ctx, subcommand)
-            if cmd is None or cmd.hidden:
-                continue
-
-            commands.append((subcommand, cmd))
+        commands, more_text = _limit_help_commands(ctx, self._list_help_commands(ctx))
 
         # allow for 3 times the default spacing
         if len(commands):
@@ -1075,6 +1468,8 @@ class TyperGroup(_click.Command):
                 assert cmd is not None
                 help = cmd.get_short_help_str(limit)
                 rows.append((subcommand, help))
+            if more_text:
+                rows.append(("", more_text))
 
             if rows:
                 with formatter.section(_("Commands")):
@@ -1084,9 +1479,14 @@ class TyperGroup(_click.Command):
         if not args and self.no_args_is_help and not ctx.resilient_parsing:
             raise _click.exceptions.NoArgsIsHelpError(ctx)
 
+        if _get_help_max_commands(ctx) is not None:
+            self._parse_help_prefix(ctx, args)
         rest = super().parse_args(ctx, args)
 
-        if rest:
+        if self.chain:
+            ctx._protected_args = rest
+            ctx.args = []
+        elif rest:
             ctx._protected_args, ctx.args = rest[:1], rest[1:]
 
         return ctx.args
@@ -1104,7 +1504,8 @@ class TyperGroup(_click.Command):
                 # groups, or an empty list for chained groups.
                 with ctx:
                     rv = super().invoke(ctx)
-                    # return _process_result([] if self.chain else rv)
+                    if self.chain:
+                        return self._process_chain_result(ctx, iter(()))
                     return _process_result(rv)
             ctx.fail(_("Missing command."))
 
@@ -1113,6 +1514,9 @@ class TyperGroup(_click.Command):
         ctx.args = []
         ctx._protected_args = []
 
+        if self.chain:
+            return self._invoke_chain(ctx, args)
+
         # Make sure the context is entered so we do not clean up
         # resources until the result processor has worked.
         with ctx:
@@ -1124,6 +1528,44 @@ class TyperGroup(_click.Command):
             with sub_ctx:
                 return _process_result(sub_ctx.command.invoke(sub_ctx))
 
+    def _invoke_chain(self, ctx: _click.Context, args: list[str]) -> Any:
+        with ctx:
+            # The subcommands are not known yet when the group callback is run
+            ctx.invoked_subcommand = "*"
+            super().invoke(ctx)
+
+            # Make all the contexts first, so that a usage error in any of the
+            # subcommands is shown before running them
+            contexts = []
+            while args:
+                cmd_name, cmd, args = self.resolve_command(ctx, args)
+                assert cmd is not None
+                sub_ctx = cmd.make_context(
+                    cmd_name,
+                    args,
+                    parent=ctx,
+                    allow_extra_args=True,
+                    allow_interspersed_args=False,
+                )
+                contexts.append(sub_ctx)
+                args, sub_ctx.args = sub_ctx.args, []
+
+            # The contexts (and e.g. the files they opened) are kept until the
+            # stream is consumed
+            with ExitStack() as stack:
+                stream: Iterator[Any] = iter(())
+                for sub_ctx in contexts:
+                    stack.enter_context(sub_ctx)
+                    stream = _compose_stream(stream, sub_ctx.command.invoke(sub_ctx))
+                return self._process_chain_result(ctx, stream)
+
+    def _process_chain_result(self, ctx: _click.Context, stream: Iterator[Any]) -> Any:
+        if self._result_callback is not None:
+            return ctx.invoke(self._result_callback, stream, **ctx.params)
+        # Without a result callback, run the pipeline until the end
+        deque(stream, maxlen=0)
+        return None
+
     def shell_complete(
         self, ctx: _click.Context, incomplete: str
     ) -> list[CompletionItem]:
@@ -1213,7 +1655,13 @@ class TyperGroup(_click.Command):
 
     def format_help(self, ctx: _click.Context, formatter: _click.HelpFormatter) -> None:
         if not HAS_RICH or self.rich_markup_mode is None:
-            return super().format_help(ctx, formatter)
+            return _format_plain_help(super().format_help, ctx, formatter)
+        if not _use_rich_output():
+            return _format_plain_help(
+                partial(_format_fast_help, self, markup_mode=self.rich_markup_mode),
+                ctx,
+                formatter,
+            )
         from . import rich_utils
 
         return rich_utils.rich_format_help(
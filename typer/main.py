@@ -1,18 +1,20 @@
 import inspect
 import os
 import platform
+import shlex
 import shutil
 import subprocess
 import sys
 import traceback
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from copy import copy
 from datetime import datetime
 from enum import Enum
-from functools import update_wrapper
+from functools import partial, update_wrapper
 from pathlib import Path
 from traceback import FrameSummary, StackSummary
 from types import TracebackType
-from typing import Annotated, Any
+from typing import TYPE_CHECKING, Annotated, Any
 from uuid import UUID
 
 from annotated_doc import Doc
@@ -30,13 +32,18 @@ from .core import (
     TyperArgument,
     TyperCommand,
     TyperGroup,
+    TyperLazyCommand,
     TyperOption,
+    help_max_commands_attr_name,
+    help_pager_attr_name,
+    output_buffering_attr_name,
 )
 from .models import (
     AnyType,
     ArgumentInfo,
     CommandFunctionType,
     CommandInfo,
+    CommandTargetType,
     Default,
     DefaultPlaceholder,
     DeveloperExceptionConfig,
@@ -52,10 +59,22 @@ from .models import (
     TyperInfo,
     TyperPath,
 )
-from .utils import get_params_from_function
+from .params import Option
+from .utils import get_exit_code, get_params_from_function, import_from_string
+
+if TYPE_CHECKING:
+    import asyncio
 
 _original_except_hook = sys.excepthook
 _typer_developer_exception_attr_name = "__typer_developer_exception__"
+# Incremented every time a command, callback or sub-app is registered in any Typer
+# app, a sub-app registered after its parent was built also changes the parent tree
+_registration_count = 0
+
+
+def _registration_changed() -> None:
+    global _registration_count
+    _registration_count += 1
 
 
 def except_hook(
@@ -74,10 +93,22 @@ def except_hook(
     ):
         _original_except_hook(exc_type, exc_value, tb)
         return
+    if f"{__package__}._async" in sys.modules:
+        from . import _async
+
+        # Only loaded when there are async callbacks, run by its event loop
+        with _async.runner_frames_stripped(exc_value):
+            _print_pretty_exception(exc_value, exception_config)
+        return
+    _print_pretty_exception(exc_value, exception_config)
+
+
+def _print_pretty_exception(
+    exc: BaseException, exception_config: DeveloperExceptionConfig
+) -> None:
     typer_path = os.path.dirname(__file__)
     click_path = os.path.dirname(_click.__file__)
     internal_dir_names = [typer_path, click_path]
-    exc = exc_value
     if HAS_RICH:
         from . import rich_utils
 
@@ -109,6 +140,140 @@ def except_hook(
     return
 
 
+BATCH_STOP_ON_ERROR_KEY = "typer_batch_stop_on_error"
+
+
+def get_batch_arguments(
+    typer_instance: "Typer",
+) -> tuple[_click.Parameter, _click.Parameter]:
+    def stop_on_error_callback(
+        ctx: _click.Context, param: _click.Parameter, value: bool
+    ) -> None:
+        # Eager, so that it's available when the batch is run, wherever it's passed
+        ctx.meta[BATCH_STOP_ON_ERROR_KEY] = value
+
+    def batch_callback(
+        ctx: _click.Context, param: _click.Parameter, value: FileText | None
+    ) -> None:
+        if value is None or ctx.resilient_parsing:
+            return
+        first_error = 0
+        for line_number, exit_code in typer_instance._iter_batch(
+            value,
+            stop_on_error=ctx.meta.get(BATCH_STOP_ON_ERROR_KEY, False),
+            prog_name=ctx.info_name,
+        ):
+            if exit_code:
+                _click.echo(
+                    f"Line {line_number} failed with exit code {exit_code}",
+                    err=True,
+                )
+                first_error = first_error or exit_code
+                if exit_code == 130:
+                    # Interrupted with Ctrl+C, exit the same as a single command line
+                    ctx.exit(exit_code)
+        ctx.exit(first_error)
+
+    batch_param, _ = get_click_param(
+        ParamMeta(
+            name="batch",
+            default=Option(
+                None,
+                "--batch",
+                metavar="FILE|-",
+                callback=batch_callback,
+                expose_value=False,
+                help="Run each line of FILE (or of stdin with -) as a command line.",
+            ),
+            annotation=FileText | None,
+        )
+    )
+    stop_on_error_param, _ = get_click_param(
+        ParamMeta(
+            name="batch_stop_on_error",
+            default=Option(
+                False,
+                "--batch-stop-on-error",
+                callback=stop_on_error_callback,
+                is_eager=True,
+                expose_value=False,
+                help="Stop the batch at the first command line that fails.",
+            ),
+            annotation=bool,
+        )
+    )
+    return batch_param, stop_on_error_param
+
+
+def get_parallel_arguments(
+    callback: Callable[..., Any], items_name: str
+) -> list[TyperArgument | TyperOption]:
+    from . import _parallel
+
+    parameters = get_params_from_function(callback)
+    assert items_name in parameters, (
+        f"The parallel parameter {items_name!r} is not a parameter of {callback}"
+    )
+    items_type = parameters[items_name].annotation
+    # Handle list[Path] | None and Optional[list[Path]]
+    if is_union(get_origin(items_type)):
+        types = [type_ for type_ in get_args(items_type) if type_ is not NoneType]
+        if len(types) == 1:
+            items_type = types[0]
+    assert lenient_issubclass(get_origin(items_type), (list, tuple, set)), (
+        f"The parallel parameter {items_name!r} should be a list"
+    )
+    for name in _parallel.PARAM_NAMES:
+        assert name not in parameters, (
+            f"The parameter {name!r} of {callback} is used by parallel commands"
+        )
+    for param in parameters.values():
+        # The items run in other threads or processes, outside of the command context
+        assert not lenient_issubclass(param.annotation, _click.Context), (
+            f"The parallel command {callback} can't have a Context parameter"
+        )
+    assert not inspect.iscoroutinefunction(callback), (
+        f"The async function {callback} can't be a parallel command"
+    )
+    jobs_param, _ = get_click_param(
+        ParamMeta(
+            name=_parallel.JOBS_PARAM_NAME,
+            default=Option(
+                None,
+                "--jobs",
+                "-j",
+                min=1,
+                show_default="number of CPUs",
+                help="Number of items processed at the same time.",
+            ),
+            annotation=int | None,
+        )
+    )
+    backend_param, _ = get_click_param(
+        ParamMeta(
+            name=_parallel.BACKEND_PARAM_NAME,
+            default=Option(
+                "thread",
+                "--parallel-backend",
+                help="Process the items in threads or in processes.",
+            ),
+            annotation=_parallel.ParallelBackend,
+        )
+    )
+    progress_param, _ = get_click_param(
+        ParamMeta(
+            name=_parallel.PROGRESS_PARAM_NAME,
+            default=Option(
+                False,
+                "--progress",
+                help="Show a progress bar, advanced as each item is finished.",
+            ),
+            annotation=bool,
+        )
+    )
+    return [jobs_param, backend_param, progress_param]
+
+
 def get_install_completion_arguments() -> tuple[_click.Parameter, _click.Parameter]:
     install_param, show_param = get_completion_inspect_parameters()
     click_install_param, _ = get_click_param(install_param)
@@ -218,12 +383,17 @@ class Typer:
             bool,
             Doc(
                 """
-                **Note**: you probably shouldn't use this parameter, it is inherited
-                from Click and supported for compatibility.
+                Allow passing more than one subcommand, each one with its own parameters, to run them
+                one after the other as a pipeline, e.g. `tool read a.csv filter --col x write out.csv`.
 
-                ---
-
-                Allow passing more than one subcommand argument.
+                The return values of the subcommands are composed lazily into a single stream:
+                a subcommand can return an iterable (e.g. a generator) to add items to it, or a
+                function (e.g. a generator function) that receives the stream of the previous
+                subcommands and returns a new one, or `None` if it consumes the stream until the
+                end. Only a returned function receives the stream, a subcommand that is
+                itself a generator function only adds items.
+                The `result_callback` receives the final stream, if there's no
+                `result_callback` the stream is consumed until the end.
                 """
             ),
         ] = Default(False),
@@ -408,6 +578,146 @@ class Typer:
                 """
             ),
         ] = True,
+        lazy_commands: Annotated[
+            bool,
+            Doc(
+                """
+                Build the parameters of each command from its function only when the command is
+                actually run or its own help is shown. The commands are listed in the help and in
+                completion from what was registered (names, help texts, panels), which makes starting
+                apps with many commands faster. Errors in the parameters of a command are only shown
+                when that command is used.
+                Set to `False` by default.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(lazy_commands=True)
+                ```
+                """
+            ),
+        ] = False,
+        add_batch_option: Annotated[
+            bool,
+            Doc(
+                """
+                Toggle whether or not to add the `--batch` and `--batch-stop-on-error` options to the app.
+                With `--batch FILE`, each line of the file (or of the standard input with `--batch -`) is run
+                as a separate command line, all in the same process, see `Typer.run_batch()`.
+                Set to `False` by default.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(add_batch_option=True)
+                ```
+                """
+            ),
+        ] = False,
+        loop_factory: Annotated[
+            Callable[[], "asyncio.AbstractEventLoop"] | None,
+            Doc(
+                """
+                A function to create the event loop used to run `async` commands and callbacks,
+                e.g. `uvloop.new_event_loop`. All the `async` callbacks of the same invocation
+                (the group callbacks, the command, the result callback and the parameter callbacks)
+                run on the same event loop, so they can share resources like connection pools.
+                By default, `asyncio.new_event_loop`.
+
+                **Example**
+
+                ```python
+                import typer
+                import uvloop
+
+                app = typer.Typer(loop_factory=uvloop.new_event_loop)
+                ```
+                """
+            ),
+        ] = None,
+        output_buffering: Annotated[
+            bool,
+            Doc(
+                """
+                Buffer the text printed with `typer.echo()` and `typer.secho()`, and write it in bigger
+                chunks instead of flushing it on each call, which is much faster for commands that print
+                lots of lines. The text is always written before prompting and when the command finishes,
+                see `typer.buffered_output()`.
+                Set to `False` by default.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(output_buffering=True)
+                ```
+                """
+            ),
+        ] = False,
+        help_cache: Annotated[
+            bool,
+            Doc(
+                """
+                Save the help output rendered for each command in a cache in the app directory of Typer,
+                and show it from there the next time the same help is requested, with the same terminal
+                width and colors. The cache is not used anymore after the app is changed, e.g. when
+                one of its source files is modified.
+                Set to `False` by default.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(help_cache=True)
+                ```
+                """
+            ),
+        ] = False,
+        help_max_commands: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of commands listed in each panel of the help of a group, useful for
+                groups with thousands of commands. The rest of the commands are summarized in a last
+                "N more…" row, and they can be listed by filtering the commands by the start of their
+                name with `--help PREFIX`.
+                By default, all the commands are listed.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(help_max_commands=50)
+                ```
+                """
+            ),
+        ] = None,
+        help_pager: Annotated[
+            bool,
+            Doc(
+                """
+                Show the help through the pager of the system (e.g. `less`, or the one in the
+                `PAGER` environment variable) when it's printed to a terminal and it's longer than
+                the terminal height.
+                Set to `False` by default.
+
+                **Example**
+
+                ```python
+                import typer
+
+                app = typer.Typer(help_pager=True)
+                ```
+                """
+            ),
+        ] = False,
         # Rich settings
         rich_markup_mode: Annotated[
             MarkupMode,
@@ -518,6 +828,16 @@ class Typer:
         ] = True,
     ):
         self._add_completion = add_completion
+        self._lazy_commands = lazy_commands
+        self._add_batch_option = add_batch_option
+        self._loop_factory = loop_factory
+        self._output_buffering = output_buffering
+        self._help_cache = help_cache
+        assert help_max_commands is None or help_max_commands > 0, (
+            "help_max_commands must be a positive number"
+        )
+        self._help_max_commands = help_max_commands
+        self._help_pager = help_pager
         self.rich_markup_mode: MarkupMode = rich_markup_mode
         self.rich_help_panel = rich_help_panel
         self.suggest_commands = suggest_commands
@@ -545,6 +865,8 @@ class Typer:
         self.registered_groups: list[TyperInfo] = []
         self.registered_commands: list[CommandInfo] = []
         self.registered_callback: TyperInfo | None = None
+        self._command: _click.Command | None = None
+        self._command_registration_count = -1
 
     def callback(
         self,
@@ -591,12 +913,17 @@ class Typer:
             bool,
             Doc(
                 """
-                **Note**: you probably shouldn't use this parameter, it is inherited
-                from Click and supported for compatibility.
-
-                ---
+                Allow passing more than one subcommand, each one with its own parameters, to run them
+                one after the other as a pipeline, e.g. `tool read a.csv filter --col x write out.csv`.
 
-                Allow passing more than one subcommand argument.
+                The return values of the subcommands are composed lazily into a single stream:
+                a subcommand can return an iterable (e.g. a generator) to add items to it, or a
+                function (e.g. a generator function) that receives the stream of the previous
+                subcommands and returns a new one, or `None` if it consumes the stream until the
+                end. Only a returned function receives the stream, a subcommand that is
+                itself a generator function only adds items.
+                The `result_callback` receives the final stream, if there's no
+                `result_callback` the stream is consumed until the end.
                 """
             ),
         ] = Default(False),
@@ -746,6 +1073,7 @@ class Typer:
                 deprecated=deprecated,
                 rich_help_panel=rich_help_panel,
             )
+            _registration_changed()
             return f
 
         return decorator
@@ -852,6 +1180,28 @@ class Typer:
                 """
             ),
         ] = False,
+        parallel: Annotated[
+            str | None,
+            Doc(
+                """
+                The name of a list parameter of the function, e.g. `"paths"` for `paths: list[Path]`.
+                The function is then called once for each item, in parallel, with that item as the
+                value of the parameter, see `typer.parallel_map()`. The options `--jobs`/`-j`,
+                `--parallel-backend` and `--progress` are added to the command to configure how.
+                The command returns the list of results, in the same order as the items. The
+                function can't have a `typer.Context` parameter, as it runs outside of the
+                command context.
+
+                **Example**
+
+                ```python
+                @app.command(parallel="paths")
+                def compress(paths: list[Path]):
+                    ...
+                ```
+                """
+            ),
+        ] = None,
         # Rich settings
         rich_help_panel: Annotated[
             str | None,
@@ -861,7 +1211,7 @@ class Typer:
                 """
             ),
         ] = Default(None),
-    ) -> Callable[[CommandFunctionType], CommandFunctionType]:
+    ) -> Callable[[CommandTargetType], CommandTargetType]:
         """
         Using the decorator `@app.command`, you can define a subcommand of the previously defined Typer app.
 
@@ -883,11 +1233,24 @@ class Typer:
         def delete():
             print("Deleting user: Hiro Hamada")
         ```
+
+        Instead of a function, you can also pass an import string like
+        `"pkg.module:function"`. The module is then only imported when that command
+        is run, listing it in the help output uses the `help` and `short_help`
+        declared here.
+
+        ```python
+        app.command(help="Train the model")("my_project.train:train")
+        ```
         """
         if cls is None:
             cls = TyperCommand
 
-        def decorator(f: CommandFunctionType) -> CommandFunctionType:
+        def decorator(f: CommandTargetType) -> CommandTargetType:
+            if isinstance(f, str):
+                assert ":" in f, (
+                    f"Import string {f!r} must be in the format 'module:function'"
+                )
             self.registered_commands.append(
                 CommandInfo(
                     name=name,
@@ -904,17 +1267,28 @@ class Typer:
                     no_args_is_help=no_args_is_help,
                     hidden=hidden,
                     deprecated=deprecated,
+                    parallel=parallel,
                     # Rich settings
                     rich_help_panel=rich_help_panel,
                 )
             )
+            _registration_changed()
             return f
 
         return decorator
 
     def add_typer(
         self,
-        typer_instance: "Typer",
+        typer_instance: Annotated[
+            "Typer | str",
+            Doc(
+                """
+                The Typer app to add, or an import string like `"pkg.module:app"` to
+                import it only when this subcommand is run. A `name` is required when
+                using an import string.
+                """
+            ),
+        ],
         *,
         name: Annotated[
             str | None,
@@ -968,12 +1342,17 @@ class Typer:
             bool,
             Doc(
                 """
-                **Note**: you probably shouldn't use this parameter, it is inherited
-                from Click and supported for compatibility.
-
-                ---
+                Allow passing more than one subcommand, each one with its own parameters, to run them
+                one after the other as a pipeline, e.g. `tool read a.csv filter --col x write out.csv`.
 
-                Allow passing more than one subcommand argument.
+                The return values of the subcommands are composed lazily into a single stream:
+                a subcommand can return an iterable (e.g. a generator) to add items to it, or a
+                function (e.g. a generator function) that receives the stream of the previous
+                subcommands and returns a new one, or `None` if it consumes the stream until the
+                end. Only a returned function receives the stream, a subcommand that is
+                itself a generator function only adds items.
+                The `result_callback` receives the final stream, if there's no
+                `result_callback` the stream is consumed until the end.
                 """
             ),
         ] = Default(False),
@@ -1105,6 +1484,13 @@ class Typer:
         app.add_typer(delete_app)
         ```
         """
+        if isinstance(typer_instance, str):
+            assert ":" in typer_instance, (
+                f"Import string {typer_instance!r} must be in the format 'module:app'"
+            )
+            assert not isinstance(name, DefaultPlaceholder) and name, (
+                f"A name is required to add the lazy Typer app {typer_instance!r}"
+            )
         self.registered_groups.append(
             TyperInfo(
                 typer_instance,
@@ -1129,12 +1515,13 @@ class Typer:
                 rich_help_panel=rich_help_panel,
             )
         )
+        _registration_changed()
 
     def __call__(self, *args: Any, **kwargs: Any) -> Any:
         if sys.excepthook != except_hook:
             sys.excepthook = except_hook
         try:
-            return get_command(self)(*args, **kwargs)
+            return self._get_command()(*args, **kwargs)
         except Exception as e:
             # Set a custom attribute to tell the hook to show nice exceptions for user
             # code. An alternative/first implementation was a custom exception with
@@ -1153,6 +1540,237 @@ class Typer:
             )
             raise e
 
+    def __getstate__(self) -> dict[str, Any]:
+        # The cached command tree has closures that can't be pickled, it's built
+        # again after unpickling, e.g. in the worker processes of the CliRunner
+        state = self.__dict__.copy()
+        state["_command"] = None
+        state["_command_registration_count"] = -1
+        return state
+
+    def _get_command(self) -> _click.Command:
+        # Re-use the command tree built for a previous call, as long as nothing
+        # was registered since then
+        if (
+            self._command is None
+            or self._command_registration_count != _registration_count
+        ):
+            self._command = get_command(self)
+            self._command_registration_count = _registration_count
+        return self._command
+
+    def run_batch(
+        self,
+        lines: Annotated[
+            Iterable[str | Sequence[str]],
+            Doc(
+                """
+                The command lines to run. Each one can be a string, split like a shell would, or a
+                sequence of already split arguments. Empty lines and `#` comments are skipped.
+                """
+            ),
+        ],
+        *,
+        stop_on_error: Annotated[
+            bool,
+            Doc(
+                """
+                Stop after the first command line that exits with a non-zero code, instead of
+                running the rest of them.
+                """
+            ),
+        ] = False,
+        prog_name: Annotated[
+            str | None,
+            Doc(
+                """
+                The program name shown in help and error messages. By default, it's detected
+                from `sys.argv`, the same as when calling the app.
+                """
+            ),
+        ] = None,
+    ) -> list[int]:
+        """
+        Run many command lines of the app in the current process, one after the other,
+        and return the exit code of each one.
+
+        The command is built only once, each command line gets its own context, and
+        the output of each one is flushed as soon as it finishes. An unexpected error
+        in a command line is shown the same as when calling the app, and its exit code
+        is `1`. A command line interrupted with `Ctrl+C` has the exit code `130` and
+        stops the batch, the rest of the command lines are not run.
+
+        **Example**
+
+        ```python
+        import typer
+
+        app = typer.Typer()
+
+
+        @app.command()
+        def hello(name: str):
+            print(f"Hello {name}")
+
+
+        exit_codes = app.run_batch(["Camila", "Rick"])
+        ```
+        """
+        return [
+            exit_code
+            for _, exit_code in self._iter_batch(
+                lines, stop_on_error=stop_on_error, prog_name=prog_name
+            )
+        ]
+
+    def _iter_batch(
+        self,
+        lines: Iterable[str | Sequence[str]],
+        *,
+        stop_on_error: bool,
+        prog_name: str | None,
+    ) -> Iterator[tuple[int, int]]:
+        # Yield the line number and the exit code of each command line as it finishes
+        command = self._get_command()
+        for line_number, line in enumerate(lines, start=1):
+            if isinstance(line, str):
+                try:
+                    args = shlex.split(line, comments=True)
+                except ValueError as e:
+                    _click.echo(f"Error: Invalid command line: {e}", err=True)
+                    exit_code = 2
+                else:
+                    if not args:
+                        continue
+                    exit_code = self._run_command_line(
+                        command, args, prog_name=prog_name
+                    )
+            else:
+                exit_code = self._run_command_line(
+                    command, list(line), prog_name=prog_name
+                )
+            yield line_number, exit_code
+            # A command line interrupted with Ctrl+C (exit code 130) stops the batch
+            if exit_code == 130 or (exit_code and stop_on_error):
+                break
+
+    def serve(
+        self,
+        socket_path: Annotated[
+            str,
+            Doc(
+                """
+                The path of the Unix socket to listen in. Its directory is created if needed,
+                and it has to be private to the current user (permissions `0700`), because
+                the clients send their environment and their standard streams.
+                """
+            ),
+        ],
+        *,
+        max_concurrency: Annotated[
+            int | None,
+            Doc(
+                """
+                The maximum number of command lines run at the same time, the next requests
+                wait until one of them finishes. By default, 16.
+                """
+            ),
+        ] = None,
+        idle_timeout: Annotated[
+            float | None,
+            Doc(
+                """
+                Shut down after this many seconds without requests. By default, 15 minutes.
+                """
+            ),
+        ] = None,
+    ) -> bool:
+        """
+        Keep the app loaded in this process and run the command lines sent by a
+        client through `socket_path`, to avoid the startup time of each call.
+
+        The client is `typer/_server_client.py`, it only uses the standard library:
+
+        ```console
+        $ python -S -E /path/to/typer/_server_client.py --socket SOCKET_PATH PROG [ARGS]...
+        ```
+
+        It sends its arguments, environment, working directory and standard streams
+        (including the terminal, if any) and exits with the exit code of the command
+        line. When there's no server, or the source code of the app changed, it runs
+        `PROG` normally instead.
+
+        Each command line is run in a forked process, the same as when calling the app,
+        including how errors are shown. The server shuts down after `idle_timeout`
+        seconds without requests or when the source code of the app changes.
+
+        Return `False` if the socket couldn't be used, e.g. because another server is
+        already running in it.
+
+        **Example**
+
+        ```python
+        import typer
+
+        app = typer.Typer()
+
+
+        @app.command()
+        def hello(name: str):
+            print(f"Hello {name}")
+
+
+        if __name__ == "__main__":
+            app.serve("/run/user/1000/hello/hello.sock")
+        ```
+        """
+        from . import _server
+
+        if sys.excepthook != except_hook:
+            sys.excepthook = except_hook
+        command = self._get_command()
+
+        def handler(argv: list[str]) -> int:
+            return self._run_command_line(
+                command, argv[1:], prog_name=os.path.basename(argv[0])
+            )
+
+        return _server.serve(
+            socket_path,
+            handler,
+            idle_timeout=(
+                _server.DEFAULT_IDLE_TIMEOUT if idle_timeout is None else idle_timeout
+            ),
+            max_concurrency=max_concurrency or _server.DEFAULT_MAX_CONCURRENCY,
+        )
+
+    def _run_command_line(
+        self, command: _click.Command, args: list[str], *, prog_name: str | None
+    ) -> int:
+        status = 0
+        try:
+            # A new context is created for each command line, in standalone mode it
+            # always finishes with SystemExit
+            command.main(args=args, prog_name=prog_name)
+        except SystemExit as e:
+            status = get_exit_code(e)
+        except Exception as e:
+            setattr(
+                e,
+                _typer_developer_exception_attr_name,
+                DeveloperExceptionConfig(
+                    pretty_exceptions_enable=self.pretty_exceptions_enable,
+                    pretty_exceptions_show_locals=self.pretty_exceptions_show_locals,
+                    pretty_exceptions_short=self.pretty_exceptions_short,
+                ),
+            )
+            except_hook(type(e), e, e.__traceback__)
+            status = 1
+        finally:
+            sys.stdout.flush()
+            sys.stderr.flush()
+        return status
+
     def _info_val_str(self, name: str) -> str:
         val = getattr(self.info, name)
         val_str = val.value if isinstance(val, DefaultPlaceholder) else val
@@ -1161,13 +1779,45 @@ class Typer:
 
 
 def get_group(typer_instance: Typer) -> TyperGroup:
-    group = get_group_from_info(
+    return get_group_from_info(
         TyperInfo(typer_instance),
         pretty_exceptions_short=typer_instance.pretty_exceptions_short,
         rich_markup_mode=typer_instance.rich_markup_mode,
         suggest_commands=typer_instance.suggest_commands,
+        lazy_commands=typer_instance._lazy_commands,
     )
-    return group
+
+
+def _apply_app_settings(typer_instance: Typer, click_command: _click.Command) -> None:
+    # Settings of the app that only apply to its root command
+    if typer_instance._add_batch_option:
+        click_command.params.extend(get_batch_arguments(typer_instance))
+    if typer_instance._loop_factory is not None:
+        from . import _async
+
+        setattr(
+            click_command,
+            _async.loop_factory_attr_name,
+            typer_instance._loop_factory,
+        )
+    if typer_instance._output_buffering:
+        setattr(click_command, output_buffering_attr_name, True)
+    if typer_instance._help_cache:
+        from . import _help_cache
+
+        setattr(
+            click_command,
+            _help_cache.fingerprint_attr_name,
+            partial(_help_cache.get_fingerprint, typer_instance),
+        )
+    if typer_instance._help_max_commands is not None:
+        setattr(
+            click_command,
+            help_max_commands_attr_name,
+            typer_instance._help_max_commands,
+        )
+    if typer_instance._help_pager:
+        setattr(click_command, help_pager_attr_name, True)
 
 
 def get_command(typer_instance: Typer) -> _click.Command:
@@ -1184,6 +1834,7 @@ def get_command(typer_instance: Typer) -> _click.Command:
         if typer_instance._add_completion:
             click_command.params.append(click_install_param)
             click_command.params.append(click_show_param)
+        _apply_app_settings(typer_instance, click_command)
         return click_command
     elif len(typer_instance.registered_commands) == 1:
         # Create a single Command
@@ -1202,6 +1853,7 @@ def get_command(typer_instance: Typer) -> _click.Command:
         if typer_instance._add_completion:
             click_command.params.append(click_install_param)
             click_command.params.append(click_show_param)
+        _apply_app_settings(typer_instance, click_command)
         return click_command
     raise RuntimeError(
         "Could not get a command for this Typer instance"
@@ -1286,25 +1938,69 @@ def get_group_from_info(
     pretty_exceptions_short: bool,
     suggest_commands: bool,
     rich_markup_mode: MarkupMode,
+    lazy_commands: bool = False,
 ) -> TyperGroup:
     assert group_info.typer_instance, (
         "A Typer instance is needed to generate a Click Group"
     )
+    assert not isinstance(group_info.typer_instance, str), (
+        "Lazy Typer apps have to be loaded before generating a Click Group"
+    )
     commands: dict[str, _click.Command] = {}
     for command_info in group_info.typer_instance.registered_commands:
-        command = get_command_from_info(
-            command_info=command_info,
-            pretty_exceptions_short=pretty_exceptions_short,
-            rich_markup_mode=rich_markup_mode,
-        )
+        if lazy_commands or isinstance(command_info.callback, str):
+            command: _click.Command = get_lazy_command_from_info(
+                command_info=command_info,
+                pretty_exceptions_short=pretty_exceptions_short,
+                rich_markup_mode=rich_markup_mode,
+            )
+        else:
+            command = get_command_from_info(
+                command_info=command_info,
+                pretty_exceptions_short=pretty_exceptions_short,
+                rich_markup_mode=rich_markup_mode,
+            )
         if command.name:
             commands[command.name] = command
     for sub_group_info in group_info.typer_instance.registered_groups:
+        if isinstance(sub_group_info.typer_instance, str):
+            lazy_group = get_lazy_group_from_info(
+                sub_group_info,
+                pretty_exceptions_short=pretty_exceptions_short,
+                rich_markup_mode=rich_markup_mode,
+                suggest_commands=suggest_commands,
+            )
+            commands[lazy_group.name or ""] = lazy_group
+            continue
+        if lazy_commands:
+            solved_sub_group_info = solve_typer_info_defaults(sub_group_info)
+            if solved_sub_group_info.name:
+                commands[solved_sub_group_info.name] = TyperLazyCommand(
+                    name=solved_sub_group_info.name,
+                    loader=partial(
+                        get_group_from_info,
+                        sub_group_info,
+                        pretty_exceptions_short=pretty_exceptions_short,
+                        rich_markup_mode=rich_markup_mode,
+                        suggest_commands=suggest_commands,
+                        lazy_commands=True,
+                    ),
+                    is_group=True,
+                    help=solved_sub_group_info.help,
+                    short_help=solved_sub_group_info.short_help,
+                    hidden=solved_sub_group_info.hidden,
+                    deprecated=solved_sub_group_info.deprecated,
+                    rich_markup_mode=rich_markup_mode,
+                    rich_help_panel=solved_sub_group_info.rich_help_panel,
+                )
+                continue
         sub_group = get_group_from_info(
             sub_group_info,
             pretty_exceptions_short=pretty_exceptions_short,
             rich_markup_mode=rich_markup_mode,
             suggest_commands=suggest_commands,
+            # Commands of a sub-app without a name are listed in this group
+            lazy_commands=lazy_commands,
         )
         if sub_group.name:
             commands[sub_group.name] = sub_group
@@ -1332,7 +2028,8 @@ def get_group_from_info(
         invoke_without_command=solved_info.invoke_without_command,
         no_args_is_help=solved_info.no_args_is_help,
         subcommand_metavar=solved_info.subcommand_metavar,
-        result_callback=solved_info.result_callback,
+        chain=solved_info.chain,
+        result_callback=get_result_callback(solved_info.result_callback),
         context_settings=solved_info.context_settings,
         callback=get_callback(
             callback=solved_info.callback,
@@ -1357,10 +2054,66 @@ def get_group_from_info(
     return group
 
 
+def _get_explicit_value(value: Any) -> Any:
+    if isinstance(value, DefaultPlaceholder):
+        return value.value
+    return value
+
+
+def get_lazy_group_from_info(
+    group_info: TyperInfo,
+    *,
+    pretty_exceptions_short: bool,
+    suggest_commands: bool,
+    rich_markup_mode: MarkupMode,
+) -> TyperLazyCommand:
+    import_str = group_info.typer_instance
+    assert isinstance(import_str, str)
+
+    def loader() -> TyperGroup:
+        typer_instance = import_from_string(import_str)
+        assert isinstance(typer_instance, Typer), (
+            f"{import_str!r} should be a Typer instance"
+        )
+        loaded_info = copy(group_info)
+        loaded_info.typer_instance = typer_instance
+        return get_group_from_info(
+            loaded_info,
+            pretty_exceptions_short=pretty_exceptions_short,
+            suggest_commands=suggest_commands,
+            rich_markup_mode=rich_markup_mode,
+        )
+
+    # Only the values set in app.add_typer() are known before importing the app
+    help = _get_explicit_value(group_info.help)
+    return TyperLazyCommand(
+        name=_get_explicit_value(group_info.name),
+        loader=loader,
+        is_group=True,
+        help=inspect.cleandoc(help) if help else None,
+        short_help=_get_explicit_value(group_info.short_help),
+        hidden=_get_explicit_value(group_info.hidden),
+        deprecated=_get_explicit_value(group_info.deprecated),
+        rich_markup_mode=rich_markup_mode,
+        rich_help_panel=_get_explicit_value(group_info.rich_help_panel),
+    )
+
+
 def get_command_name(name: str) -> str:
     return name.lower().replace("_", "-")
 
 
+def get_command_info_name(command_info: CommandInfo) -> str:
+    if command_info.name:
+        return command_info.name
+    assert command_info.callback, "A command must have a callback function"
+    if isinstance(command_info.callback, str):
+        return get_command_name(
+            command_info.callback.rpartition(":")[2].rpartition(".")[2]
+        )
+    return get_command_name(command_info.callback.__name__)  # ty: ignore
+
+
 def get_default_option_flag_name(name: str, metavar: str | None) -> str:
     flag_name = name.replace("_", "-")
     if metavar is not None:
@@ -1389,6 +2142,38 @@ def get_params_convertors_ctx_param_name_from_function(
     return params, convertors, context_param_name
 
 
+def get_lazy_command_from_info(
+    command_info: CommandInfo,
+    *,
+    pretty_exceptions_short: bool,
+    rich_markup_mode: MarkupMode,
+) -> TyperLazyCommand:
+    def loader() -> _click.Command:
+        return get_command_from_info(
+            command_info,
+            pretty_exceptions_short=pretty_exceptions_short,
+            rich_markup_mode=rich_markup_mode,
+        )
+
+    if command_info.help is not None:
+        use_help = inspect.cleandoc(command_info.help)
+    elif isinstance(command_info.callback, str):
+        # Only the values set in app.command() are known before importing it
+        use_help = None
+    else:
+        use_help = inspect.getdoc(command_info.callback)
+    return TyperLazyCommand(
+        name=get_command_info_name(command_info),
+        loader=loader,
+        help=use_help,
+        short_help=command_info.short_help,
+        hidden=command_info.hidden,
+        deprecated=command_info.deprecated,
+        rich_markup_mode=rich_markup_mode,
+        rich_help_panel=command_info.rich_help_panel,
+    )
+
+
 def get_command_from_info(
     command_info: CommandInfo,
     *,
@@ -1396,6 +2181,11 @@ def get_command_from_info(
     rich_markup_mode: MarkupMode,
 ) -> _click.Command:
     assert command_info.callback, "A command must have a callback function"
+    if isinstance(command_info.callback, str):
+        import_str = command_info.callback
+        command_info = copy(command_info)
+        command_info.callback = import_from_string(import_str)
+        assert callable(command_info.callback), f"{import_str!r} should be a function"
     name = command_info.name or get_command_name(command_info.callback.__name__)  # ty: ignore
     use_help = command_info.help
     if use_help is None:
@@ -1407,6 +2197,10 @@ def get_command_from_info(
         convertors,
         context_param_name,
     ) = get_params_convertors_ctx_param_name_from_function(command_info.callback)
+    if command_info.parallel:
+        params.extend(
+            get_parallel_arguments(command_info.callback, command_info.parallel)
+        )
     cls = command_info.cls or TyperCommand
     command = cls(
         name=name,
@@ -1417,6 +2211,7 @@ def get_command_from_info(
             convertors=convertors,
             context_param_name=context_param_name,
             pretty_exceptions_short=pretty_exceptions_short,
+            parallel=command_info.parallel,
         ),
         params=params,  # type: ignore
         help=use_help,
@@ -1500,20 +2295,25 @@ def get_callback(
     convertors: dict[str, Callable[[str], Any]] | None = None,
     context_param_name: str | None = None,
     pretty_exceptions_short: bool,
+    parallel: str | None = None,
 ) -> Callable[..., Any] | None:
     use_convertors = convertors or {}
     if not callback:
         return None
     parameters = get_params_from_function(callback)
-    use_params: dict[str, Any] = {}
+    default_params: dict[str, Any] = {}
     for param_name in parameters:
-        use_params[param_name] = None
+        default_params[param_name] = None
     for param in params:
         if param.name:
-            use_params[param.name] = param.default
+            default_params[param.name] = param.default
+    is_async = inspect.iscoroutinefunction(callback)
 
     def wrapper(**kwargs: Any) -> Any:
         _rich_traceback_guard = pretty_exceptions_short  # noqa: F841
+        # The same command can be invoked many times, don't share values between
+        # invocations
+        use_params = dict(default_params)
         for k, v in kwargs.items():
             if k in use_convertors:
                 use_params[k] = use_convertors[k](v)
@@ -1521,12 +2321,31 @@ def get_callback(
                 use_params[k] = v
         if context_param_name:
             use_params[context_param_name] = get_current_context()
+        if is_async:
+            from . import _async
+
+            # All the async callbacks of an invocation run on the same event loop
+            return _async.run(get_current_context(silent=True), callback(**use_params))
+        if parallel:
+            from . import _parallel
+
+            return _parallel.run_command(callback, use_params, items_name=parallel)
         return callback(**use_params)
 
     update_wrapper(wrapper, callback)
     return wrapper
 
 
+def get_result_callback(
+    callback: Callable[..., Any] | None,
+) -> Callable[..., Any] | None:
+    if callback is None or not inspect.iscoroutinefunction(callback):
+        return callback
+    from . import _async
+
+    return _async.get_sync_callback(callback)
+
+
 def get_click_type(
     *, annotation: Any, parameter_info: ParameterInfo
 ) -> types.ParamType:
@@ -1751,7 +2570,11 @@ def get_click_param(
                 is_eager=parameter_info.is_eager,
                 envvar=parameter_info.envvar,
                 shell_complete=parameter_info.shell_complete,
-                autocompletion=get_param_completion(parameter_info.autocompletion),
+                autocompletion=get_param_completion(
+                    parameter_info.autocompletion,
+                    cache_ttl=parameter_info.autocompletion_cache_ttl,
+                    param_name=param.name,
+                ),
                 # Rich settings
                 rich_help_panel=parameter_info.rich_help_panel,
             ),
@@ -1785,7 +2608,11 @@ def get_click_param(
                 is_eager=parameter_info.is_eager,
                 envvar=parameter_info.envvar,
                 shell_complete=parameter_info.shell_complete,
-                autocompletion=get_param_completion(parameter_info.autocompletion),
+                autocompletion=get_param_completion(
+                    parameter_info.autocompletion,
+                    cache_ttl=parameter_info.autocompletion_cache_ttl,
+                    param_name=param.name,
+                ),
                 # Rich settings
                 rich_help_panel=parameter_info.rich_help_panel,
             ),
@@ -1827,6 +2654,7 @@ def get_param_callback(
             raise _click.ClickException(
                 "Too many CLI parameter callback function parameters"
             )
+    is_async = inspect.iscoroutinefunction(callback)
 
     def wrapper(ctx: _click.Context, param: _click.Parameter, value: Any) -> Any:
         use_params: dict[str, Any] = {}
@@ -1840,6 +2668,10 @@ def get_param_callback(
             else:
                 use_value = value
             use_params[value_name] = use_value
+        if is_async:
+            from . import _async
+
+            return _async.run(ctx, callback(**use_params))
         return callback(**use_params)
 
     update_wrapper(wrapper, callback)
@@ -1848,6 +2680,9 @@ def get_param_callback(
 
 def get_param_completion(
     callback: Callable[..., Any] | None = None,
+    *,
+    cache_ttl: float | None = None,
+    param_name: str | None = None,
 ) -> Callable[..., Any] | None:
     if not callback:
         return None
@@ -1884,6 +2719,15 @@ def get_param_completion(
         raise _click.ClickException(
             f"Invalid autocompletion callback parameters: {show_params}"
         )
+    is_async = inspect.iscoroutinefunction(callback)
+
+    def get_completions(ctx: _click.Context, use_params: dict[str, Any]) -> Any:
+        if is_async:
+            from . import _async
+
+            # The context was already closed, it can't close a shared event loop
+            return _async.run_once(ctx, callback(**use_params))
+        return callback(**use_params)
 
     def wrapper(ctx: _click.Context, args: list[str], incomplete: str | None) -> Any:
         use_params: dict[str, Any] = {}
@@ -1893,7 +2737,41 @@ def get_param_completion(
             use_params[args_name] = args
         if incomplete_name:
             use_params[incomplete_name] = incomplete
-        return callback(**use_params)
+        if cache_ttl is None:
+            return get_completions(ctx, use_params)
+        from . import _completion_cache
+
+        prog_name = ctx.find_root().info_name or ""
+        command_path = ctx.command_path
+        cache_param_name = param_name or callback.__name__
+        # The completions can depend on the other values already in the command line.
+        # Without the incomplete value, they are the same for any prefix, they are
+        # only filtered by it afterwards
+        inputs = {"params": ctx.params, "args": args if args_name else None}
+        cache_incomplete = (incomplete or "") if incomplete_name else None
+        completions = _completion_cache.get_cached_completions(
+            prog_name=prog_name,
+            command_path=command_path,
+            param_name=cache_param_name,
+            inputs=inputs,
+            incomplete=cache_incomplete,
+            ttl=cache_ttl,
+        )
+        if completions is None:
+            completions = [
+                (item[0], item[1]) if isinstance(item, tuple) else (item, None)
+                for item in get_completions(ctx, use_params)
+            ]
+            _completion_cache.save_completions(
+                prog_name=prog_name,
+                command_path=command_path,
+                param_name=cache_param_name,
+                inputs=inputs,
+                incomplete=cache_incomplete,
+                ttl=cache_ttl,
+                completions=completions,
+            )
+        return [value if help is None else (value, help) for value, help in completions]
 
     update_wrapper(wrapper, callback)
     return wrapper
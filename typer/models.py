@@ -7,8 +7,8 @@ from typing import (
     TYPE_CHECKING,
     Any,
     ClassVar,
-    Optional,
     TypeVar,
+    Union,
     cast,
 )
 
@@ -186,6 +186,9 @@ DefaultType = TypeVar("DefaultType")
 
 CommandFunctionType = TypeVar("CommandFunctionType", bound=Callable[..., Any])
 
+# A command function, or an import string like "pkg.module:function" to load it lazily
+CommandTargetType = TypeVar("CommandTargetType", bound=Callable[..., Any] | str)
+
 
 def Default(value: DefaultType) -> DefaultType:
     """
@@ -204,7 +207,7 @@ class CommandInfo:
         *,
         cls: type["TyperCommand"] | None = None,
         context_settings: dict[Any, Any] | None = None,
-        callback: Callable[..., Any] | None = None,
+        callback: Callable[..., Any] | str | None = None,
         help: str | None = None,
         epilog: str | None = None,
         short_help: str | None = None,
@@ -213,6 +216,7 @@ class CommandInfo:
         no_args_is_help: bool = False,
         hidden: bool = False,
         deprecated: bool = False,
+        parallel: str | None = None,
         # Rich settings
         rich_help_panel: str | None = None,
     ):
@@ -228,6 +232,7 @@ class CommandInfo:
         self.no_args_is_help = no_args_is_help
         self.hidden = hidden
         self.deprecated = deprecated
+        self.parallel = parallel
         # Rich settings
         self.rich_help_panel = rich_help_panel
 
@@ -235,7 +240,7 @@ class CommandInfo:
 class TyperInfo:
     def __init__(
         self,
-        typer_instance: Optional["Typer"] = Default(None),
+        typer_instance: Union["Typer", str, None] = Default(None),
         *,
         name: str | None = Default(None),
         cls: type["TyperGroup"] | None = Default(None),
@@ -296,6 +301,7 @@ class ParameterInfo:
         ]
         | None = None,
         autocompletion: Callable[..., Any] | None = None,
+        autocompletion_cache_ttl: float | None = None,
         default_factory: Callable[[], Any] | None = None,
         # Custom type
         parser: Callable[[str], Any] | None = None,
@@ -348,6 +354,7 @@ class ParameterInfo:
         self.envvar = envvar
         self.shell_complete = shell_complete
         self.autocompletion = autocompletion
+        self.autocompletion_cache_ttl = autocompletion_cache_ttl
         self.default_factory = default_factory
         # Custom type
         self.parser = parser
@@ -405,6 +412,7 @@ class OptionInfo(ParameterInfo):
         ]
         | None = None,
         autocompletion: Callable[..., Any] | None = None,
+        autocompletion_cache_ttl: float | None = None,
         default_factory: Callable[[], Any] | None = None,
         # Custom type
         parser: Callable[[str], Any] | None = None,
@@ -460,6 +468,7 @@ class OptionInfo(ParameterInfo):
             envvar=envvar,
             shell_complete=shell_complete,
             autocompletion=autocompletion,
+            autocompletion_cache_ttl=autocompletion_cache_ttl,
             default_factory=default_factory,
             # Custom type
             parser=parser,
@@ -533,6 +542,7 @@ class ArgumentInfo(ParameterInfo):
         ]
         | None = None,
         autocompletion: Callable[..., Any] | None = None,
+        autocompletion_cache_ttl: float | None = None,
         default_factory: Callable[[], Any] | None = None,
         # Custom type
         parser: Callable[[str], Any] | None = None,
@@ -579,6 +589,7 @@ class ArgumentInfo(ParameterInfo):
             envvar=envvar,
             shell_complete=shell_complete,
             autocompletion=autocompletion,
+            autocompletion_cache_ttl=autocompletion_cache_ttl,
             default_factory=default_factory,
             # Custom type
             parser=parser,
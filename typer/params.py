@@ -31,6 +31,7 @@ def Option(
     ]
     | None = None,
     autocompletion: Callable[..., Any] | None = None,
+    autocompletion_cache_ttl: float | None = None,
     default_factory: Callable[[], Any] | None = None,
     # Custom type
     parser: Callable[[str], Any] | None = None,
@@ -96,6 +97,7 @@ def Option(
     ]
     | None = None,
     autocompletion: Callable[..., Any] | None = None,
+    autocompletion_cache_ttl: float | None = None,
     default_factory: Callable[[], Any] | None = None,
     # Custom type
     click_type: types.ParamType | None = None,
@@ -298,6 +300,38 @@ def Option(
             """
         ),
     ] = None,
+    autocompletion_cache_ttl: Annotated[
+        float | None,
+        Doc(
+            """
+            Cache the values returned by the `autocompletion` function for this
+            number of seconds, in a small file in the app directory.
+
+            For slow completions, e.g. from a remote service. The values are cached for
+            each program and the other values in the command line. If the function
+            doesn't receive the incomplete value, the same values are used for any
+            prefix, otherwise they are only reused for the same incomplete value.
+
+            **Example**
+
+            ```python
+            def complete_job():
+                return list_remote_jobs()
+
+            @app.command()
+            def main(
+                job: Annotated[
+                    str,
+                    typer.Option(
+                        autocompletion=complete_job, autocompletion_cache_ttl=60
+                    ),
+                ],
+            ):
+                print(f"Stopping {job}")
+            ```
+            """
+        ),
+    ] = None,
     default_factory: Annotated[
         Callable[[], Any] | None,
         Doc(
@@ -956,6 +990,7 @@ def Option(
         envvar=envvar,
         shell_complete=shell_complete,
         autocompletion=autocompletion,
+        autocompletion_cache_ttl=autocompletion_cache_ttl,
         default_factory=default_factory,
         # Custom type
         parser=parser,
@@ -1021,6 +1056,7 @@ def Argument(
     ]
     | None = None,
     autocompletion: Callable[..., Any] | None = None,
+    autocompletion_cache_ttl: float | None = None,
     default_factory: Callable[[], Any] | None = None,
     # Custom type
     parser: Callable[[str], Any] | None = None,
@@ -1077,6 +1113,7 @@ def Argument(
     ]
     | None = None,
     autocompletion: Callable[..., Any] | None = None,
+    autocompletion_cache_ttl: float | None = None,
     default_factory: Callable[[], Any] | None = None,
     # Custom type
     click_type: types.ParamType | None = None,
@@ -1252,6 +1289,38 @@ def Argument(
             """
         ),
     ] = None,
+    autocompletion_cache_ttl: Annotated[
+        float | None,
+        Doc(
+            """
+            Cache the values returned by the `autocompletion` function for this
+            number of seconds, in a small file in the app directory.
+
+            For slow completions, e.g. from a remote service. The values are cached for
+            each program and the other values in the command line. If the function
+            doesn't receive the incomplete value, the same values are used for any
+            prefix, otherwise they are only reused for the same incomplete value.
+
+            **Example**
+
+            ```python
+            def complete_job():
+                return list_remote_jobs()
+
+            @app.command()
+            def main(
+                job: Annotated[
+                    str,
+                    typer.Argument(
+                        autocompletion=complete_job, autocompletion_cache_ttl=60
+                    ),
+                ],
+            ):
+                print(f"Stopping {job}")
+            ```
+            """
+        ),
+    ] = None,
     default_factory: Annotated[
         Callable[[], Any] | None,
         Doc(
@@ -1795,6 +1864,7 @@ def Argument(
         envvar=envvar,
         shell_complete=shell_complete,
         autocompletion=autocompletion,
+        autocompletion_cache_ttl=autocompletion_cache_ttl,
         default_factory=default_factory,
         # Custom type
         parser=parser,
@@ -4,9 +4,10 @@ import inspect
 import io
 from collections import defaultdict
 from collections.abc import Iterable
+from functools import lru_cache
 from gettext import gettext as _
 from os import getenv
-from typing import Any, Literal
+from typing import IO, Any, Literal
 
 from rich import box
 from rich.align import Align
@@ -18,15 +19,25 @@ from rich.markdown import Markdown
 from rich.markup import escape
 from rich.padding import Padding
 from rich.panel import Panel
+from rich.segment import Segment, Segments
 from rich.table import Table
 from rich.text import Text
 from rich.theme import Theme
 from rich.traceback import Traceback
 from typer.models import DeveloperExceptionConfig
 
-from . import _click
+from . import _click, _help_cache
 from ._click import types
-from .core import TyperArgument, TyperGroup, TyperOption
+from ._click._compat import _get_std_stream, get_environ
+from .core import (
+    TyperArgument,
+    TyperGroup,
+    TyperOption,
+    _get_help_prefix,
+    _limit_help_commands,
+    _page_help,
+    _use_help_pager,
+)
 
 # Default styles
 STYLE_OPTION = "bold cyan"
@@ -82,6 +93,8 @@ FORCE_TERMINAL = (
 )
 if _TYPER_FORCE_DISABLE_TERMINAL:
     FORCE_TERMINAL = False
+# Panels with more commands are rendered and printed this many rows at a time
+COMMANDS_PANEL_CHUNK_SIZE = 200
 
 # Fixed strings
 DEPRECATED_STRING = _("(deprecated) ")
@@ -142,25 +155,86 @@ def _has_ansi_character(text: str) -> bool:
     return ANSI_PREFIX in text
 
 
+@lru_cache(maxsize=1)
+def _make_theme(
+    option: str,
+    switch: str,
+    negative_option: str,
+    negative_switch: str,
+    types: str,
+    types_sep: str,
+    usage: str,
+) -> Theme:
+    return Theme(
+        {
+            "option": option,
+            "switch": switch,
+            "negative_option": negative_option,
+            "negative_switch": negative_switch,
+            "types": types,
+            "types_sep": types_sep,
+            "usage": usage,
+        },
+    )
+
+
+def _get_theme() -> Theme:
+    # Built again only if the styles were customized since the last call
+    return _make_theme(
+        STYLE_OPTION,
+        STYLE_SWITCH,
+        STYLE_NEGATIVE_OPTION,
+        STYLE_NEGATIVE_SWITCH,
+        STYLE_TYPES,
+        STYLE_TYPES_SEPARATOR,
+        STYLE_USAGE,
+    )
+
+
+# The environment variables Rich reads when creating a console
+_CONSOLE_ENV_VARS = (
+    "NO_COLOR",
+    "FORCE_COLOR",
+    "COLUMNS",
+    "LINES",
+    "TERM",
+    "COLORTERM",
+    "TTY_COMPATIBLE",
+    "TTY_INTERACTIVE",
+)
+
+# The last console created for each combination of settings and environment, with
+# the stream and the theme it was created for
+_consoles: dict[tuple[Any, ...], tuple[IO[str], Theme, Console]] = {}
+
+
 def _get_rich_console(stderr: bool = False) -> Console:
-    return Console(
-        theme=Theme(
-            {
-                "option": STYLE_OPTION,
-                "switch": STYLE_SWITCH,
-                "negative_option": STYLE_NEGATIVE_OPTION,
-                "negative_switch": STYLE_NEGATIVE_SWITCH,
-                "types": STYLE_TYPES,
-                "types_sep": STYLE_TYPES_SEPARATOR,
-                "usage": STYLE_USAGE,
-            },
-        ),
+    # Rich detects the features of the terminal when creating the console, so a new
+    # one is created when the stream changes, e.g. in each CliRunner invocation
+    stream = _get_std_stream("stderr" if stderr else "stdout")
+    theme = _get_theme()
+    environ = get_environ()
+    key = (
+        stderr,
+        COLOR_SYSTEM,
+        FORCE_TERMINAL,
+        MAX_WIDTH,
+        *(environ.get(name) for name in _CONSOLE_ENV_VARS),
+    )
+    cached = _consoles.get(key)
+    if cached is not None and cached[0] is stream and cached[1] is theme:
+        return cached[2]
+    console = Console(
+        theme=theme,
         highlighter=highlighter,
         color_system=COLOR_SYSTEM,
         force_terminal=FORCE_TERMINAL,
         width=MAX_WIDTH,
-        stderr=stderr,
+        file=stream,
+        _environ=environ,
     )
+    _consoles[key] = (stream, theme, console)
+    return console
 
 
 def _make_rich_text(
@@ -171,6 +245,19 @@ def _make_rich_text(
     If `markup_mode` is `"rich"`, the text is parsed for Rich markup strings.
     If `markup_mode` is `"markdown"`, parse as Markdown.
     """
+    rich_text = _parse_rich_text(text, style, markup_mode)
+    if isinstance(rich_text, Text):
+        # Text can be modified after this, e.g. stylized, unlike the parsed Markdown
+        return rich_text.copy()
+    return rich_text
+
+
+# The same help texts are parsed again in each help render, and for the docs of
+# each command, e.g. the help of common parameters
+@lru_cache(maxsize=4096)
+def _parse_rich_text(
+    text: str, style: str, markup_mode: MarkupModeStrict
+) -> Markdown | Text:
     # Remove indentations from input text
     text = inspect.cleandoc(text)
     if markup_mode == MARKUP_MODE_MARKDOWN:
@@ -483,6 +570,7 @@ def _print_commands_panel(
     markup_mode: MarkupModeStrict,
     console: Console,
     cmd_len: int,
+    more_text: str | None = None,
 ) -> None:
     t_styles: dict[str, Any] = {
         "show_lines": STYLE_COMMANDS_TABLE_SHOW_LINES,
@@ -494,62 +582,117 @@ def _print_commands_panel(
         "padding": STYLE_COMMANDS_TABLE_PADDING,
     }
     box_style = getattr(box, t_styles.pop("box"), None)
+    has_deprecated = any(command.deprecated for command in commands)
+    chunked = len(commands) > COMMANDS_PANEL_CHUNK_SIZE
 
-    commands_table = Table(
-        highlight=False,
-        show_header=False,
-        expand=True,
-        box=box_style,
-        **t_styles,
-    )
-    # Define formatting in first column, as commands don't match highlighter
-    # regex
-    commands_table.add_column(
-        style=STYLE_COMMANDS_TABLE_FIRST_COLUMN,
-        no_wrap=True,
-        width=cmd_len,
-    )
+    def make_table(batch: list[_click.Command], *, last: bool) -> Table:
+        commands_table = Table(
+            highlight=False,
+            show_header=False,
+            expand=True,
+            box=box_style,
+            **t_styles,
+        )
+        # Define formatting in first column, as commands don't match highlighter
+        # regex
+        commands_table.add_column(
+            style=STYLE_COMMANDS_TABLE_FIRST_COLUMN,
+            no_wrap=True,
+            width=cmd_len,
+        )
 
-    # A big ratio makes the description column be greedy and take all the space
-    # available instead of allowing the command column to grow and misalign with
-    # other panels.
-    commands_table.add_column("Description", justify="left", no_wrap=False, ratio=10)
-    rows: list[list[RenderableType | None]] = []
-    deprecated_rows: list[RenderableType | None] = []
-    for command in commands:
-        helptext = command.short_help or command.help or ""
-        command_name = command.name or ""
-        if command.deprecated:
-            command_name_text = Text(f"{command_name}", style=STYLE_DEPRECATED_COMMAND)
-            deprecated_rows.append(Text(DEPRECATED_STRING, style=STYLE_DEPRECATED))
-        else:
-            command_name_text = Text(command_name)
-            deprecated_rows.append(None)
-        rows.append(
-            [
-                command_name_text,
-                _make_command_help(
-                    help_text=helptext,
-                    markup_mode=markup_mode,
-                ),
+        # A big ratio makes the description column be greedy and take all the space
+        # available instead of allowing the command column to grow and misalign with
+        # other panels.
+        commands_table.add_column(
+            "Description", justify="left", no_wrap=False, ratio=10
+        )
+        if has_deprecated and chunked:
+            # The same width in all the chunks, even without deprecated commands
+            commands_table.add_column(width=Text(DEPRECATED_STRING).cell_len)
+        for command in batch:
+            commands_table.add_row(
+                *_make_command_row(command, markup_mode, has_deprecated)
+            )
+        if last and more_text:
+            more_row: list[RenderableType | None] = [
+                Text(""),
+                Text(more_text, style=STYLE_HELPTEXT),
             ]
+            if has_deprecated:
+                more_row.append(None)
+            commands_table.add_row(*more_row)
+        return commands_table
+
+    panel_settings: dict[str, Any] = {
+        "border_style": STYLE_COMMANDS_PANEL_BORDER,
+        "title": name,
+        "title_align": ALIGN_COMMANDS_PANEL,
+    }
+    if chunked:
+        tables = (
+            make_table(
+                commands[start : start + COMMANDS_PANEL_CHUNK_SIZE],
+                last=start + COMMANDS_PANEL_CHUNK_SIZE >= len(commands),
+            )
+            for start in range(0, len(commands), COMMANDS_PANEL_CHUNK_SIZE)
+        )
+        _print_panel_in_chunks(
+            tables=tables, console=console, panel_settings=panel_settings
         )
-    rows_with_deprecated = rows
-    if any(deprecated_rows):
-        rows_with_deprecated = []
-        for row, deprecated_text in zip(rows, deprecated_rows, strict=True):
-            rows_with_deprecated.append([*row, deprecated_text])
-    for row in rows_with_deprecated:
-        commands_table.add_row(*row)
+        return
+    commands_table = make_table(commands, last=True)
     if commands_table.row_count:
+        console.print(Panel(commands_table, **panel_settings))
+
+
+def _make_command_row(
+    command: _click.Command, markup_mode: MarkupModeStrict, has_deprecated: bool
+) -> list[RenderableType | None]:
+    helptext = command.short_help or command.help or ""
+    command_name = command.name or ""
+    deprecated_text = None
+    if command.deprecated:
+        command_name_text = Text(f"{command_name}", style=STYLE_DEPRECATED_COMMAND)
+        deprecated_text = Text(DEPRECATED_STRING, style=STYLE_DEPRECATED)
+    else:
+        command_name_text = Text(command_name)
+    row: list[RenderableType | None] = [
+        command_name_text,
+        _make_command_help(
+            help_text=helptext,
+            markup_mode=markup_mode,
+        ),
+    ]
+    if has_deprecated:
+        row.append(deprecated_text)
+    return row
+
+
+def _print_panel_in_chunks(
+    *, tables: Iterable[Table], console: Console, panel_settings: dict[str, Any]
+) -> None:
+    # Print a panel with many rows the same as a single Panel, but writing each
+    # table as soon as it's rendered, instead of measuring and rendering all the
+    # rows at once
+    top, middle, bottom = console.render_lines(Panel(Text(""), **panel_settings))
+    line_start, line_end = middle[0], middle[-1]
+    new_line = Segment.line()
+    options = console.options.update_width(console.options.max_width - 2)
+    console.print(Segments([*top, new_line]), end="")
+    for table in tables:
+        lines = console.render_lines(Padding(table, (0, 1)), options)
         console.print(
-            Panel(
-                commands_table,
-                border_style=STYLE_COMMANDS_PANEL_BORDER,
-                title=name,
-                title_align=ALIGN_COMMANDS_PANEL,
-            )
+            Segments(
+                [
+                    segment
+                    for line in lines
+                    for segment in (line_start, *line, line_end, new_line)
+                ]
+            ),
+            end="",
         )
+    console.print(Segments([*bottom, new_line]), end="")
 
 
 def rich_format_help(
@@ -567,7 +710,42 @@ def rich_format_help(
     Takes a command or group and builds the help text output.
     """
     console = _get_rich_console()
+    use_cache = not console.legacy_windows and _help_cache.is_enabled(ctx)
+    use_pager = not console.legacy_windows and _use_help_pager(ctx)
+    if not use_cache and not use_pager:
+        _print_help(console=console, obj=obj, ctx=ctx, markup_mode=markup_mode)
+        return
+
+    def render() -> str:
+        with console.capture() as capture:
+            _print_help(console=console, obj=obj, ctx=ctx, markup_mode=markup_mode)
+        return capture.get()
+
+    if use_cache:
+        properties = [
+            markup_mode,
+            console.width,
+            console.color_system,
+            console.is_terminal,
+            console.encoding,
+            _get_help_prefix(ctx),
+        ]
+        text = _help_cache.get_help(ctx, properties, render)
+    else:
+        text = render()
+    if use_pager and _page_help(text):
+        return
+    console.file.write(text)
+    console.file.flush()
+
 
+def _print_help(
+    *,
+    console: Console,
+    obj: _click.Command | TyperGroup,
+    ctx: _click.Context,
+    markup_mode: MarkupModeStrict,
+) -> None:
     # Print usage
     console.print(
         Padding(highlighter(obj.get_usage(ctx)), 1), style=STYLE_USAGE_COMMAND
@@ -645,35 +823,39 @@ def rich_format_help(
 
     if isinstance(obj, TyperGroup):
         panel_to_commands: defaultdict[str, list[_click.Command]] = defaultdict(list)
-        for command_name in obj.list_commands(ctx):
-            command = obj.get_command(ctx, command_name)
-            if command and not command.hidden:
-                panel_name = (
-                    getattr(command, _RICH_HELP_PANEL_NAME, None)
-                    or COMMANDS_PANEL_TITLE
-                )
-                panel_to_commands[panel_name].append(command)
+        for _command_name, command in obj._list_help_commands(ctx):
+            panel_name = (
+                getattr(command, _RICH_HELP_PANEL_NAME, None) or COMMANDS_PANEL_TITLE
+            )
+            panel_to_commands[panel_name].append(command)
+        panel_to_limited = {
+            panel_name: _limit_help_commands(ctx, commands)
+            for panel_name, commands in panel_to_commands.items()
+        }
 
         # Identify the longest command name in all panels
         max_cmd_len = max(
             [
                 len(command.name or "")
-                for commands in panel_to_commands.values()
+                for commands, _more_text in panel_to_limited.values()
                 for command in commands
             ],
             default=0,
         )
 
         # Print each command group panel
-        default_commands = panel_to_commands.get(COMMANDS_PANEL_TITLE, [])
+        default_commands, default_more_text = panel_to_limited.get(
+            COMMANDS_PANEL_TITLE, ([], None)
+        )
         _print_commands_panel(
             name=COMMANDS_PANEL_TITLE,
             commands=default_commands,
             markup_mode=markup_mode,
             console=console,
             cmd_len=max_cmd_len,
+            more_text=default_more_text,
         )
-        for panel_name, commands in panel_to_commands.items():
+        for panel_name, (commands, more_text) in panel_to_limited.items():
             if panel_name == COMMANDS_PANEL_TITLE:
                 # Already printed above
                 continue
@@ -683,6 +865,7 @@ def rich_format_help(
                 markup_mode=markup_mode,
                 console=console,
                 cmd_len=max_cmd_len,
+                more_text=more_text,
             )
 
     # Epilogue if we have it
@@ -745,6 +928,11 @@ def rich_to_html(input_text: str) -> str:
     This function does not provide a full HTML page, but can be used to insert
     HTML-formatted text spans into a markdown file.
     """
+    return _rich_to_html(input_text)
+
+
+@lru_cache(maxsize=4096)
+def _rich_to_html(input_text: str) -> str:
     console = Console(record=True, highlight=False, file=io.StringIO())
 
     console.print(input_text, overflow="ignore", crop=False)
@@ -1,11 +1,20 @@
 import contextlib
 import io
 import os
+import pickle
 import shlex
 import sys
-from collections.abc import Iterator, Mapping, Sequence
+import tempfile
+import threading
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 from types import TracebackType
-from typing import IO, TYPE_CHECKING, Any, BinaryIO, cast
+from typing import IO, TYPE_CHECKING, Any, BinaryIO, Literal, TextIO, cast
 
 from typer.main import Typer
 from typer.main import get_command as _get_command
@@ -42,21 +51,149 @@ class BytesIOCopy(io.BytesIO):
         return super().write(b)
 
 
+# Called with the name of the stream, "stdout" or "stderr", and the written bytes
+OutputCallback = Callable[[str, bytes], None]
+
+
+class _HeadTailBytesIO(io.BytesIO):
+    """Keep only the first and the last bytes written, up to ``max_bytes``."""
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__()
+        self.head_size = max_bytes // 2
+        self.tail_size = max_bytes - self.head_size
+        self.head = bytearray()
+        self.tail = bytearray()
+        self.total = 0
+
+    def write(self, b: "ReadableBuffer") -> int:
+        data = bytes(b)
+        size = len(data)
+        self.total += size
+        missing = self.head_size - len(self.head)
+        if missing > 0:
+            self.head += data[:missing]
+            data = data[missing:]
+        self.tail += data
+        if len(self.tail) > self.tail_size:
+            del self.tail[: len(self.tail) - self.tail_size]
+        return size
+
+    def getvalue(self) -> bytes:
+        truncated = self.total - len(self.head) - len(self.tail)
+        if not truncated:
+            return bytes(self.head + self.tail)
+        marker = f"\n[... {truncated} bytes truncated ...]\n".encode()
+        return bytes(self.head) + marker + bytes(self.tail)
+
+
+class _TempFileBytesIO(io.BytesIO):
+    """Store the written bytes in a temporary file instead of in memory."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.file = tempfile.TemporaryFile()
+
+    def write(self, b: "ReadableBuffer") -> int:
+        return self.file.write(b)
+
+    def getvalue(self) -> bytes:
+        self.file.seek(0)
+        try:
+            return self.file.read()
+        finally:
+            self.file.seek(0, io.SEEK_END)
+
+    def close(self) -> None:
+        self.file.close()
+        super().close()
+
+
+class _NotCapturedBytesIO(io.BytesIO):
+    """Discard the written bytes, used for the output when it's not mixed."""
+
+    def write(self, b: "ReadableBuffer") -> int:
+        return len(b)  # type: ignore[arg-type]
+
+    def getvalue(self) -> bytes:
+        raise ValueError(
+            "The mixed output was not captured, it's disabled with mix_output=False"
+        )
+
+
+class _CaptureBytesIO(io.BytesIO):
+    """
+    Write to a storage, to the mixed output and to a callback. The storage is
+    not closed with the stream, so it can still be read after the invocation.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        storage: io.BytesIO,
+        copy_to: io.BytesIO,
+        on_write: OutputCallback | None,
+    ) -> None:
+        super().__init__()
+        self.name = name
+        self.storage = storage
+        self.copy_to = copy_to
+        self.on_write = on_write
+
+    def write(self, b: "ReadableBuffer") -> int:
+        data = bytes(b)
+        self.storage.write(data)
+        self.copy_to.write(data)
+        if self.on_write is not None:
+            self.on_write(self.name, data)
+        return len(data)
+
+    def getvalue(self) -> bytes:
+        return self.storage.getvalue()
+
+
 class StreamMixer:
     """Mixes `<stdout>` and `<stderr>` streams.
 
     The result is available in the ``output`` attribute.
+
+    By default, everything written is kept in memory. With ``max_bytes``, only
+    the first and the last bytes of each stream are kept. With ``to_file``,
+    they are stored in temporary files. With ``mix=False``, the mixed output is
+    not stored at all. ``on_write`` is called with each write to `<stdout>` or
+    `<stderr>`.
     """
 
-    def __init__(self) -> None:
-        self.output: io.BytesIO = io.BytesIO()
-        self.stdout: io.BytesIO = BytesIOCopy(copy_to=self.output)
-        self.stderr: io.BytesIO = BytesIOCopy(copy_to=self.output)
+    def __init__(
+        self,
+        *,
+        max_bytes: int | None = None,
+        to_file: bool = False,
+        mix: bool = True,
+        on_write: OutputCallback | None = None,
+    ) -> None:
+
+        def make_storage() -> io.BytesIO:
+            if max_bytes is not None:
+                return _HeadTailBytesIO(max_bytes)
+            if to_file:
+                return _TempFileBytesIO()
+            return io.BytesIO()
+
+        self.output: io.BytesIO = make_storage() if mix else _NotCapturedBytesIO()
+        self.stdout: _CaptureBytesIO = _CaptureBytesIO(
+            "stdout", make_storage(), self.output, on_write
+        )
+        self.stderr: _CaptureBytesIO = _CaptureBytesIO(
+            "stderr", make_storage(), self.output, on_write
+        )
 
     def __del__(self) -> None:
         """Guarantee that file-like objects are closed in a predictable order"""
         self.stderr.close()
+        self.stderr.storage.close()
         self.stdout.close()
+        self.stdout.storage.close()
         self.output.close()
 
 
@@ -75,29 +212,123 @@ class _NamedTextIOWrapper(io.TextIOWrapper):
         return self._mode  # pragma: no cover
 
 
+class _ContextStdStream:
+    """
+    Set as `sys.stdout` or `sys.stderr` while there are invocations with
+    ``isolation_mode="context"``, to send what is written with ``print()`` to
+    the stream of the current invocation, or to the original stream outside
+    of one.
+    """
+
+    def __init__(self, name: str, original: IO[Any]) -> None:
+        self._name = name
+        self._original = original
+
+    def _get_stream(self) -> IO[Any]:
+        isolation = _compat._current_isolation.get()
+        if isolation is None:
+            return self._original
+        return cast(IO[Any], getattr(isolation, self._name))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._get_stream(), name)
+
+
+_context_std_streams_lock = threading.Lock()
+_context_std_streams_users = 0
+_original_std_streams: tuple[IO[Any], IO[Any]] | None = None
+
+
+@contextlib.contextmanager
+def _context_std_streams() -> Iterator[None]:
+    # Installed by the first concurrent invocation and removed by the last one
+    global _context_std_streams_users, _original_std_streams
+    with _context_std_streams_lock:
+        if _context_std_streams_users == 0:
+            _original_std_streams = (sys.stdout, sys.stderr)
+            sys.stdout = cast(TextIO, _ContextStdStream("stdout", sys.stdout))
+            sys.stderr = cast(TextIO, _ContextStdStream("stderr", sys.stderr))
+        _context_std_streams_users += 1
+    try:
+        yield
+    finally:
+        with _context_std_streams_lock:
+            _context_std_streams_users -= 1
+            if _context_std_streams_users == 0 and _original_std_streams:
+                sys.stdout, sys.stderr = _original_std_streams
+                _original_std_streams = None
+
+
+IsolationMode = Literal["global", "context"]
+
+# A case of `CliRunner.invoke_many()`: the args, or the keyword arguments for
+# `CliRunner.invoke()`
+InvokeCase = str | Sequence[str] | Mapping[str, Any]
+
+
 class Result:
-    """Holds the captured result of an invoked CLI script."""
+    """Holds the captured result of an invoked CLI script.
+
+    With a ``capture``, the bytes that are not given are read from its streams
+    only when they are used.
+    """
 
     def __init__(
         self,
         runner: "CliRunner",
-        stdout_bytes: bytes,
-        stderr_bytes: bytes,
-        output_bytes: bytes,
+        stdout_bytes: bytes | None,
+        stderr_bytes: bytes | None,
+        output_bytes: bytes | None,
         return_value: Any,
         exit_code: int,
         exception: BaseException | None,
         exc_info: tuple[type[BaseException], BaseException, TracebackType]
         | None = None,
+        capture: StreamMixer | None = None,
     ):
         self.runner = runner
-        self.stdout_bytes = stdout_bytes
-        self.stderr_bytes = stderr_bytes
-        self.output_bytes = output_bytes
+        self._stdout_bytes = stdout_bytes
+        self._stderr_bytes = stderr_bytes
+        self._output_bytes = output_bytes
         self.return_value = return_value
         self.exit_code = exit_code
         self.exception = exception
         self.exc_info = exc_info
+        self.capture = capture
+
+    def _get_bytes(self, value: bytes | None, name: str) -> bytes:
+        if value is not None:
+            return value
+        if self.capture is None:
+            raise ValueError(f"The {name} was not captured")
+        return cast(io.BytesIO, getattr(self.capture, name)).getvalue()
+
+    @property
+    def stdout_bytes(self) -> bytes:
+        """The standard output as bytes."""
+        return self._get_bytes(self._stdout_bytes, "stdout")
+
+    @stdout_bytes.setter
+    def stdout_bytes(self, value: bytes) -> None:
+        self._stdout_bytes = value
+
+    @property
+    def stderr_bytes(self) -> bytes:
+        """The standard error as bytes."""
+        return self._get_bytes(self._stderr_bytes, "stderr")
+
+    @stderr_bytes.setter
+    def stderr_bytes(self, value: bytes) -> None:
+        self._stderr_bytes = value
+
+    @property
+    def output_bytes(self) -> bytes:
+        """The terminal output as bytes, as the user would see it."""
+        return self._get_bytes(self._output_bytes, "output")
+
+    @output_bytes.setter
+    def output_bytes(self, value: bytes) -> None:
+        self._output_bytes = value
 
     @property
     def output(self) -> str:
@@ -127,18 +358,35 @@ class Result:
 
 class CliRunner:
     """The CLI runner provides functionality to invoke a command line
-    script for unittesting purposes in an isolated environment.  This only
-    works in single-threaded systems without any concurrency as it changes the
-    global interpreter state. Based on functionality from Click.
+    script for unittesting purposes in an isolated environment.  By default,
+    this only works in single-threaded systems without any concurrency as it
+    changes the global interpreter state. Based on functionality from Click.
+
+    With ``isolation_mode="context"``, the standard streams, the environment
+    overrides, the prompts and the help width of each invocation are set in a
+    context variable instead, so ``invoke`` can be called from several threads
+    at the same time. The isolated state is used by Typer's own output and input
+    (``echo()``, prompts, Rich, help and errors) and by the environment
+    variables Typer reads (``envvar`` parameters and shell completion). While
+    the invocations run, ``sys.stdout`` and ``sys.stderr`` send what is written
+    to them, e.g. with ``print()``, to the output of the current invocation.
+    ``os.environ`` is not changed, code that uses it directly, e.g. a
+    subprocess, sees the real environment. Threads started by the command see
+    the real streams.
     """
 
     def __init__(
         self,
         charset: str = "utf-8",
         env: Mapping[str, str | None] | None = None,
+        isolation_mode: IsolationMode = "global",
     ) -> None:
+        assert isolation_mode in ("global", "context"), (
+            f"Unknown isolation mode: {isolation_mode!r}"
+        )
         self.charset = charset
         self.env: Mapping[str, str | None] = env or {}
+        self.isolation_mode = isolation_mode
 
     def get_default_prog_name(self, cli: _click.Command) -> str:
         """Return the default program name for a command.
@@ -161,32 +409,29 @@ class CliRunner:
         input: str | bytes | None = None,
         env: Mapping[str, str | None] | None = None,
         color: bool = False,
+        stream_mixer: StreamMixer | None = None,
     ) -> Iterator[tuple[io.BytesIO, io.BytesIO, io.BytesIO]]:
         """A context manager that sets up the isolation for invoking of a
         command line tool.  This sets up `<stdin>` with the given input data
-        and `os.environ` with the overrides from the given dictionary.
+        and `os.environ` with the overrides from the given dictionary. The
+        output is captured in ``stream_mixer``, or in a new one.
         """
         bytes_input = make_input_stream(input, self.charset)
 
-        old_stdin = sys.stdin
-        old_stdout = sys.stdout
-        old_stderr = sys.stderr
-        old_forced_width = formatting.FORCED_WIDTH
-        formatting.FORCED_WIDTH = 80
-
         env = self.make_env(env)
 
-        stream_mixer = StreamMixer()
+        if stream_mixer is None:
+            stream_mixer = StreamMixer()
 
-        sys.stdin = text_input = _NamedTextIOWrapper(
+        text_input = _NamedTextIOWrapper(
             bytes_input, encoding=self.charset, name="<stdin>", mode="r"
         )
 
-        sys.stdout = _NamedTextIOWrapper(
+        text_output = _NamedTextIOWrapper(
             stream_mixer.stdout, encoding=self.charset, name="<stdout>", mode="w"
         )
 
-        sys.stderr = _NamedTextIOWrapper(
+        text_error = _NamedTextIOWrapper(
             stream_mixer.stderr,
             encoding=self.charset,
             name="<stderr>",
@@ -195,30 +440,30 @@ class CliRunner:
         )
 
         def visible_input(prompt: str | None = None) -> str:
-            sys.stdout.write(prompt or "")
+            text_output.write(prompt or "")
             try:
                 val = next(text_input).rstrip("\r\n")
             except StopIteration as e:  # pragma: no cover
                 raise EOFError() from e
-            sys.stdout.write(f"{val}\n")
-            sys.stdout.flush()
+            text_output.write(f"{val}\n")
+            text_output.flush()
             return val
 
         def hidden_input(prompt: str | None = None) -> str:
-            sys.stdout.write(f"{prompt or ''}\n")
-            sys.stdout.flush()
+            text_output.write(f"{prompt or ''}\n")
+            text_output.flush()
             try:
                 return next(text_input).rstrip("\r\n")
             except StopIteration as e:  # pragma: no cover
                 raise EOFError() from e
 
         def _getchar(echo: bool) -> str:
-            char = sys.stdin.read(1)
+            char = text_input.read(1)
 
             if echo:
-                sys.stdout.write(char)
+                text_output.write(char)
 
-            sys.stdout.flush()
+            text_output.flush()
             return char
 
         default_color = color
@@ -230,6 +475,40 @@ class CliRunner:
                 return not default_color
             return not color
 
+        if self.isolation_mode == "context":
+            isolation = _compat._Isolation(
+                stdin=text_input,
+                stdout=text_output,
+                stderr=text_error,
+                env=dict(env),
+                visible_prompt_func=visible_input,
+                hidden_prompt_func=hidden_input,
+                getchar=_getchar,
+                should_strip_ansi=should_strip_ansi,
+            )
+            with _context_std_streams():
+                token = _compat._current_isolation.set(isolation)
+                width_token = formatting.forced_width_var.set(80)
+                try:
+                    yield (
+                        stream_mixer.stdout,
+                        stream_mixer.stderr,
+                        stream_mixer.output,
+                    )
+                finally:
+                    formatting.forced_width_var.reset(width_token)
+                    _compat._current_isolation.reset(token)
+            return
+
+        old_stdin = sys.stdin
+        old_stdout = sys.stdout
+        old_stderr = sys.stderr
+        old_forced_width = formatting.FORCED_WIDTH
+        formatting.FORCED_WIDTH = 80
+        sys.stdin = text_input
+        sys.stdout = text_output
+        sys.stderr = text_error
+
         old_visible_prompt_func = termui.visible_prompt_func
         old_hidden_prompt_func = termui.hidden_prompt_func
         old__getchar_func = termui._getchar
@@ -280,12 +559,107 @@ class CliRunner:
         env: Mapping[str, str | None] | None = None,
         catch_exceptions: bool = True,
         color: bool = False,
+        max_output_bytes: int | None = None,
+        output_to_file: bool = False,
+        mix_output: bool = True,
+        on_output: OutputCallback | None = None,
         **extra: Any,
     ) -> Result:
+        """Invoke the app with the given ``args`` and return its result.
+
+        For commands with a big output, ``max_output_bytes`` keeps only the
+        first and the last bytes of each stream, ``output_to_file`` stores them
+        in temporary files instead of in memory, ``mix_output=False`` doesn't
+        store the mixed ``output``, and ``on_output`` is called with the name
+        of the stream, ``"stdout"`` or ``"stderr"``, and each chunk written.
+        """
         cli = _get_command(app)
+        return self._invoke_command(
+            cli,
+            args,
+            input=input,
+            env=env,
+            catch_exceptions=catch_exceptions,
+            color=color,
+            max_output_bytes=max_output_bytes,
+            output_to_file=output_to_file,
+            mix_output=mix_output,
+            on_output=on_output,
+            **extra,
+        )
+
+    def invoke_many(
+        self,
+        app: Typer,
+        cases: Iterable[InvokeCase],
+        *,
+        processes: int | None = None,
+    ) -> list[Result]:
+        """Invoke the app once for each one of the ``cases``, building its
+        command only once, and return the results in the same order.
+
+        Each case is the ``args`` for ``invoke``, or a mapping with the keyword
+        arguments for it, e.g. ``{"args": ["hello"], "input": "y\\n"}``.
+
+        With ``processes``, the cases are run in a pool of that many worker
+        processes, started with ``forkserver`` where available, each one with
+        its own warm command. That isolates commands that change the global
+        state, but the app and the results have to be picklable. In the
+        results, ``exc_info`` is ``None``, as tracebacks can't be pickled.
+        """
+        all_kwargs = [_get_case_kwargs(case) for case in cases]
+        if not processes:
+            cli = _get_command(app)
+            return [self._invoke_command(cli, **kwargs) for kwargs in all_kwargs]
+        assert processes > 0, "processes must be a positive number"
+        # Imported only when used, they are not needed by most tests
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        start_method = (
+            "forkserver"
+            if "forkserver" in multiprocessing.get_all_start_methods()
+            else "spawn"
+        )
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            mp_context=multiprocessing.get_context(start_method),
+            initializer=_init_worker,
+            initargs=(self, app),
+        ) as executor:
+            return list(executor.map(_invoke_in_worker, all_kwargs))
+
+    def _invoke_command(
+        self,
+        cli: _click.Command,
+        args: str | Sequence[str] | None = None,
+        input: bytes | str | None = None,
+        env: Mapping[str, str | None] | None = None,
+        catch_exceptions: bool = True,
+        color: bool = False,
+        max_output_bytes: int | None = None,
+        output_to_file: bool = False,
+        mix_output: bool = True,
+        on_output: OutputCallback | None = None,
+        **extra: Any,
+    ) -> Result:
+        assert max_output_bytes is None or not output_to_file, (
+            "Output can't be both limited in size and stored in a file"
+        )
+        assert max_output_bytes is None or max_output_bytes >= 0, (
+            "max_output_bytes can't be negative"
+        )
         exc_info = None
+        stream_mixer = StreamMixer(
+            max_bytes=max_output_bytes,
+            to_file=output_to_file,
+            mix=mix_output,
+            on_write=on_output,
+        )
 
-        with self.isolation(input=input, env=env, color=color) as outstreams:
+        with self.isolation(
+            input=input, env=env, color=color, stream_mixer=stream_mixer
+        ):
             return_value = None
             exception: BaseException | None = None
             exit_code = 0
@@ -311,8 +685,9 @@ class CliRunner:
                     exception = e
 
                 if not isinstance(e_code, int):
-                    sys.stdout.write(str(e_code))
-                    sys.stdout.write("\n")
+                    stdout = _compat._get_std_stream("stdout")
+                    stdout.write(str(e_code))
+                    stdout.write("\n")
                     e_code = 1
 
                 exit_code = e_code
@@ -324,19 +699,53 @@ class CliRunner:
                 exit_code = 1
                 exc_info = sys.exc_info()
             finally:
-                sys.stdout.flush()
-                sys.stderr.flush()
-                stdout = outstreams[0].getvalue()
-                stderr = outstreams[1].getvalue()
-                output = outstreams[2].getvalue()
+                _compat._get_std_stream("stdout").flush()
+                _compat._get_std_stream("stderr").flush()
 
         return Result(
             runner=self,
-            stdout_bytes=stdout,
-            stderr_bytes=stderr,
-            output_bytes=output,
+            stdout_bytes=None,
+            stderr_bytes=None,
+            output_bytes=None,
             return_value=return_value,
             exit_code=exit_code,
             exception=exception,
             exc_info=exc_info,  # type: ignore
+            capture=stream_mixer,
         )
+
+
+def _get_case_kwargs(case: InvokeCase) -> dict[str, Any]:
+    if isinstance(case, Mapping):
+        return dict(case)
+    return {"args": case}
+
+
+# The runner and the warm command of a worker process of `invoke_many()`
+_worker_state: tuple[CliRunner, _click.Command] | None = None
+
+
+def _init_worker(runner: CliRunner, app: Typer) -> None:
+    global _worker_state
+    _worker_state = (runner, _get_command(app))
+
+
+def _invoke_in_worker(kwargs: dict[str, Any]) -> Result:
+    assert _worker_state is not None
+    runner, cli = _worker_state
+    result = runner._invoke_command(cli, **kwargs)
+    result.exc_info = None
+    # The captured streams can't be pickled, send their values
+    assert result.capture is not None
+    result.stdout_bytes = result.stdout_bytes
+    result.stderr_bytes = result.stderr_bytes
+    if kwargs.get("mix_output", True):
+        result.output_bytes = result.output_bytes
+    result.capture = None
+    if result.exception is not None:
+        try:
+            pickle.dumps(result.exception)
+        except Exception:
+            # Send at least its description to the parent process
+            result.exception = RuntimeError(repr(result.exception))
+    return result
@@ -1,7 +1,10 @@
+import importlib
 import inspect
+import sys
 from collections.abc import Callable
 from copy import copy
 from typing import Any, cast
+from weakref import WeakKeyDictionary
 
 from ._typing import Annotated, get_args, get_origin, get_type_hints
 from .models import ArgumentInfo, OptionInfo, ParameterInfo, ParamMeta
@@ -104,7 +107,28 @@ def _split_annotation_from_typer_annotations(
     ]
 
 
+# Analyzing a signature evaluates all its annotations, and the same function is
+# analyzed to create its CLI parameters and again to create its callback wrapper
+_params_from_function_cache: WeakKeyDictionary[
+    Callable[..., Any], dict[str, ParamMeta]
+] = WeakKeyDictionary()
+
+
 def get_params_from_function(func: Callable[..., Any]) -> dict[str, ParamMeta]:
+    try:
+        params = _params_from_function_cache[func]
+    except (KeyError, TypeError):
+        params = _analyze_params_from_function(func)
+        try:
+            _params_from_function_cache[func] = params
+        except TypeError:
+            # Not weak referenceable, e.g. a builtin function
+            pass
+    # Callers can modify the dict they get, keep the cached one intact
+    return dict(params)
+
+
+def _analyze_params_from_function(func: Callable[..., Any]) -> dict[str, ParamMeta]:
     signature = inspect.signature(func, eval_str=True)
     type_hints = get_type_hints(func)
     params = {}
@@ -195,3 +219,24 @@ def parse_boolean_env_var(env_var_value: str | None, default: bool) -> bool:
     if value in ("n", "no", "f", "false", "off", "0"):
         return False
     return default
+
+
+def get_exit_code(e: SystemExit) -> int:
+    # The exit status of a process exiting with `e`, the same as Python
+    if e.code is None:
+        return 0
+    if isinstance(e.code, int):
+        return e.code
+    print(e.code, file=sys.stderr)
+    return 1
+
+
+def import_from_string(import_str: str) -> Any:
+    module_name, _, attrs = import_str.partition(":")
+    assert module_name and attrs, (
+        f"Import string {import_str!r} must be in the format 'module:attribute'"
+    )
+    obj: Any = importlib.import_module(module_name)
+    for attr in attrs.split("."):
+        obj = getattr(obj, attr)
+    return obj